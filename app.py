@@ -4,21 +4,36 @@ TEZ ÖZETLEYİCİ API
 PDF dosyalarından metin çıkarıp özetleyen FastAPI uygulaması
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-import uvicorn
-import PyPDF2
+import abc
 import io
 import os
+import sys
 from datetime import datetime
 import re
 from typing import Dict, Any
 import logging
-import requests
-from bs4 import BeautifulSoup
 import urllib.parse
 import time
+import importlib
+import importlib.util
+import functools
+import threading
+import json
+import csv
+import zipfile
+import uuid
+import hashlib
+import itertools
+import contextvars
+import contextlib
+import gzip
+import math
+import zlib
+from collections import OrderedDict, Counter, deque
+from array import array
 
 # Özetleme için kütüphaneler
 # try:
@@ -28,24 +43,352 @@ import time
 #     TRANSFORMERS_VAR_MI = False
 TRANSFORMERS_VAR_MI = False  # Transformer'ı devre dışı bırak
 
-try:
-    import yake
-    YAKE_VAR_MI = True
-except ImportError:
-    YAKE_VAR_MI = False
+# Ağır kütüphaneler (PyPDF2, yake, rake_nltk/nltk, requests, bs4) modül
+# yüklenirken değil, ilk kullanımda içe aktarılır. Burada sadece kurulu olup
+# olmadıkları kontrol edilir; bu kontrol modülü çalıştırmaz.
+YAKE_VAR_MI = importlib.util.find_spec("yake") is not None
+RAKE_VAR_MI = importlib.util.find_spec("rake_nltk") is not None
+NUMPY_VAR_MI = importlib.util.find_spec("numpy") is not None
+ORJSON_VAR_MI = importlib.util.find_spec("orjson") is not None
+BROTLI_VAR_MI = importlib.util.find_spec("brotli") is not None
 
-try:
-    from rake_nltk import Rake
-    RAKE_VAR_MI = True
-except ImportError:
-    RAKE_VAR_MI = False
+# Üretim sunucusu ayarları (python app.py --uretim)
+URETIM_AYARLARI = {
+    "host": os.environ.get("TEZ_HOST", "0.0.0.0"),
+    "port": int(os.environ.get("TEZ_PORT", "8000")),
+    # CPU ağırlıklı iş (PDF çıkarma, özetleme) - çekirdek başına bir işçi
+    "isci_sayisi": int(os.environ.get("TEZ_ISCI_SAYISI", str(os.cpu_count() or 1))),
+    # PyPDF2 bellek büyümesini sınırlamak için işçi bu kadar istekten sonra yenilenir
+    "maksimum_istek": int(os.environ.get("TEZ_MAKS_ISTEK", "500")),
+    "maksimum_istek_sapmasi": int(os.environ.get("TEZ_MAKS_ISTEK_SAPMASI", "50")),
+    # Kapanışta devam eden işlerin bitmesi için beklenecek süre (saniye)
+    "kapanis_suresi": int(os.environ.get("TEZ_KAPANIS_SURESI", "60")),
+    "isci_zaman_asimi": int(os.environ.get("TEZ_ISCI_ZAMAN_ASIMI", "180")),
+}
+
+# PDF işleme limitleri - büyük tezlerde bellek kullanımını sınırlar
+PDF_LIMITLERI = {
+    "maksimum_sayfa": int(os.environ.get("TEZ_MAKS_SAYFA", "400")),
+    "maksimum_karakter": int(os.environ.get("TEZ_MAKS_KARAKTER", "1500000")),
+    # Özet cümlesi başına yeterli sayılan kaynak metin; erken_durdur=true ile bu dolunca okuma durur
+    "cumle_basina_karakter": int(os.environ.get("TEZ_CUMLE_BASINA_KARAKTER", "40000")),
+}
+
+# PDF çıkarma arka uçları - sıra (virgülle) verilmezse kalibrasyon sonucu, o da yoksa varsayılan
+PDF_ARKA_UC_SIRASI = [a.strip() for a in os.environ.get("TEZ_PDF_ARKA_UCLARI", "").split(",") if a.strip()]
+PDF_KALIBRASYON_DOSYASI = os.environ.get(
+    "TEZ_PDF_KALIBRASYON_DOSYASI", os.path.join("sonuclar", "pdf_kalibrasyon.json")
+)
+
+# YÖK Tez Merkezi adresi - yük testinde sahte sunucuya (sahte_yok_sunucusu.py) yönlendirilir
+YOK_TEMEL_URL = os.environ.get("TEZ_YOK_TEMEL_URL", "https://tez.yok.gov.tr/UlusalTezMerkezi/")
+
+# YÖK sayfa önbelleği ve arka plan ön yüklemesi (N. sayfadan sonra N+1 ve ilk sonuçların detayları)
+ONYUKLEME_AYARLARI = {
+    "etkin": os.environ.get("TEZ_ONYUKLEME", "1") == "1",
+    "eszamanli": int(os.environ.get("TEZ_ONYUKLEME_ESZAMANLI", "2")),
+    "kuyruk": int(os.environ.get("TEZ_ONYUKLEME_KUYRUK", "16")),
+    "detay_sayisi": int(os.environ.get("TEZ_ONYUKLEME_DETAY", "3")),
+    "onbellek_boyutu": int(os.environ.get("TEZ_YOK_ONBELLEK_BOYUTU", "512")),
+    "gecerlilik_sn": float(os.environ.get("TEZ_YOK_ONBELLEK_SURESI", "600")),
+}
+
+# Yerel benzerlik dizini (özetlerin vektörleri) - boyut 0 ise rastgele izdüşüm yapılmaz
+BENZERLIK_AYARLARI = {
+    "etkin": os.environ.get("TEZ_BENZERLIK", "1") == "1",
+    "dizin": os.environ.get("TEZ_BENZERLIK_DIZINI", os.path.join("sonuclar", "benzerlik")),
+    "ozellik_bitleri": int(os.environ.get("TEZ_BENZERLIK_OZELLIK_BITLERI", "18")),
+    "boyut": int(os.environ.get("TEZ_BENZERLIK_BOYUT", "256")),
+}
+
+# Salt okunur paylaşılan kaynaklar - işçiler aynı bellek eşlemli dosyaları açar (sayfalar tek kopya)
+PAYLASIMLI_KAYNAKLAR = os.environ.get("TEZ_PAYLASIMLI", "1") == "1"
+PAYLASIMLI_DIZIN = os.environ.get(
+    "TEZ_PAYLASIMLI_DIZIN",
+    "/dev/shm/tez-ozetleyici" if os.path.isdir("/dev/shm") else os.path.join("sonuclar", "paylasimli")
+)
+
+# Yanıt sıkıştırma - bu boyutun (bayt) üzerindeki JSON yanıtlar br/gzip ile sıkıştırılır
+SIKISTIRMA_ESIGI = int(os.environ.get("TEZ_SIKISTIRMA_ESIGI", "1024"))
+# Bu boyutun (bayt) üzerindeki gövdeler olay döngüsünü bloklamamak için iş parçacığı havuzunda sıkıştırılır
+SIKISTIRMA_HAVUZ_ESIGI = int(os.environ.get("TEZ_SIKISTIRMA_HAVUZ_ESIGI", str(256 * 1024)))
+
+# Belge başına sıralanmış cümle listesi önbelleği (belge hash'i -> sıralama). Bellekteki
+# katman işçi başına toplam karakterle sınırlıdır; disk katmanı tüm işçilerce paylaşılır
+# (boş dizin verilirse kapanır ve /ozet-uzunluk/ sadece aynı işçiye düşen isteklerde çalışır)
+OZET_ONBELLEGI = {
+    "karakter": int(os.environ.get("TEZ_OZET_ONBELLEK_KARAKTER", str(16 * 1024 * 1024))),
+    "dizin": os.environ.get("TEZ_OZET_ONBELLEK_DIZINI", os.path.join("sonuclar", "ozet_onbellegi")),
+    "disk_mb": float(os.environ.get("TEZ_OZET_ONBELLEK_DISK_MB", "256")),
+}
+
+# Artımlı özetleme durumları (belge_id başına bir durum); işçi başına toplam karakterle sınırlı -
+# her durum ham ve temizlenmiş cümleleri ve kelime dizinini tuttuğundan ağırlık 2 × temiz uzunluk
+ARTIMLI_BELGE_KARAKTER = int(os.environ.get("TEZ_ARTIMLI_BELGE_KARAKTER", str(8 * 1024 * 1024)))
+
+# Sayfa kenarındaki tekrarlayan satırlar (üst/alt bilgi) - sayfaların bu oranında görülen
+# satırlar silinir; her sayfanın baştan ve sondan bu kadar satırına bakılır
+KALIP_AYARLARI = {
+    "oran": float(os.environ.get("TEZ_KALIP_ORANI", "0.5")),
+    "kenar_satir": int(os.environ.get("TEZ_KALIP_KENAR_SATIR", "3")),
+    "minimum_sayfa": 3,
+}
+
+# Özetleme ve anahtar kelime için varsayılan tez bölümleri (ön kısım, kaynakça, ekler atlanır)
+VARSAYILAN_BOLUMLER = [b.strip() for b in os.environ.get(
+    "TEZ_VARSAYILAN_BOLUMLER", "ozet,abstract,giris,govde,sonuc"
+).split(",") if b.strip()]
+
+# Analiz sonuçları deposu (toplu dışa aktarma için)
+SONUC_DOSYASI = os.environ.get("TEZ_SONUC_DOSYASI", os.path.join("sonuclar", "analizler.ndjson"))
+SONUC_KAYDET = os.environ.get("TEZ_SONUC_KAYDET", "1") == "1"
+
+# Anahtar kelime × yıl × üniversite × tür sayımları (YÖK'ten alınan tezlerle artımlı güncellenir)
+TOPLAM_DOSYASI = os.environ.get("TEZ_TOPLAM_DOSYASI", os.path.join("sonuclar", "kelime_toplamlari.ndjson"))
+
+# CPU ağırlıklı işlerin (PDF/metin özetleme) zamanlayıcısı - maliyet birimi bin karakter
+ZAMANLAYICI_AYARLARI = {
+    "eszamanli": int(os.environ.get("TEZ_ZAMANLAYICI_ESZAMANLI", "2")),
+    "istemci_siniri": float(os.environ.get("TEZ_ISTEMCI_MALIYET_SINIRI", "1000")),
+    "kuyruk_siniri": float(os.environ.get("TEZ_KUYRUK_MALIYET_SINIRI", "5000")),
+    "yaslanma_sn": float(os.environ.get("TEZ_ZAMANLAYICI_YASLANMA_SN", "30")),
+}
+
+# İçe aktarma süresi bütçesi (milisaniye) - `python app.py --ithalat-kontrol`
+ITHALAT_BUTCESI_MS = int(os.environ.get("TEZ_ITHALAT_BUTCESI_MS", "800"))
+
+@functools.lru_cache(maxsize=None)
+def _modul_yukle(modul_adi: str):
+    """Ağır bir modülü ilk kullanımda içe aktar ve önbellekte tut"""
+    baslangic = time.perf_counter()
+    modul = importlib.import_module(modul_adi)
+    logger.info(f"{modul_adi} yüklendi ({(time.perf_counter() - baslangic) * 1000:.0f} ms)")
+    return modul
+
+@functools.lru_cache(maxsize=None)
+def turkce_durma_kelimeleri() -> frozenset:
+    """YAKE'nin Türkçe durma kelimeleri - YAKE ve RAKE süreç başına tek, değişmez kümeyi paylaşır
+    
+    Üretim modunda fork'tan önce yüklenir; işçiler kümeyi kopyalamadan devralır.
+    """
+    if not YAKE_VAR_MI:
+        return frozenset()
+    yake_dizini = os.path.dirname(importlib.util.find_spec("yake").origin)
+    for alt_dizin in ("StopwordsList", os.path.join("core", "StopwordsList")):
+        yol = os.path.join(yake_dizini, alt_dizin, "stopwords_tr.txt")
+        if os.path.exists(yol):
+            with open(yol, encoding="utf-8") as dosya:
+                return frozenset(sys.intern(k.strip().lower()) for k in dosya if k.strip())
+    return frozenset()
+
+def _cumlelere_bol(metin: str) -> list:
+    """RAKE için cümle bölücü (NLTK punkt verisi gerektirmez)"""
+    return [c for c in re.split(r'(?<=[.!?;:])\s+', metin) if c.strip()]
+
+def _kelimelere_bol(cumle: str) -> list:
+    """RAKE için kelime bölücü (NLTK punkt verisi gerektirmez)"""
+    return re.findall(r"\w+|[^\w\s]", cumle)
+
+_tepe_bellek_durumu = {"suren": 0}
+_tepe_bellek_kilidi = threading.Lock()
+
+@contextlib.contextmanager
+def _tepe_bellek_olcumu():
+    """PDF işi süresince işçinin tepe RSS ölçümü
+    
+    Tepe sayacı (/proc/self/clear_refs) süreç geneli olduğundan sadece o an
+    süren başka PDF işi yoksa sıfırlanır; böylece eşzamanlı bir işin ölçümü
+    bozulmaz. Değer istek başına değil işçi başınadır: aynı işçide eşzamanlı
+    çalışan diğer işlerin belleği de sayılır.
+    """
+    with _tepe_bellek_kilidi:
+        _tepe_bellek_durumu["suren"] += 1
+        if _tepe_bellek_durumu["suren"] == 1:
+            try:
+                with open("/proc/self/clear_refs", "w") as dosya:
+                    dosya.write("5")
+            except OSError:
+                pass
+    try:
+        yield
+    finally:
+        with _tepe_bellek_kilidi:
+            _tepe_bellek_durumu["suren"] -= 1
+
+def _tepe_bellek_mb() -> float:
+    """İşçi sürecinin tepe RSS değeri (MB); eşzamanlı işler birlikte sayılır"""
+    try:
+        with open("/proc/self/status") as dosya:
+            for satir in dosya:
+                if satir.startswith("VmHWM:"):
+                    return round(int(satir.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    import resource
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS bayt, Linux KB döndürür
+    return round(tepe / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def _html_ayristir(html: str):
+    """HTML metnini BeautifulSoup ile ayrıştır (bs4 tembel yüklenir)"""
+    return _modul_yukle("bs4").BeautifulSoup(html, 'html.parser')
 
 # Logging ayarları
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# İstek bazlı yanıt tercihleri (alan seçimi, kabul edilen sıkıştırma)
+istek_alanlari = contextvars.ContextVar("istek_alanlari", default=None)
+istek_kodlamalari = contextvars.ContextVar("istek_kodlamalari", default="")
+
+def _alan_al(kaynak: Dict, hedef: Dict, parcalar: list):
+    """Noktalı yoldaki alanı kaynaktan hedefe kopyala"""
+    anahtar = parcalar[0]
+    if not isinstance(kaynak, dict) or anahtar not in kaynak:
+        return
+    if len(parcalar) == 1:
+        hedef[anahtar] = kaynak[anahtar]
+    elif isinstance(kaynak[anahtar], dict) and hedef.get(anahtar) is not kaynak[anahtar]:
+        _alan_al(kaynak[anahtar], hedef.setdefault(anahtar, {}), parcalar[1:])
+
+def _alan_cikar(sozluk: Dict, parcalar: list):
+    """Noktalı yoldaki alanı çıkarılmış bir kopya döndür (orijinal değişmez)"""
+    if not isinstance(sozluk, dict) or parcalar[0] not in sozluk:
+        return sozluk
+    kopya = dict(sozluk)
+    if len(parcalar) == 1:
+        del kopya[parcalar[0]]
+    else:
+        kopya[parcalar[0]] = _alan_cikar(kopya[parcalar[0]], parcalar[1:])
+    return kopya
+
+def _alanlari_sec(icerik, alanlar: str):
+    """`fields=` seçimini uygula: "ozet,istatistikler.kelime_sayisi" sadece bunları,
+    "-orijinal_metin" bunlar hariç hepsini döndürür"""
+    if not alanlar or not isinstance(icerik, dict):
+        return icerik
+    istenen = [a.strip() for a in alanlar.split(",") if a.strip()]
+    dahil = [a for a in istenen if not a.startswith("-")]
+    
+    if dahil:
+        secilen = {}
+        for yol in dahil:
+            _alan_al(icerik, secilen, yol.split("."))
+        icerik = secilen
+    for yol in istenen:
+        if yol.startswith("-"):
+            icerik = _alan_cikar(icerik, yol[1:].split("."))
+    return icerik
+
+def _kodlama_sec(kabul: str) -> str:
+    """Accept-Encoding başlığından q değerlerine göre br/gzip seçer; q=0 reddedilmiş sayılır"""
+    agirliklar: Dict[str, float] = {}
+    for parca in kabul.split(","):
+        ad, _, parametreler = parca.strip().partition(";")
+        ad = ad.strip()
+        if not ad:
+            continue
+        q = 1.0
+        for parametre in parametreler.split(";"):
+            anahtar, _, deger = parametre.strip().partition("=")
+            if anahtar.strip() == "q":
+                try:
+                    q = float(deger)
+                except ValueError:
+                    q = 0.0
+        agirliklar[ad] = q
+    adaylar = (["br"] if BROTLI_VAR_MI else []) + ["gzip"]
+    en_iyi, en_iyi_q = None, 0.0
+    for aday in adaylar:  # eşitlikte br önde
+        q = agirliklar.get(aday, agirliklar.get("*", 0.0))
+        if q > en_iyi_q:
+            en_iyi, en_iyi_q = aday, q
+    return en_iyi
+
+def _kodla(govde: bytes, kodlama: str) -> bytes:
+    if kodlama == "br":
+        return _modul_yukle("brotli").compress(govde, quality=4)
+    return gzip.compress(govde, compresslevel=5)
+
+class HizliJSONResponse(JSONResponse):
+    """orjson (varsa) ile kodlayan, `fields=` seçimini ve br/gzip sıkıştırmayı uygulayan yanıt
+    
+    SIKISTIRMA_HAVUZ_ESIGI'nin üzerindeki gövdeler render'da değil, gönderimden hemen
+    önce iş parçacığı havuzunda sıkıştırılır (bkz. __call__)."""
+    
+    def __init__(self, content: Any, *args, **kwargs):
+        self._kodlama = None
+        self._bekleyen_kodlama = None
+        super().__init__(content, *args, **kwargs)
+        if self._kodlama:
+            self._kodlama_basliklari()
+    
+    def render(self, content: Any) -> bytes:
+        content = _alanlari_sec(content, istek_alanlari.get())
+        govde = None
+        if ORJSON_VAR_MI:
+            orjson = _modul_yukle("orjson")
+            try:
+                govde = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                govde = None  # orjson'un desteklemediği tip - standart kodlayıcıya düş
+        if govde is None:
+            govde = json.dumps(
+                content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+            ).encode("utf-8")
+        return self._sikistir(govde)
+    
+    def _sikistir(self, govde: bytes) -> bytes:
+        if len(govde) < SIKISTIRMA_ESIGI:
+            return govde
+        kodlama = _kodlama_sec(istek_kodlamalari.get())
+        if kodlama is None:
+            return govde
+        if len(govde) >= SIKISTIRMA_HAVUZ_ESIGI:
+            self._bekleyen_kodlama = kodlama  # __call__ havuzda sıkıştıracak
+            return govde
+        self._kodlama = kodlama
+        return _kodla(govde, kodlama)
+    
+    def _kodlama_basliklari(self) -> None:
+        self.headers["content-encoding"] = self._kodlama
+        self.headers["vary"] = "Accept-Encoding"
+    
+    def _bekleyeni_uygula(self, govde: bytes) -> None:
+        self._kodlama, self._bekleyen_kodlama = self._bekleyen_kodlama, None
+        self.body = govde
+        self.headers["content-length"] = str(len(govde))
+        self._kodlama_basliklari()
+    
+    def sikistirmayi_tamamla(self) -> None:
+        """Ertelenmiş sıkıştırmayı eşzamanlı uygular (olay döngüsü dışındaki kullanımlar için)"""
+        if self._bekleyen_kodlama:
+            self._bekleyeni_uygula(_kodla(self.body, self._bekleyen_kodlama))
+    
+    async def __call__(self, scope, receive, send) -> None:
+        if self._bekleyen_kodlama:
+            from starlette.concurrency import run_in_threadpool
+            govde = await run_in_threadpool(_kodla, self.body, self._bekleyen_kodlama)
+            self._bekleyeni_uygula(govde)
+        await super().__call__(scope, receive, send)
+
+@contextlib.asynccontextmanager
+async def yasam_dongusu(uygulama: FastAPI):
+    """Açılış: TEZ_ISINMA=1 ise ısınmayı arka planda başlat. Kapanış: önyükleyiciyi kapat
+    
+    Devam eden isteklerin bitmesi sunucunun işidir (uvicorn timeout_graceful_shutdown,
+    gunicorn graceful_timeout - ikisi de URETIM_AYARLARI["kapanis_suresi"]); bu aşama
+    istekler boşaldıktan sonra çalışır.
+    """
+    if os.environ.get("TEZ_ISINMA", "0") == "1":
+        threading.Thread(target=isinma_yap, name="isinma", daemon=True).start()
+    yield
+    yok_arayici.onyukleyici.kapat()
+
 # FastAPI uygulaması
 uygulama = FastAPI(
+    lifespan=yasam_dongusu,
+    default_response_class=HizliJSONResponse,
     title="🎓 Türkçe Tez Özetleyici API",
     description="""
     📚 **Türkçe PDF Tez Özetleyici API**
@@ -79,6 +422,1014 @@ uygulama.add_middleware(
     allow_headers=["*"],
 )
 
+@uygulama.middleware("http")
+async def yanit_tercihleri(istek, sonraki):
+    """fields= seçimini ve Accept-Encoding değerini yanıt sınıfına aktar"""
+    istek_alanlari.set(istek.query_params.get("fields"))
+    istek_kodlamalari.set(istek.headers.get("accept-encoding", "").lower())
+    return await sonraki(istek)
+
+class BelgeTokenleri:
+    """Özet cümle puanlaması için dizi tabanlı token temsili
+    
+    Metin '.' ile cümlelere bölünür, her cümle küçük harfle kelimelere ayrılır.
+    Kelimeler belge sözlüğünde tamsayı kimliğe çevrilir; token'lar array('I'),
+    cümle sınırları token ofseti ve karakter aralığı olarak tutulur.
+    
+    Sadece cümle puanlaması ve aday cümle seçimi (ve tekrar özet üretimi) bu
+    temsili kullanır. Temizlenmiş metin üzerinde ve '.' ile bölünerek
+    kurulduğundan ("3.5" iki token) yanıtlardaki kelime sayıları ve
+    /compare-texts/ kelime kümeleri ham metnin boşlukla bölünmesinden, YAKE ise
+    kendi tokenleştiricisiyle çalışır.
+    """
+    
+    __slots__ = ("metin", "sozluk", "kelimeler", "kimlikler",
+                 "cumle_sinirlari", "cumle_araliklari", "_sikliklar")
+    
+    def __init__(self, metin: str):
+        self.metin = metin
+        self.sozluk = {}                         # kelime -> kimlik
+        self.kelimeler = []                      # kimlik -> kelime
+        self.kimlikler = array('I')              # token kimlikleri
+        self.cumle_sinirlari = array('I', [0])   # cümle i: kimlikler[s[i]:s[i+1]]
+        self.cumle_araliklari = array('I')       # cümle i: metin[a[2i]:a[2i+1]]
+        self._sikliklar = None
+        
+        sozluk = self.sozluk
+        kelimeler = self.kelimeler
+        kimlikler = self.kimlikler
+        konum = 0
+        
+        for cumle in metin.split('.'):
+            for kelime in cumle.lower().split():
+                kimlik = sozluk.get(kelime)
+                if kimlik is None:
+                    kimlik = len(kelimeler)
+                    kelime = sys.intern(kelime)
+                    sozluk[kelime] = kimlik
+                    kelimeler.append(kelime)
+                kimlikler.append(kimlik)
+            self.cumle_sinirlari.append(len(kimlikler))
+            self.cumle_araliklari.append(konum)
+            self.cumle_araliklari.append(konum + len(cumle))
+            konum += len(cumle) + 1
+    
+    @property
+    def kelime_sayisi(self) -> int:
+        return len(self.kimlikler)
+    
+    @property
+    def cumle_sayisi(self) -> int:
+        return len(self.cumle_sinirlari) - 1
+    
+    def cumle_metni(self, cumle_no: int) -> str:
+        """Cümlenin (kırpılmış) metni"""
+        return self.metin[self.cumle_araliklari[2 * cumle_no]:self.cumle_araliklari[2 * cumle_no + 1]].strip()
+    
+    def temiz_uzunluk(self) -> int:
+        """Kırpılmış cümle uzunlukları ve ayıran noktalar (ArtimliBelge ile aynı tanım)"""
+        metin = self.metin
+        araliklar = self.cumle_araliklari
+        toplam = 0
+        for i in range(0, len(araliklar), 2):
+            bas, son = araliklar[i], araliklar[i + 1]
+            # Temiz metinde cümle kenarında en fazla bir boşluk olabilir
+            if bas < son and metin[bas] == ' ':
+                bas += 1
+            if bas < son and metin[son - 1] == ' ':
+                son -= 1
+            toplam += son - bas + 1
+        return toplam
+    
+    def aday_cumleler(self, minimum_uzunluk: int = 20) -> list:
+        """Özete girebilecek (yeterince uzun) cümlelerin numaraları"""
+        return [i for i in range(self.cumle_sayisi) if len(self.cumle_metni(i)) > minimum_uzunluk]
+    
+    def sikliklar(self) -> list:
+        """Kimlik başına geçiş sayısı (bir kez hesaplanır)"""
+        if self._sikliklar is None:
+            if NUMPY_VAR_MI:
+                np = _modul_yukle("numpy")
+                kimlikler = np.frombuffer(self.kimlikler, dtype=np.uint32)
+                self._sikliklar = np.bincount(kimlikler, minlength=len(self.kelimeler)).tolist()
+            else:
+                sayimlar = [0] * len(self.kelimeler)
+                for kimlik in self.kimlikler:
+                    sayimlar[kimlik] += 1
+                self._sikliklar = sayimlar
+        return self._sikliklar
+    
+    def cumle_puanlari(self, cumle_nolari: list) -> list:
+        """Cümle başına ortalama kelime frekansı (4+ harfli alfabetik kelimeler)
+        
+        Puanlanacak kelimesi olmayan cümleler için None döner.
+        """
+        sikliklar = self.sikliklar()
+        agirliklar = [s if (k.isalpha() and len(k) > 3) else 0
+                      for k, s in zip(self.kelimeler, sikliklar)]
+        sinirlar = self.cumle_sinirlari
+        
+        if NUMPY_VAR_MI:
+            np = _modul_yukle("numpy")
+            agirlik_dizisi = np.asarray(agirliklar, dtype=np.float64)
+            token_agirliklari = agirlik_dizisi[np.frombuffer(self.kimlikler, dtype=np.uint32)]
+            toplamlar = np.concatenate(([0.0], np.cumsum(token_agirliklari)))
+            sayilar = np.concatenate(([0], np.cumsum(token_agirliklari > 0)))
+            nolar = np.asarray(cumle_nolari, dtype=np.int64)
+            baslangic = np.frombuffer(sinirlar, dtype=np.uint32)[nolar]
+            bitis = np.frombuffer(sinirlar, dtype=np.uint32)[nolar + 1]
+            puan_toplami = (toplamlar[bitis] - toplamlar[baslangic]).tolist()
+            kelime_sayilari = (sayilar[bitis] - sayilar[baslangic]).tolist()
+        else:
+            puan_toplami = []
+            kelime_sayilari = []
+            for cumle_no in cumle_nolari:
+                toplam = 0
+                sayi = 0
+                for kimlik in self.kimlikler[sinirlar[cumle_no]:sinirlar[cumle_no + 1]]:
+                    agirlik = agirliklar[kimlik]
+                    if agirlik:
+                        toplam += agirlik
+                        sayi += 1
+                puan_toplami.append(toplam)
+                kelime_sayilari.append(sayi)
+        
+        return [toplam / sayi if sayi > 0 else None
+                for toplam, sayi in zip(puan_toplami, kelime_sayilari)]
+
+_SAYFA_NUMARASI = re.compile(
+    r"^(?:sayfa|page|s\.)?\s*[-–—(\[]?\s*\d{1,4}(?:\s*/\s*\d{1,4})?\s*[-–—)\]]?$",
+    re.IGNORECASE
+)
+# Romen sayfa numarası: önek yoksa sadece küçük harfli ve geçerli biçimde (i..lxxxix);
+# "dil", "mild", "civil" gibi romen harflerinden oluşan kelimeler eşleşmez
+_ROMEN_SAYFA = re.compile(r"^[-–—(\[]?\s*(?=[ivxl])(l?x{0,3}(?:ix|iv|v?i{0,3}))\s*[-–—)\]]?$")
+_ROMEN_ONEKLI_SAYFA = re.compile(
+    r"^(?:sayfa|page|s\.)\s*[-–—(\[]?\s*(?=[ivxlc])c{0,3}(?:xc|xl|l?x{0,3})(?:ix|iv|v?i{0,3})\s*[-–—)\]]?$",
+    re.IGNORECASE
+)
+# Öneksiz 19xx/20xx bir sayfa numarası değil yıldır (kapaktaki "2021" silinmesin)
+_YIL = re.compile(r"^[-–—(\[]?\s*(?:19|20)\d{2}\s*[-–—)\]]?$")
+# Geçerli romen rakamı biçiminde olup ön kısımda sayfa numarası olamayacak kadar büyük,
+# tek başına kelime/ek olarak da geçenler (sabit küme; durma kelimesi listesine bağlı değil)
+_ROMEN_GIBI_KELIMELER = frozenset({"li", "lii", "lx", "lxi"})
+
+def _sayfa_numarasi_mi(satir: str) -> bool:
+    """Kenar satırı tek başına bir sayfa numarası mı (12, - 12 -, 3/40, sayfa 12, iv, Sayfa IV)"""
+    if _YIL.match(satir):
+        return False
+    if _SAYFA_NUMARASI.match(satir) or _ROMEN_ONEKLI_SAYFA.match(satir):
+        return True
+    romen = _ROMEN_SAYFA.match(satir)
+    return bool(romen) and romen.group(1) not in _ROMEN_GIBI_KELIMELER
+
+def _kalip_anahtari(satir: str) -> str:
+    """Satırı karşılaştırma anahtarına çevir (boşluklar sadeleşir, rakamlar #)"""
+    return re.sub(r"\d+", "#", " ".join(satir.split()).lower())
+
+def sayfa_kaliplarini_temizle(sayfalar: list, oran: float = None, kenar_satir: int = None):
+    """Sayfa kenarlarında tekrarlayan üst/alt bilgi ve sayfa numaralarını sil
+    
+    Her sayfanın ilk/son `kenar_satir` boş olmayan satırı anahtarlanıp sayılır
+    (tek geçiş); sayfaların `oran` kadarında görülen anahtarlar ve sayfa
+    numaraları kenarlardan silinir. Gövde satırlarına dokunulmaz.
+    """
+    oran = KALIP_AYARLARI["oran"] if oran is None else oran
+    kenar_satir = KALIP_AYARLARI["kenar_satir"] if kenar_satir is None else kenar_satir
+    rapor = {"silinen_satir": 0, "silinen_karakter": 0, "silinen_kelime": 0, "kaliplar": []}
+    
+    # Her sayfa için kenar satırlarının indeksleri ve anahtarları
+    kenarlar = []
+    sayimlar = {}
+    satir_listeleri = []
+    for sayfa in sayfalar:
+        satirlar = sayfa.split("\n")
+        dolu = [i for i, satir in enumerate(satirlar) if satir.strip()]
+        kenar_indeksleri = sorted(set(dolu[:kenar_satir] + dolu[-kenar_satir:])) if kenar_satir else []
+        anahtarlar = {i: _kalip_anahtari(satirlar[i]) for i in kenar_indeksleri}
+        for anahtar in set(anahtarlar.values()):
+            sayimlar[anahtar] = sayimlar.get(anahtar, 0) + 1
+        satir_listeleri.append(satirlar)
+        kenarlar.append(anahtarlar)
+    
+    esik = max(2, oran * len(sayfalar))
+    kaliplar = set()
+    if len(sayfalar) >= KALIP_AYARLARI["minimum_sayfa"]:
+        kaliplar = {anahtar for anahtar, sayi in sayimlar.items() if sayi >= esik}
+    
+    temiz_sayfalar = []
+    for satirlar, anahtarlar in zip(satir_listeleri, kenarlar):
+        silinecekler = {
+            i for i, anahtar in anahtarlar.items()
+            if anahtar in kaliplar or _sayfa_numarasi_mi(satirlar[i].strip())
+        }
+        for i in silinecekler:
+            rapor["silinen_satir"] += 1
+            rapor["silinen_karakter"] += len(satirlar[i])
+            rapor["silinen_kelime"] += len(satirlar[i].split())
+        temiz_sayfalar.append(
+            "\n".join(satir for i, satir in enumerate(satirlar) if i not in silinecekler)
+            if silinecekler else "\n".join(satirlar)
+        )
+    
+    rapor["kaliplar"] = sorted(kaliplar, key=lambda anahtar: -sayimlar[anahtar])[:10]
+    return temiz_sayfalar, rapor
+
+class PdfArkaUcu(abc.ABC):
+    """PDF metin çıkarma arka ucu arayüzü
+    
+    `ac` toplam sayfa sayısını ve sayfa metinlerini tembel üreten bir yineleyici
+    döndürür; çağıran limitlere ulaşınca yinelemeyi bırakabilir.
+    """
+    
+    ad = ""
+    modul_adi = ""
+    
+    def kurulu_mu(self) -> bool:
+        return importlib.util.find_spec(self.modul_adi) is not None
+    
+    @abc.abstractmethod
+    def ac(self, pdf_dosyasi):
+        """(toplam_sayfa, sayfa metinleri yineleyicisi) döndür"""
+
+class PyPDF2ArkaUcu(PdfArkaUcu):
+    ad = "PyPDF2"
+    modul_adi = "PyPDF2"
+    
+    def ac(self, pdf_dosyasi):
+        okuyucu = _modul_yukle(self.modul_adi).PdfReader(pdf_dosyasi)
+        return len(okuyucu.pages), (sayfa.extract_text() or "" for sayfa in okuyucu.pages)
+
+class PypdfArkaUcu(PyPDF2ArkaUcu):
+    ad = "pypdf"
+    modul_adi = "pypdf"
+
+class PdfminerArkaUcu(PdfArkaUcu):
+    ad = "pdfminer"
+    modul_adi = "pdfminer"
+    
+    def ac(self, pdf_dosyasi):
+        yuksek = _modul_yukle("pdfminer.high_level")
+        duzen = _modul_yukle("pdfminer.layout")
+        sayfa_modulu = _modul_yukle("pdfminer.pdfpage")
+        
+        toplam_sayfa = sum(1 for _ in sayfa_modulu.PDFPage.get_pages(pdf_dosyasi))
+        pdf_dosyasi.seek(0)
+        
+        def sayfalar():
+            for sayfa in yuksek.extract_pages(pdf_dosyasi):
+                yield "".join(
+                    eleman.get_text() for eleman in sayfa
+                    if isinstance(eleman, duzen.LTTextContainer)
+                )
+        
+        return toplam_sayfa, sayfalar()
+
+class Pypdfium2ArkaUcu(PdfArkaUcu):
+    ad = "pypdfium2"
+    modul_adi = "pypdfium2"
+    
+    def ac(self, pdf_dosyasi):
+        belge = _modul_yukle(self.modul_adi).PdfDocument(pdf_dosyasi)
+        
+        def sayfalar():
+            try:
+                for sayfa_numarasi in range(len(belge)):
+                    sayfa = belge[sayfa_numarasi]
+                    metin_sayfasi = sayfa.get_textpage()
+                    try:
+                        yield metin_sayfasi.get_text_range()
+                    finally:
+                        metin_sayfasi.close()
+                        sayfa.close()
+            finally:
+                belge.close()
+        
+        return len(belge), sayfalar()
+
+# Kayıtlı arka uçlar - varsayılan yedekleme sırası bu sıradır
+PDF_ARKA_UCLARI = {
+    arka_uc.ad: arka_uc for arka_uc in (
+        PyPDF2ArkaUcu(), PypdfArkaUcu(), Pypdfium2ArkaUcu(), PdfminerArkaUcu()
+    )
+}
+
+def _metin_kalitesi(metin: str) -> float:
+    """Kelime benzeri token oranı (0-1); bozuk kodlama ve birleşik kelimeler puanı düşürür"""
+    tokenler = metin.split()
+    if not tokenler:
+        return 0.0
+    gecerli = sum(
+        1 for token in tokenler
+        if 2 <= len(token) <= 30 and token.strip(".,;:!?()[]\"'-").isalpha()
+    )
+    return gecerli / len(tokenler)
+
+@functools.lru_cache(maxsize=1)
+def _kalibrasyon_sirasi() -> tuple:
+    """Kalibrasyon dosyasındaki arka uç sırası (yoksa boş)"""
+    try:
+        with open(PDF_KALIBRASYON_DOSYASI, encoding="utf-8") as dosya:
+            return tuple(json.load(dosya).get("sira", []))
+    except (OSError, ValueError):
+        return ()
+
+def pdf_arka_uc_sirasi() -> list:
+    """Denenecek kurulu arka uçlar, tercih sırasıyla"""
+    tercih = PDF_ARKA_UC_SIRASI or list(_kalibrasyon_sirasi())
+    sira = [ad for ad in tercih if ad in PDF_ARKA_UCLARI]
+    sira += [ad for ad in PDF_ARKA_UCLARI if ad not in sira]
+    return [ad for ad in sira if PDF_ARKA_UCLARI[ad].kurulu_mu()]
+
+def pdf_arka_uclarini_kalibre_et(dosya_yollari: list, kalite_esigi: float = 0.6) -> Dict:
+    """Örnek PDF'lerde her kurulu arka ucu ölç; kalite eşiğini geçen en hızlısını seç
+    
+    Kalite = kelime benzeri token oranı x (metin uzunluğu / en uzun çıktı). Sonuç
+    sırası kalibrasyon dosyasına yazılır ve sonraki çıkarımlarda ilk denenir.
+    """
+    olcumler = {ad: {"sure_ms": 0.0, "kalite": [], "hata": 0} for ad in pdf_arka_uc_sirasi()}
+    for ad in olcumler:
+        _modul_yukle(PDF_ARKA_UCLARI[ad].modul_adi)  # içe aktarma süresi ölçüme girmesin
+    
+    for yol in dosya_yollari:
+        uzunluklar = {}
+        for ad in olcumler:
+            try:
+                with open(yol, "rb") as dosya:
+                    baslangic = time.perf_counter()
+                    _, sayfalar = PDF_ARKA_UCLARI[ad].ac(dosya)
+                    metin = "\n".join(sayfalar)
+                    olcumler[ad]["sure_ms"] += (time.perf_counter() - baslangic) * 1000
+            except Exception as hata:
+                logger.warning(f"Kalibrasyon: {ad} '{yol}' okuyamadı: {hata}")
+                olcumler[ad]["hata"] += 1
+                metin = ""
+            uzunluklar[ad] = (len(metin), _metin_kalitesi(metin))
+        
+        en_uzun = max((uzunluk for uzunluk, _ in uzunluklar.values()), default=0) or 1
+        for ad, (uzunluk, oran) in uzunluklar.items():
+            olcumler[ad]["kalite"].append(oran * uzunluk / en_uzun)
+    
+    rapor = {}
+    for ad, olcum in olcumler.items():
+        kaliteler = olcum["kalite"]
+        rapor[ad] = {
+            "ortalama_sure_ms": round(olcum["sure_ms"] / max(len(dosya_yollari), 1), 1),
+            "ortalama_kalite": round(sum(kaliteler) / len(kaliteler), 3) if kaliteler else 0.0,
+            "hata_sayisi": olcum["hata"],
+        }
+    
+    uygunlar = sorted(
+        (ad for ad, r in rapor.items() if r["ortalama_kalite"] >= kalite_esigi and not r["hata_sayisi"]),
+        key=lambda ad: rapor[ad]["ortalama_sure_ms"]
+    )
+    digerleri = sorted(
+        (ad for ad in rapor if ad not in uygunlar),
+        key=lambda ad: -rapor[ad]["ortalama_kalite"]
+    )
+    sonuc = {
+        "secilen": uygunlar[0] if uygunlar else None,
+        "sira": uygunlar + digerleri,
+        "kalite_esigi": kalite_esigi,
+        "ornek_sayisi": len(dosya_yollari),
+        "olcumler": rapor,
+        "zaman": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    
+    os.makedirs(os.path.dirname(PDF_KALIBRASYON_DOSYASI) or ".", exist_ok=True)
+    with open(PDF_KALIBRASYON_DOSYASI, "w", encoding="utf-8") as dosya:
+        json.dump(sonuc, dosya, ensure_ascii=False, indent=2)
+    _kalibrasyon_sirasi.cache_clear()
+    return sonuc
+
+class TezBolumAyirici:
+    """Tez metnini başlıklara göre bölümlere ayıran hızlı yapı dedektörü
+    
+    Satırlar tek geçişte taranır; sadece kısa, büyük harfli satırlar başlık
+    adayı sayılır. İçindekiler satırları (nokta dizisi / sayfa numarasıyla
+    biten) başlık kabul edilmez.
+    """
+    
+    # Bölüm türü -> başlık metinleri (Türkçe karakterler ASCII'ye indirgenmiş)
+    BASLIKLAR = {
+        "ozet": ("OZET", "TURKCE OZET", "GENISLETILMIS OZET"),
+        "abstract": ("ABSTRACT", "SUMMARY", "EXTENDED ABSTRACT"),
+        "on_kisim": ("ONSOZ", "TESEKKUR", "ICINDEKILER", "TABLOLAR LISTESI", "TABLO LISTESI",
+                     "SEKILLER LISTESI", "SEKIL LISTESI", "KISALTMALAR", "KISALTMALAR LISTESI",
+                     "SIMGELER VE KISALTMALAR", "SIMGELER", "ETIK BEYAN", "BEYAN",
+                     "TABLE OF CONTENTS", "ACKNOWLEDGEMENTS"),
+        "giris": ("GIRIS", "INTRODUCTION"),
+        "sonuc": ("SONUC", "SONUCLAR", "SONUC VE ONERILER", "SONUCLAR VE ONERILER",
+                  "TARTISMA VE SONUC", "SONUC VE TARTISMA", "CONCLUSION", "CONCLUSIONS"),
+        "kaynakca": ("KAYNAKCA", "KAYNAKLAR", "REFERANSLAR", "REFERENCES", "BIBLIOGRAPHY"),
+        "ekler": ("EKLER", "EK", "APPENDIX", "APPENDICES"),
+        "ozgecmis": ("OZGECMIS", "CURRICULUM VITAE"),
+    }
+    GOVDE_SONRASI = {"kaynakca", "ekler", "ozgecmis"}
+    
+    _ASCII = str.maketrans("ÇĞİIÖŞÜçğıiöşü", "CGIIOSUcgiiosu")
+    # Romen rakamı ayrı bir belirteç olmalı: "IV. BULGULAR" evet, "ISTANBUL"/"VERI" hayır
+    _NUMARA = re.compile(r"^(?:(?:BOLUM\s*\d+|CHAPTER\s*\d+|\d+(?:\.\d+)*)[.:)\-]?\s*|[IVX]+(?:[.:)\-]\s*|\s+))")
+    _BOLUM = re.compile(r"^(?:BOLUM|CHAPTER)\s*\d+$")
+    _EK = re.compile(r"^EK[\s\-]*(?:\d+|[A-Z])\b")
+    _ICINDEKILER = re.compile(r"(?:\.{3,}|…)|\s\d+\s*$")
+    
+    def __init__(self):
+        self._baslik_turleri = {
+            baslik: tur for tur, basliklar in self.BASLIKLAR.items() for baslik in basliklar
+        }
+    
+    def baslik_turu(self, satir: str):
+        """Satır bir bölüm başlığıysa türünü, değilse None döndür"""
+        satir = satir.strip()
+        if not satir or len(satir) > 70 or satir != satir.upper():
+            return None
+        sade = " ".join(satir.translate(self._ASCII).upper().strip(" .:").split())
+        # Tek başına "BÖLÜM 3" sonundaki sayı sayfa numarası değil, bölüm numarasıdır
+        if self._BOLUM.match(sade):
+            return "govde"
+        if self._ICINDEKILER.search(satir):
+            return None
+        
+        numarasiz = self._NUMARA.sub("", sade)
+        tur = self._baslik_turleri.get(numarasiz) or self._baslik_turleri.get(sade)
+        if tur:
+            return tur
+        if self._EK.match(numarasiz):
+            return "ekler"
+        # Numaralı diğer büyük harfli başlıklar (2. YÖNTEM ...) gövde bölümüdür
+        if numarasiz != sade and numarasiz and len(numarasiz.split()) <= 8 and any(h.isalpha() for h in numarasiz):
+            return "govde"
+        return None
+    
+    def bolumle(self, metin: str) -> list:
+        """Metni [{"tur", "baslik", "baslangic", "bitis"}] bölümlerine ayır"""
+        bolumler = []
+        gecerli = {"tur": "on_kisim", "baslik": "", "baslangic": 0}
+        konum = 0
+        
+        for satir in metin.split("\n"):
+            tur = self.baslik_turu(satir) if len(satir) <= 80 else None
+            if tur:
+                # Art arda aynı tür (ör. alt başlık) yeni bölüm açmaz
+                if tur != gecerli["tur"]:
+                    gecerli["bitis"] = konum
+                    if gecerli["bitis"] > gecerli["baslangic"]:
+                        bolumler.append(gecerli)
+                    gecerli = {"tur": tur, "baslik": satir.strip(), "baslangic": konum}
+            konum += len(satir) + 1
+        
+        gecerli["bitis"] = len(metin)
+        if gecerli["bitis"] > gecerli["baslangic"]:
+            bolumler.append(gecerli)
+        return bolumler
+    
+    def sec(self, metin: str, turler: list) -> Dict:
+        """Seçilen türdeki bölümlerin metnini birleştir
+        
+        Hiç başlık bulunamazsa ya da seçim çok kısa kalırsa metnin tamamı döner.
+        """
+        bolumler = self.bolumle(metin)
+        turler = set(turler)
+        secilenler = [b for b in bolumler if b["tur"] in turler]
+        secilen_metin = "\n".join(metin[b["baslangic"]:b["bitis"]] for b in secilenler)
+        
+        yapi_bulundu = any(b["tur"] != "on_kisim" for b in bolumler)
+        if not yapi_bulundu or len(secilen_metin.strip()) < 100:
+            secilen_metin = metin
+            secilenler = bolumler
+        
+        return {
+            "metin": secilen_metin,
+            "bolumler": [
+                {"tur": b["tur"], "baslik": b["baslik"], "uzunluk": b["bitis"] - b["baslangic"]}
+                for b in bolumler
+            ],
+            "islenen_bolumler": sorted({b["tur"] for b in secilenler}),
+            "atlanan_karakter": len(metin) - sum(b["bitis"] - b["baslangic"] for b in secilenler),
+        }
+    
+    def durdurma_kontrolu(self, turler: list):
+        """PDF okurken kullanılacak erken durma kontrolü
+        
+        Gövde görüldükten sonra kaynakça/ekler başlığına gelinirse ve sonraki
+        bölümlerden hiçbiri seçilmemişse okumanın durması gerektiğini söyler.
+        Ön kısım başlığı taşıyan sayfalar (içindekiler, özet...) gövde sayılmaz;
+        gövde ve kaynakça başlıklarını birlikte içeren sayfa da içindekiler
+        listesi olabileceğinden okumayı durdurmaz.
+        """
+        if self.GOVDE_SONRASI & set(turler):
+            return None
+        durum = {"govde_goruldu": False}
+        
+        def kontrol(sayfa_metni: str) -> bool:
+            sayfa_turleri = {
+                self.baslik_turu(satir) for satir in sayfa_metni.split("\n") if len(satir) <= 80
+            }
+            govde_var = bool(sayfa_turleri & {"giris", "govde", "sonuc"})
+            if self.GOVDE_SONRASI & sayfa_turleri and durum["govde_goruldu"] and not govde_var:
+                return True
+            if govde_var and not sayfa_turleri & {"on_kisim", "ozet", "abstract"}:
+                durum["govde_goruldu"] = True
+            return False
+        
+        return kontrol
+
+class SiraliCumleler:
+    """Bir belgenin puanlanıp sıralanmış aday cümleleri
+    
+    Puanlama bir kez yapılır; istenen cümle sayısı ya da karakter bütçesi için
+    özet, sıranın başından seçilen k cümleyle üretilir.
+    """
+    
+    __slots__ = ("belge_hash", "cumleler", "sira", "kelime_sayisi", "temiz_uzunluk")
+    
+    def __init__(self, belge_hash: str, cumleler: list, sira: array, kelime_sayisi: int,
+                 temiz_uzunluk: int):
+        self.belge_hash = belge_hash
+        self.cumleler = cumleler          # aday cümleler, metindeki sırayla
+        self.sira = sira                  # puanlanan cümle indeksleri, puana göre azalan
+        self.kelime_sayisi = kelime_sayisi
+        self.temiz_uzunluk = temiz_uzunluk
+    
+    @property
+    def karakter_sayisi(self) -> int:
+        """Önbellek sınırı için yaklaşık boyut (cümle karakterleri + sıra dizisi)"""
+        return sum(map(len, self.cumleler)) + len(self.sira)
+    
+    def sozluk(self) -> Dict:
+        return {"cumleler": self.cumleler, "sira": self.sira.tolist(),
+                "kelime_sayisi": self.kelime_sayisi, "temiz_uzunluk": self.temiz_uzunluk}
+    
+    @classmethod
+    def sozlukten(cls, belge_hash: str, veri: Dict) -> "SiraliCumleler":
+        return cls(belge_hash, veri["cumleler"], array('I', veri["sira"]),
+                   veri["kelime_sayisi"], veri["temiz_uzunluk"])
+    
+    def ozet(self, cumle_sayisi: int = 5, karakter_butcesi: int = None) -> str:
+        """En iyi `cumle_sayisi` cümleyi (ve/veya bütçeye sığanları) metin sırasıyla birleştir"""
+        if karakter_butcesi:
+            return self._butceli_ozet(karakter_butcesi, cumle_sayisi)
+        cumle_sayisi = 5 if cumle_sayisi is None else max(1, cumle_sayisi)
+        
+        if len(self.cumleler) <= cumle_sayisi:
+            return '. '.join(self.cumleler) + '.'
+        
+        secilenler = sorted(self.sira[:cumle_sayisi])
+        return '. '.join(self.cumleler[i] for i in secilenler) + '.'
+    
+    def _butceli_ozet(self, karakter_butcesi: int, cumle_sayisi: int = None) -> str:
+        """Sıradaki cümleleri bütçe dolana kadar ekle; sığmayanı atla"""
+        secilenler = []
+        uzunluk = 1  # sondaki nokta
+        for i in self.sira:
+            if cumle_sayisi and len(secilenler) >= cumle_sayisi:
+                break
+            ek = len(self.cumleler[i]) + (2 if secilenler else 0)
+            if uzunluk + ek <= karakter_butcesi:
+                secilenler.append(i)
+                uzunluk += ek
+        
+        if not secilenler:
+            if not self.cumleler:
+                return ""
+            # Hiçbir cümle sığmıyorsa en iyi cümle kelime sınırında kısaltılır
+            en_iyi = self.cumleler[self.sira[0] if self.sira else 0]
+            if karakter_butcesi <= 3:
+                return en_iyi[:max(karakter_butcesi, 0)]  # "..." bile sığmaz
+            return en_iyi[:karakter_butcesi - 3].rsplit(' ', 1)[0] + '...'
+        
+        secilenler.sort()
+        return '. '.join(self.cumleler[i] for i in secilenler) + '.'
+
+class ArtimliBelge:
+    """Bir belge kimliğinin son sürümü için artımlı puanlama durumu
+    
+    Cümleler sabit kimliklerle tutulur. Yeni sürüm gelince sadece eklenen ve
+    silinen cümlelerin kelimeleri frekans tablosunu günceller; puan toplamları
+    yalnızca frekansı değişen kelimeleri içeren cümlelerde düzeltilir.
+    Temizleme '.' karakterine dokunmadığından ham metin '.' ile bölünüp sadece
+    değişen cümleler temizlenir. Sonuç, tam hesaplamayla aynı sıralamayı verir.
+    
+    Artımlı olan temizleme, tokenleştirme ve puanlamadır. Ham metnin '.' ile
+    bölünüp eski sürümle karşılaştırılması ve hash'lenmesi O(n), `siralama`
+    ise her çağrıda tüm cümleleri yeniden sıralar (O(n log n)); bunlar ucuz
+    adımlardır ama düzenleme boyutuyla değil belge boyutuyla ölçeklenir.
+    """
+    
+    def __init__(self, temizle):
+        self.temizle = temizle      # cümle temizleme fonksiyonu (metni_temizle)
+        self.cumleler = []          # cümle kimlikleri, metindeki sırayla
+        self.ham = {}               # kimlik -> ham cümle (karşılaştırma anahtarı)
+        self.metinler = {}          # kimlik -> temizlenmiş cümle
+        self.kelimeleri = {}        # kimlik -> {puanlanan kelime: adet}
+        self.token_sayisi = {}      # kimlik -> tüm token sayısı
+        self.toplam = {}            # kimlik -> cümledeki kelime frekansları toplamı
+        self.sayi = {}              # kimlik -> puanlanan kelime sayısı
+        self.siklik = {}            # kelime -> belgedeki frekans
+        self.dizin = {}             # kelime -> {kimlik: adet}
+        self.toplam_token = 0
+        self.temiz_uzunluk = 0
+        self.kilit = threading.Lock()
+        self._kimlik_sayaci = itertools.count()
+    
+    def guncelle(self, metin: str) -> Dict:
+        """Yeni sürümü eski sürümle cümle düzeyinde karşılaştırıp durumu güncelle"""
+        yeni = metin.split('.')
+        eski = self.cumleler
+        ham = self.ham
+        metinler = self.metinler
+        
+        # Ortak baş ve son - değişmeyen cümleler hiç işlenmez
+        bas = 0
+        while bas < len(eski) and bas < len(yeni) and ham[eski[bas]] == yeni[bas]:
+            bas += 1
+        son = 0
+        while (son < len(eski) - bas and son < len(yeni) - bas
+               and ham[eski[-1 - son]] == yeni[-1 - son]):
+            son += 1
+        
+        # Ortadaki bölgede yer değiştiren aynı cümleler yeniden kullanılır
+        kullanilabilir = {}
+        for kimlik in eski[bas:len(eski) - son]:
+            kullanilabilir.setdefault(ham[kimlik], []).append(kimlik)
+        
+        orta = []
+        eklenenler = []
+        for cumle in yeni[bas:len(yeni) - son]:
+            adaylar = kullanilabilir.get(cumle)
+            if adaylar:
+                orta.append(adaylar.pop())
+            else:
+                kimlik = next(self._kimlik_sayaci)
+                ham[kimlik] = cumle
+                metinler[kimlik] = self.temizle(cumle)
+                self.temiz_uzunluk += len(metinler[kimlik]) + 1
+                orta.append(kimlik)
+                eklenenler.append(kimlik)
+        silinenler = [kimlik for kimlikler in kullanilabilir.values() for kimlik in kimlikler]
+        
+        degisimler = {}
+        for kimlik in silinenler:
+            for kelime, adet in self.kelimeleri.pop(kimlik).items():
+                self.siklik[kelime] -= adet
+                degisimler[kelime] = degisimler.get(kelime, 0) - adet
+                del self.dizin[kelime][kimlik]
+            self.toplam_token -= self.token_sayisi.pop(kimlik)
+            self.temiz_uzunluk -= len(metinler[kimlik]) + 1
+            del ham[kimlik], metinler[kimlik], self.toplam[kimlik], self.sayi[kimlik]
+        
+        for kimlik in eklenenler:
+            kelimeler = {}
+            tokenler = metinler[kimlik].lower().split()
+            for kelime in tokenler:
+                if kelime.isalpha() and len(kelime) > 3:
+                    kelimeler[kelime] = kelimeler.get(kelime, 0) + 1
+            for kelime, adet in kelimeler.items():
+                self.siklik[kelime] = self.siklik.get(kelime, 0) + adet
+                degisimler[kelime] = degisimler.get(kelime, 0) + adet
+                self.dizin.setdefault(kelime, {})[kimlik] = adet
+            self.kelimeleri[kimlik] = kelimeler
+            self.token_sayisi[kimlik] = len(tokenler)
+            self.toplam_token += len(tokenler)
+            self.sayi[kimlik] = sum(kelimeler.values())
+        
+        # Frekansı değişen kelimeleri içeren eski cümlelerin toplamını düzelt
+        yeni_kimlikler = set(eklenenler)
+        guncellenen = set()
+        for kelime, fark in degisimler.items():
+            if not fark:
+                continue
+            for kimlik, adet in self.dizin.get(kelime, {}).items():
+                if kimlik not in yeni_kimlikler:
+                    self.toplam[kimlik] += adet * fark
+                    guncellenen.add(kimlik)
+            if not self.siklik[kelime]:
+                del self.siklik[kelime], self.dizin[kelime]
+        
+        for kimlik in eklenenler:
+            self.toplam[kimlik] = sum(
+                self.siklik[kelime] * adet for kelime, adet in self.kelimeleri[kimlik].items()
+            )
+        
+        self.cumleler = eski[:bas] + orta + (eski[len(eski) - son:] if son else [])
+        return {
+            "eklenen_cumle": len(eklenenler),
+            "silinen_cumle": len(silinenler),
+            "guncellenen_cumle": len(guncellenen),
+            "toplam_cumle": len(self.cumleler),
+        }
+    
+    def siralama(self, belge_hash: str = None) -> "SiraliCumleler":
+        """Güncel durumdan sıralanmış cümle listesi üret (tam hesaplamayla aynı)"""
+        metinler = self.metinler
+        adaylar = [k for k in self.cumleler if len(metinler[k]) > 20]
+        
+        cumle_puanlari = {}
+        for indeks, kimlik in enumerate(adaylar):
+            if self.sayi[kimlik] > 0:
+                cumle_puanlari[indeks] = self.toplam[kimlik] / self.sayi[kimlik]
+                
+                # İlk ve son cümlelere bonus
+                if indeks < 3 or indeks >= len(adaylar) - 3:
+                    cumle_puanlari[indeks] *= 1.5
+        
+        sira = sorted(cumle_puanlari, key=cumle_puanlari.get, reverse=True)
+        return SiraliCumleler(
+            belge_hash,
+            [metinler[k] for k in adaylar],
+            array('I', sira),
+            self.toplam_token,
+            self.temiz_uzunluk
+        )
+
+class LruOnbellek:
+    """İş parçacığı güvenli, boyutu sınırlı LRU önbellek
+    
+    `agirlik` verilirse kapasite kayıt sayısını değil, kayıt ağırlıklarının
+    toplamını sınırlar (ör. karakter sayısı).
+    """
+    
+    def __init__(self, kapasite: int, agirlik=None):
+        self.kapasite = kapasite
+        self.agirlik = agirlik
+        self.toplam_agirlik = 0
+        self._veriler = OrderedDict()
+        self._agirliklar = {}
+        self._kilit = threading.Lock()
+    
+    def al(self, anahtar):
+        with self._kilit:
+            deger = self._veriler.get(anahtar)
+            if deger is not None:
+                self._veriler.move_to_end(anahtar)
+            return deger
+    
+    def al_veya_olustur(self, anahtar, uretici) -> tuple:
+        """Kayıt yoksa kilit altında `uretici()` ile oluştur → (değer, yeni_mi)
+        
+        Aynı anahtar için eşzamanlı ilk istekler tek bir nesne paylaşır.
+        """
+        with self._kilit:
+            deger = self._veriler.get(anahtar)
+            if deger is not None:
+                self._veriler.move_to_end(anahtar)
+                return deger, False
+        deger = uretici()
+        agirlik = self.agirlik(deger) if self.agirlik else 1
+        with self._kilit:
+            mevcut = self._veriler.get(anahtar)
+            if mevcut is not None:
+                self._veriler.move_to_end(anahtar)
+                return mevcut, False
+            self._ekle(anahtar, deger, agirlik)
+        return deger, True
+    
+    def agirligi_yenile(self, anahtar):
+        """Yerinde değişen kaydın ağırlığını yeniden hesapla; sınırı aşan eskiler düşer"""
+        if not self.agirlik:
+            return
+        with self._kilit:
+            deger = self._veriler.get(anahtar)
+            if deger is None:
+                return
+            agirlik = self.agirlik(deger)
+            self.toplam_agirlik += agirlik - self._agirliklar[anahtar]
+            self._agirliklar[anahtar] = agirlik
+            self._veriler.move_to_end(anahtar)
+            while self.toplam_agirlik > self.kapasite and self._veriler:
+                self._cikar(next(iter(self._veriler)))
+    
+    def koy(self, anahtar, deger):
+        agirlik = self.agirlik(deger) if self.agirlik else 1
+        with self._kilit:
+            self._cikar(anahtar)
+            self._ekle(anahtar, deger, agirlik)
+    
+    def _ekle(self, anahtar, deger, agirlik):
+        if agirlik > self.kapasite:
+            return
+        self._veriler[anahtar] = deger
+        self._agirliklar[anahtar] = agirlik
+        self.toplam_agirlik += agirlik
+        while self.toplam_agirlik > self.kapasite:
+            self._cikar(next(iter(self._veriler)))
+    
+    def _cikar(self, anahtar):
+        if self._veriler.pop(anahtar, None) is not None:
+            self.toplam_agirlik -= self._agirliklar.pop(anahtar)
+    
+    def __len__(self):
+        return len(self._veriler)
+
+class OzetOnbellegi:
+    """Sıralanmış cümle listeleri için iki katmanlı önbellek
+    
+    Bellekteki katman işçi başına toplam karakterle sınırlıdır. Disk katmanı
+    (gzip'li JSON, belge hash'i adıyla) aynı makinedeki tüm işçilerce
+    paylaşılır; böylece /ozet-uzunluk/ isteği belgeyi analiz etmemiş bir
+    işçiye düşse de yanıtlanır. Disk katmanı `disk_mb`'ı aşınca en eski
+    (en son kullanılmamış) dosyalar silinir.
+    """
+    
+    BUDAMA_ARALIGI = 32  # bu kadar yazmada bir dizin boyutu kontrol edilir
+    HASH = re.compile(r"[0-9a-f]{64}")  # sha256 hex; dosya adına başka bir şey girmez
+    
+    def __init__(self, karakter: int, dizin: str = None, disk_mb: float = 256):
+        self.bellek = LruOnbellek(karakter, agirlik=lambda analiz: analiz.karakter_sayisi)
+        self.dizin = dizin
+        self.disk_bayt = int(disk_mb * 1024 * 1024)
+        self._yazma_sayaci = itertools.count(1)
+    
+    def _yol(self, belge_hash: str) -> str:
+        return os.path.join(self.dizin, belge_hash + ".json.gz")
+    
+    def al(self, belge_hash: str):
+        if not self.HASH.fullmatch(belge_hash or ""):
+            return None
+        analiz = self.bellek.al(belge_hash)
+        if analiz is not None or not self.dizin:
+            return analiz
+        yol = self._yol(belge_hash)
+        try:
+            with gzip.open(yol, "rt", encoding="utf-8") as dosya:
+                analiz = SiraliCumleler.sozlukten(belge_hash, json.load(dosya))
+            os.utime(yol)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Özet önbellek dosyası okunamadı ({belge_hash[:12]}): {e}")
+            return None
+        self.bellek.koy(belge_hash, analiz)
+        return analiz
+    
+    def koy(self, belge_hash: str, analiz: "SiraliCumleler"):
+        if not self.HASH.fullmatch(belge_hash or ""):
+            return
+        self.bellek.koy(belge_hash, analiz)
+        if not self.dizin or os.path.exists(self._yol(belge_hash)):
+            return
+        yol = self._yol(belge_hash)
+        gecici = f"{yol}.{os.getpid()}.{threading.get_ident()}.gecici"
+        try:
+            os.makedirs(self.dizin, exist_ok=True)
+            with gzip.open(gecici, "wt", encoding="utf-8", compresslevel=1) as dosya:
+                json.dump(analiz.sozluk(), dosya, ensure_ascii=False)
+            os.replace(gecici, yol)
+        except OSError as e:
+            logger.warning(f"Özet önbelleğe yazılamadı ({belge_hash[:12]}): {e}")
+            with contextlib.suppress(OSError):
+                os.remove(gecici)
+            return
+        if next(self._yazma_sayaci) % self.BUDAMA_ARALIGI == 0:
+            self._buda()
+    
+    def _buda(self):
+        """Disk katmanını en eski dosyalardan başlayarak sınırın altına indir"""
+        dosyalar = []
+        with contextlib.suppress(OSError), os.scandir(self.dizin) as girdiler:
+            for girdi in girdiler:
+                if girdi.name.endswith(".json.gz"):
+                    with contextlib.suppress(OSError):
+                        bilgi = girdi.stat()
+                        dosyalar.append((bilgi.st_mtime, bilgi.st_size, girdi.path))
+        toplam = sum(boyut for _, boyut, _ in dosyalar)
+        for _, boyut, yol in sorted(dosyalar):
+            if toplam <= self.disk_bayt:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(yol)
+                toplam -= boyut
+    
+    def __len__(self):
+        return len(self.bellek)
+
+class YokOnYukleyici:
+    """YÖK sayfa önbelleği ve sınırlı eşzamanlılıkla arka plan ön yüklemesi
+    
+    Sayfalar (url, parametreler) anahtarıyla ham HTML olarak saklanır. Kullanıcı
+    isteği sürmekte olan bir ön yüklemeye denk gelirse yeni istek atılmaz, onun
+    sonucu beklenir. YÖK 429 dönerse ön yükleme Retry-After süresince durur.
+    """
+    
+    def __init__(self, indirici, eszamanli: int = 2, kuyruk: int = 16, onbellek_boyutu: int = 512,
+                 gecerlilik_sn: float = 600.0, etkin: bool = True):
+        self.indirici = indirici  # (url, parametreler) -> html
+        self.eszamanli = eszamanli
+        self.kuyruk = kuyruk
+        self.gecerlilik_sn = gecerlilik_sn
+        self.etkin = etkin and eszamanli > 0
+        self.onbellek = LruOnbellek(onbellek_boyutu)
+        self._suren = {}  # anahtar -> Future
+        self._havuz = None  # fork sonrası ilk kullanımda oluşturulur
+        self._bekleme_bitisi = 0.0
+        self._kilit = threading.Lock()
+        self.sayaclar = {
+            "istek": 0, "onbellek_isabeti": 0, "onyukleme_isabeti": 0, "bekleyerek_isabet": 0,
+            "iskalama": 0, "onyuklenen": 0, "onyukleme_hatasi": 0, "atlanan": 0, "hiz_siniri": 0
+        }
+    
+    @staticmethod
+    def anahtar(url: str, parametreler: dict = None) -> tuple:
+        return (url, tuple(sorted((k, str(v)) for k, v in (parametreler or {}).items())))
+    
+    def _say(self, ad: str):
+        with self._kilit:
+            self.sayaclar[ad] += 1
+    
+    def _taze(self, anahtar) -> dict:
+        kayit = self.onbellek.al(anahtar)
+        if kayit is not None and time.monotonic() - kayit["zaman"] <= self.gecerlilik_sn:
+            return kayit
+        return None
+    
+    def al(self, url: str, parametreler: dict = None) -> str:
+        """Sayfayı önbellekten, sürmekte olan ön yüklemeden ya da YÖK'ten al"""
+        anahtar = self.anahtar(url, parametreler)
+        self._say("istek")
+        kayit = self._taze(anahtar)
+        if kayit is None:
+            with self._kilit:
+                gelecek = self._suren.get(anahtar)
+            if gelecek is not None and gelecek.result() is not None:
+                self._say("bekleyerek_isabet")
+                kayit = self._taze(anahtar)
+        if kayit is not None:
+            with self._kilit:
+                self.sayaclar["onbellek_isabeti"] += 1
+                if kayit["onyukleme"] and not kayit["kullanildi"]:
+                    kayit["kullanildi"] = True
+                    self.sayaclar["onyukleme_isabeti"] += 1
+            return kayit["metin"]
+        
+        self._say("iskalama")
+        metin = self.indirici(url, parametreler)
+        self.onbellek.koy(anahtar, {"metin": metin, "zaman": time.monotonic(),
+                                    "onyukleme": False, "kullanildi": True})
+        return metin
+    
+    def planla(self, url: str, parametreler: dict = None):
+        """Sayfayı arka planda getir (önbellekte/yolda ise, kuyruk doluysa ya da 429 sonrası atla)"""
+        if not self.etkin:
+            return
+        anahtar = self.anahtar(url, parametreler)
+        if self._taze(anahtar) is not None:
+            return
+        with self._kilit:
+            if anahtar in self._suren:
+                return
+            if len(self._suren) >= self.kuyruk or time.monotonic() < self._bekleme_bitisi:
+                self.sayaclar["atlanan"] += 1
+                return
+            if self._havuz is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._havuz = ThreadPoolExecutor(max_workers=self.eszamanli, thread_name_prefix="yok-onyukleme")
+            self._suren[anahtar] = self._havuz.submit(self._getir, anahtar, url, parametreler)
+    
+    def _getir(self, anahtar, url: str, parametreler: dict):
+        try:
+            metin = self.indirici(url, parametreler)
+            self.onbellek.koy(anahtar, {"metin": metin, "zaman": time.monotonic(),
+                                        "onyukleme": True, "kullanildi": False})
+            self._say("onyuklenen")
+            return metin
+        except Exception as e:
+            yanit = getattr(e, "response", None)
+            if getattr(yanit, "status_code", None) == 429:
+                try:
+                    bekleme = float(yanit.headers.get("Retry-After", 5))
+                except ValueError:
+                    bekleme = 5.0
+                with self._kilit:
+                    self._bekleme_bitisi = time.monotonic() + bekleme
+                self._say("hiz_siniri")
+            self._say("onyukleme_hatasi")
+            logger.debug(f"Ön yükleme başarısız ({url}): {e}")
+            return None
+        finally:
+            with self._kilit:
+                self._suren.pop(anahtar, None)
+    
+    def istatistik(self) -> Dict:
+        with self._kilit:
+            sayaclar = dict(self.sayaclar)
+            suren = len(self._suren)
+        return {
+            **sayaclar,
+            "suren_onyukleme": suren,
+            "onbellekteki_sayfa": len(self.onbellek),
+            # Kullanıcı isteklerinin ne kadarı ön yüklenmiş sayfadan karşılandı
+            "onyukleme_isabet_orani": round(sayaclar["onyukleme_isabeti"] / sayaclar["istek"], 3) if sayaclar["istek"] else 0.0,
+            # Ön yüklenen sayfaların ne kadarı gerçekten kullanıldı
+            "onyukleme_verimi": round(sayaclar["onyukleme_isabeti"] / sayaclar["onyuklenen"], 3) if sayaclar["onyuklenen"] else 0.0,
+            "ayarlar": {"etkin": self.etkin, "eszamanli": self.eszamanli, "kuyruk": self.kuyruk,
+                        "gecerlilik_sn": self.gecerlilik_sn}
+        }
+    
+    def kapat(self):
+        if self._havuz is not None:
+            self._havuz.shutdown(wait=False, cancel_futures=True)
+
 class MetinOzetleyici:
     """Türkçe metin özetleme sınıfı"""
     
@@ -93,33 +1444,304 @@ class MetinOzetleyici:
         #         logger.info("BART özetleme modeli yüklendi")
         #     except Exception as e:
         #         logger.warning(f"BART modeli yüklenemedi: {e}")
+        self._yake_cikartici = None
+        self._kilit = threading.Lock()
         logger.info("Basit özetleme modu aktif")
     
+    def yake_cikartici_al(self):
+        """YAKE çıkarıcısını ilk kullanımda oluştur ve tekrar kullan"""
+        if self._yake_cikartici is None:
+            with self._kilit:
+                if self._yake_cikartici is None:
+                    yake = _modul_yukle("yake")
+                    self._yake_cikartici = yake.KeywordExtractor(
+                        lan="tr",  # Türkçe
+                        n=3,       # 3-gram'a kadar
+                        dedupLim=0.7,
+                        top=20,
+                        stopwords=turkce_durma_kelimeleri() or None
+                    )
+        return self._yake_cikartici
+    
+    def isit(self) -> Dict:
+        """Ağır bağımlılıkları önceden yükle (ısınma)"""
+        sureler = {}
+        for arka_uc_adi in pdf_arka_uc_sirasi()[:1]:
+            baslangic = time.perf_counter()
+            _modul_yukle(PDF_ARKA_UCLARI[arka_uc_adi].modul_adi)
+            sureler[arka_uc_adi] = round((time.perf_counter() - baslangic) * 1000, 1)
+        if YAKE_VAR_MI:
+            baslangic = time.perf_counter()
+            self.yake_cikartici_al()
+            sureler["yake"] = round((time.perf_counter() - baslangic) * 1000, 1)
+        if RAKE_VAR_MI:
+            baslangic = time.perf_counter()
+            _modul_yukle("rake_nltk")
+            sureler["rake_nltk"] = round((time.perf_counter() - baslangic) * 1000, 1)
+        turkce_durma_kelimeleri()
+        return sureler
+    
     def pdf_den_metin_cikar(self, pdf_dosyasi) -> str:
         """PDF'den metin çıkarma"""
+        return self.pdf_den_metin_akisi(pdf_dosyasi)["metin"]
+    
+    def pdf_den_metin_akisi(self, pdf_dosyasi, maksimum_sayfa: int = None,
+                            maksimum_karakter: int = None, durdur=None) -> Dict:
+        """PDF'i sayfa sayfa oku; limitlere ulaşınca dur, kelime sayısını okurken hesapla"""
+        maksimum_sayfa = maksimum_sayfa or PDF_LIMITLERI["maksimum_sayfa"]
+        maksimum_karakter = maksimum_karakter or PDF_LIMITLERI["maksimum_karakter"]
+        
+        # Arka uçları sırayla dene; hata veya boş çıktıda bir sonrakine geç
+        son_hata = None
+        sonuc = None
+        for arka_uc_adi in pdf_arka_uc_sirasi():
+            try:
+                pdf_dosyasi.seek(0)
+                sonuc = self._sayfalari_topla(
+                    PDF_ARKA_UCLARI[arka_uc_adi], pdf_dosyasi, maksimum_sayfa, maksimum_karakter,
+                    durdur
+                )
+            except Exception as hata:
+                logger.warning(f"PDF arka ucu {arka_uc_adi} başarısız: {hata}")
+                son_hata = hata
+                continue
+            if sonuc["metin"]:
+                return sonuc
+            logger.info(f"PDF arka ucu {arka_uc_adi} boş metin döndürdü, sonraki deneniyor")
+        
+        if sonuc is None:
+            hata_mesaji = str(son_hata) if son_hata else "Kurulu PDF kütüphanesi yok"
+            logger.error(f"PDF okuma hatası: {hata_mesaji}")
+            raise HTTPException(status_code=400, detail=f"❌ PDF okuma hatası: {hata_mesaji}")
+        return sonuc
+    
+    def _sayfalari_topla(self, arka_uc: PdfArkaUcu, pdf_dosyasi, maksimum_sayfa: int,
+                         maksimum_karakter: int, durdur=None) -> Dict:
+        """Tek arka uçla sayfaları limitler dahilinde topla
+        
+        `durdur(sayfa_metni)` True döndürürse (ör. kaynakçaya gelindi) okuma o sayfada biter.
+        """
+        toplam_sayfa, sayfa_metinleri = arka_uc.ac(pdf_dosyasi)
+        sayfalar = []
+        karakter_sayisi = 0
+        kelime_sayisi = 0
+        kesildi = False
+        
         try:
-            pdf_okuyucu = PyPDF2.PdfReader(pdf_dosyasi)
-            metin = ""
-            
-            for sayfa_numarasi in range(len(pdf_okuyucu.pages)):
-                sayfa = pdf_okuyucu.pages[sayfa_numarasi]
-                metin += sayfa.extract_text() + "\n"
+            for sayfa_metni in sayfa_metinleri:
+                kalan = maksimum_karakter - karakter_sayisi
+                if len(sayfa_metni) > kalan:
+                    sayfa_metni = sayfa_metni[:kalan]
+                    kesildi = True
+                
+                sayfalar.append(sayfa_metni)
+                karakter_sayisi += len(sayfa_metni) + 1
+                kelime_sayisi += len(sayfa_metni.split())
+                
+                if len(sayfalar) >= maksimum_sayfa or karakter_sayisi >= maksimum_karakter:
+                    break
+                if durdur and durdur(sayfa_metni):
+                    break
+        finally:
+            # Yarıda bırakılan üreteçler belgeyi kapatsın
+            kapat = getattr(sayfa_metinleri, "close", None)
+            if kapat:
+                kapat()
+        
+        # Üst/alt bilgi ve sayfa numaraları temizlemeden önce silinir
+        sayfalar, kalip_raporu = sayfa_kaliplarini_temizle(sayfalar)
+        
+        return {
+            "metin": "\n".join(sayfalar).strip(),
+            "toplam_sayfa": toplam_sayfa,
+            "islenen_sayfa": len(sayfalar),
+            "kelime_sayisi": kelime_sayisi - kalip_raporu["silinen_kelime"],
+            "kalip_temizligi": kalip_raporu,
+            "kesildi": kesildi or len(sayfalar) < toplam_sayfa,
+            "arka_uc": arka_uc.ad
+        }
+    
+    def metni_temizle(self, metin: str) -> str:
+        """Metni temizleme ve Türkçe karakterleri koruma"""
+        # Türkçe karakterleri koru
+        turkce_karakterler = "çğıöşüÇĞIİÖŞÜ"
+        
+        # Gereksiz boşlukları temizle
+        metin = re.sub(r'\s+', ' ', metin)
+        
+        # Sadece Türkçe karakterler, harfler, sayılar ve temel noktalama işaretlerini koru
+        metin = re.sub(r'[^\w\s.,!?;:çğıöşüÇĞIİÖŞÜ]', ' ', metin)
+        
+        # Çoklu boşlukları tek boşluğa çevir
+        metin = ' '.join(metin.split())
+        return metin.strip()
+    
+    def anahtar_kelime_cikar(self, metin: str, yontem: str = "yake") -> list:
+        """Anahtar kelime çıkarma"""
+        anahtar_kelimeler = []
+        
+        if yontem == "yake" and YAKE_VAR_MI:
+            try:
+                kelime_cikartici = self.yake_cikartici_al()
+                kelime_puanlari = kelime_cikartici.extract_keywords(metin)
+                # YAKE sürümüne göre demet (kelime, puan) ya da (puan, kelime) olabilir
+                anahtar_kelimeler = [kelime[0] if isinstance(kelime[0], str) else kelime[1]
+                                     for kelime in kelime_puanlari]
+            except Exception as hata:
+                logger.warning(f"YAKE anahtar kelime çıkarma hatası: {hata}")
+        
+        elif yontem == "rake" and RAKE_VAR_MI:
+            try:
+                rake = _modul_yukle("rake_nltk").Rake(
+                    stopwords=turkce_durma_kelimeleri() or None,
+                    sentence_tokenizer=_cumlelere_bol,
+                    word_tokenizer=_kelimelere_bol
+                )
+                rake.extract_keywords_from_text(metin)
+                anahtar_kelimeler = rake.get_ranked_phrases()[:20]
+            except Exception as hata:
+                logger.warning(f"RAKE anahtar kelime çıkarma hatası: {hata}")
+        
+        return anahtar_kelimeler
+    
+    def tokenlestir(self, metin: str) -> "BelgeTokenleri":
+        """Metni temizleyip cümle puanlamasında kullanılan token temsilini oluştur"""
+        return BelgeTokenleri(self.metni_temizle(metin))
+    
+    def belge_analizi(self, metin: str, tokenler: "BelgeTokenleri" = None) -> "SiraliCumleler":
+        """Belgeyi bir kez puanla; aynı metin tekrar gelirse önbellekten döndür"""
+        belge_hash = hashlib.sha256(metin.encode("utf-8", "surrogatepass")).hexdigest()
+        analiz = ozet_onbellegi.al(belge_hash)
+        if analiz is None:
+            if tokenler is None:
+                tokenler = self.tokenlestir(metin)
+            analiz = self.siralama_hesapla(tokenler, belge_hash)
+            ozet_onbellegi.koy(belge_hash, analiz)
+        return analiz
+    
+    def siralama_hesapla(self, tokenler: "BelgeTokenleri", belge_hash: str = None) -> "SiraliCumleler":
+        """Aday cümleleri puanla ve puana göre sırala"""
+        adaylar = tokenler.aday_cumleler()
+        
+        # Cümle skorları - kelime frekansları token dizisinden bir kez hesaplanır
+        puanlar = tokenler.cumle_puanlari(adaylar)
+        
+        cumle_puanlari = {}
+        for indeks, cumle_no in enumerate(adaylar):
+            puan = puanlar[indeks]
+            if puan is not None:
+                cumle_puanlari[indeks] = puan
+                
+                # İlk ve son cümlelere bonus
+                if indeks < 3 or indeks >= len(adaylar) - 3:
+                    cumle_puanlari[indeks] *= 1.5
+        
+        # En yüksekten düşüğe sıra (eşit puanda önceki cümle önde)
+        sira = sorted(cumle_puanlari, key=cumle_puanlari.get, reverse=True)
+        
+        return SiraliCumleler(
+            belge_hash,
+            [tokenler.cumle_metni(i) for i in adaylar],
+            array('I', sira),
+            tokenler.kelime_sayisi,
+            tokenler.temiz_uzunluk()
+        )
+    
+    def artimli_belge_analizi(self, belge_id: str, metin: str):
+        """Aynı belge kimliğiyle gelen yeni sürümü sadece değişen cümlelerle yeniden puanla"""
+        belge, ilk_surum = artimli_belgeler.al_veya_olustur(
+            belge_id, lambda: ArtimliBelge(self.metni_temizle)
+        )
+        
+        belge_hash = hashlib.sha256(metin.encode("utf-8", "surrogatepass")).hexdigest()
+        with belge.kilit:
+            degisim = belge.guncelle(metin)
+            analiz = belge.siralama(belge_hash)
+        artimli_belgeler.agirligi_yenile(belge_id)
+        
+        ozet_onbellegi.koy(belge_hash, analiz)
+        degisim["ilk_surum"] = ilk_surum
+        return analiz, degisim
+    
+    def basit_ozetle(self, metin: str, maksimum_cumle: int = 5, tokenler: "BelgeTokenleri" = None) -> str:
+        """Gelişmiş basit özetleme algoritması"""
+        if tokenler is None:
+            tokenler = BelgeTokenleri(metin)
+        return self.siralama_hesapla(tokenler).ozet(maksimum_cumle)
+    
+    def metin_ozetle(self, metin: str, maksimum_uzunluk: int = None, maksimum_cumle: int = 5,
+                     analiz: "SiraliCumleler" = None) -> str:
+        """Türkçe metin özetleme
+        
+        `maksimum_uzunluk` verilirse özet bu karakter bütçesini aşmaz.
+        """
+        if not metin or len(metin.strip()) < 100:
+            return "⚠️ Metin çok kısa, özetlenemeye uygun değil. En az 100 karakter gerekli."
+        
+        # Metni temizle ve puanla (çağıran zaten analiz ettiyse tekrar yapılmaz)
+        if analiz is None:
+            analiz = self.belge_analizi(metin)
+        
+        if analiz.temiz_uzunluk < 50:
+            return "⚠️ Temizlenen metin çok kısa. Lütfen daha uzun bir metin sağlayın."
+        
+        # Sıralanmış cümlelerden istenen uzunlukta özet
+        ozet = analiz.ozet(maksimum_cumle, maksimum_uzunluk)
+        
+        if not ozet or len(ozet.strip()) < 20:
+            return "⚠️ Özet oluşturulamadı. Metninizi kontrol edip tekrar deneyin."
             
-            return metin.strip()
-        except Exception as hata:
-            logger.error(f"PDF okuma hatası: {hata}")
-            raise HTTPException(status_code=400, detail=f"❌ PDF okuma hatası: {str(hata)}")
+        return ozet
+    
+    def coklu_ozet(self, metin: str, analiz: "SiraliCumleler", cumle_sayilari: list = None,
+                   karakter_butceleri: list = None) -> list:
+        """Aynı sıralamadan birden çok uzunlukta özet üret"""
+        ozetler = []
+        for cumle_sayisi in cumle_sayilari or []:
+            ozetler.append({
+                "cumle_sayisi": cumle_sayisi,
+                "ozet": self.metin_ozetle(metin, maksimum_cumle=cumle_sayisi, analiz=analiz)
+            })
+        for butce in karakter_butceleri or []:
+            ozetler.append({
+                "karakter_butcesi": butce,
+                "ozet": self.metin_ozetle(metin, maksimum_uzunluk=butce, maksimum_cumle=None, analiz=analiz)
+            })
+        return ozetler
 
 class YokTezArayici:
     """YÖK Tez Merkezi'nden tez arama ve çekme sınıfı"""
     
-    def __init__(self):
-        self.temel_url = "https://tez.yok.gov.tr/UlusalTezMerkezi/"
-        self.arama_url = "https://tez.yok.gov.tr/UlusalTezMerkezi/tezSorguSonucYeni.jsp"
-        self.oturum = requests.Session()
+    def __init__(self, benzerlik_dizini: "BenzerlikDizini" = None,
+                 kelime_toplamlari: "KelimeToplamlari" = None):
+        self.temel_url = YOK_TEMEL_URL.rstrip("/") + "/"
+        self.arama_url = self.temel_url + "tezSorguSonucYeni.jsp"
+        self._oturum = None
+        self._kilit = threading.Lock()
+        self.benzerlik_dizini = benzerlik_dizini  # alınan özetler benzerlik aramasına eklenir
+        self.kelime_toplamlari = kelime_toplamlari  # anahtar kelimeler yıl/üniversite/tür sayımlarına eklenir
+        ayarlar = ONYUKLEME_AYARLARI
+        self.onyukleyici = YokOnYukleyici(
+            self._sayfa_indir, eszamanli=ayarlar["eszamanli"], kuyruk=ayarlar["kuyruk"],
+            onbellek_boyutu=ayarlar["onbellek_boyutu"], gecerlilik_sn=ayarlar["gecerlilik_sn"],
+            etkin=ayarlar["etkin"]
+        )
+    
+    @property
+    def oturum(self):
+        """HTTP oturumunu ilk istekte oluştur (requests tembel yüklenir)"""
+        if self._oturum is None:
+            with self._kilit:
+                if self._oturum is None:
+                    self._oturum = self._oturum_olustur()
+        return self._oturum
+    
+    def _oturum_olustur(self):
+        """Tarayıcı başlıklarıyla yeni bir requests oturumu oluştur"""
+        oturum = _modul_yukle("requests").Session()
         
         # Headers - normal tarayıcı gibi görünmek için
-        self.oturum.headers.update({
+        oturum.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'tr-TR,tr;q=0.9,en;q=0.8',
@@ -127,6 +1749,36 @@ class YokTezArayici:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        return oturum
+    
+    def _sayfa_indir(self, url: str, parametreler: dict = None) -> str:
+        """Sayfayı YÖK'ten indir (önbellek ve ön yükleme YokOnYukleyici'de)"""
+        yanit = self.oturum.get(url, params=parametreler, timeout=30)
+        yanit.raise_for_status()
+        return yanit.text
+    
+    def _tam_link(self, tez_linki: str) -> str:
+        return tez_linki if tez_linki.startswith('http') else self.temel_url + tez_linki
+    
+    def onyukle(self, arama_parametreleri: dict, tezler: list):
+        """Kullanıcının büyük olasılıkla isteyeceği sonraki sayfayı ve ilk tezlerin detaylarını arka planda getir"""
+        if arama_parametreleri.get('sayfa'):
+            sonraki = dict(arama_parametreleri, sayfa=int(arama_parametreleri['sayfa']) + 1)
+            self.onyukleyici.planla(self.arama_url, sonraki)
+        for tez in tezler[:ONYUKLEME_AYARLARI["detay_sayisi"]]:
+            if tez.get('link'):
+                self.onyukleyici.planla(self._tam_link(tez['link']))
+    
+    def isit(self) -> Dict:
+        """HTTP ve HTML ayrıştırma kütüphanelerini önceden yükle (ısınma)"""
+        sureler = {}
+        baslangic = time.perf_counter()
+        self.oturum
+        sureler["requests"] = round((time.perf_counter() - baslangic) * 1000, 1)
+        baslangic = time.perf_counter()
+        _html_ayristir("<html></html>")
+        sureler["bs4"] = round((time.perf_counter() - baslangic) * 1000, 1)
+        return sureler
     
     def tez_ara(self, anahtar_kelime: str, sayfa_sayisi: int = 1, tur: str = "tum") -> Dict:
         """YÖK Tez'de arama yap"""
@@ -141,15 +1793,15 @@ class YokTezArayici:
             
             logger.info(f"YÖK Tez araması başlatılıyor: {anahtar_kelime}")
             
-            # Arama yap
-            yanit = self.oturum.get(self.arama_url, params=arama_parametreleri, timeout=30)
-            yanit.raise_for_status()
+            # Arama yap (önbellekte ya da ön yüklenmişse YÖK'e gidilmez)
+            metin = self.onyukleyici.al(self.arama_url, arama_parametreleri)
             
             # HTML parse et
-            soup = BeautifulSoup(yanit.text, 'html.parser')
+            soup = _html_ayristir(metin)
             
             # Tez listesini çıkar
             tezler = self.tez_listesi_cıkar(soup)
+            self.onyukle(arama_parametreleri, tezler)
             
             sonuc = {
                 "arama_terimi": anahtar_kelime,
@@ -272,16 +1924,11 @@ class YokTezArayici:
             
         return tezler[:5]  # İlk 5 tez
     
-    def tez_detay_al(self, tez_linki: str) -> Dict:
+    def tez_detay_al(self, tez_linki: str, tez_bilgisi: Dict = None) -> Dict:
         """Tez detay sayfasından özet ve diğer bilgileri al"""
         try:
-            if not tez_linki.startswith('http'):
-                tez_linki = self.temel_url + tez_linki
-                
-            yanit = self.oturum.get(tez_linki, timeout=30)
-            yanit.raise_for_status()
-            
-            soup = BeautifulSoup(yanit.text, 'html.parser')
+            tez_linki = self._tam_link(tez_linki)
+            soup = _html_ayristir(self.onyukleyici.al(tez_linki))
             
             detay = {
                 "link": tez_linki,
@@ -290,6 +1937,16 @@ class YokTezArayici:
                 "tam_bilgi": self.tam_bilgi_cıkar(soup)
             }
             
+            if self.benzerlik_dizini is not None and len(detay["ozet"]) > 100:
+                bilgi = {k: v for k, v in (tez_bilgisi or {}).items()
+                         if k in ("baslik", "yazar", "universite", "yil", "tur")}
+                self.benzerlik_dizini.ekle(tez_linki, detay["ozet"], kaynak="yok", link=tez_linki, **bilgi)
+            if self.kelime_toplamlari is not None and tez_bilgisi:
+                self.kelime_toplamlari.ekle(
+                    tez_linki, detay["anahtar_kelimeler"], tez_bilgisi.get("yil"),
+                    tez_bilgisi.get("universite"), tez_bilgisi.get("tur"), kaynak="yok"
+                )
+            
             return detay
             
         except Exception as e:
@@ -409,11 +2066,9 @@ class YokTezArayici:
             arama_parametreleri['tur'] = kwargs['tur']  # "YL" veya "DR"
             
         try:
-            yanit = self.oturum.get(self.arama_url, params=arama_parametreleri, timeout=30)
-            yanit.raise_for_status()
-            
-            soup = BeautifulSoup(yanit.text, 'html.parser')
+            soup = _html_ayristir(self.onyukleyici.al(self.arama_url, arama_parametreleri))
             tezler = self.tez_listesi_cıkar(soup)
+            self.onyukle(arama_parametreleri, tezler)
             
             return {
                 "arama_parametreleri": arama_parametreleri,
@@ -433,7 +2088,7 @@ class YokTezArayici:
         try:
             # Tez detaylarını al
             if tez_bilgisi.get('link'):
-                detay = self.tez_detay_al(tez_bilgisi['link'])
+                detay = self.tez_detay_al(tez_bilgisi['link'], tez_bilgisi)
                 
                 # Özet varsa özetle
                 if detay.get('ozet') and len(detay['ozet']) > 100:
@@ -460,117 +2115,783 @@ class YokTezArayici:
                 "hata": str(e),
                 "durum": "hata"
             }
+
+class SonucDeposu:
+    """Analiz sonuçlarını satır satır (NDJSON) saklayan ekleme-tabanlı depo
     
-    def metni_temizle(self, metin: str) -> str:
-        """Metni temizleme ve Türkçe karakterleri koruma"""
-        # Türkçe karakterleri koru
-        turkce_karakterler = "çğıöşüÇĞIİÖŞÜ"
-        
-        # Gereksiz boşlukları temizle
-        metin = re.sub(r'\s+', ' ', metin)
-        
-        # Sadece Türkçe karakterler, harfler, sayılar ve temel noktalama işaretlerini koru
-        metin = re.sub(r'[^\w\s.,!?;:çğıöşüÇĞIİÖŞÜ]', ' ', metin)
-        
-        # Çoklu boşlukları tek boşluğa çevir
-        metin = ' '.join(metin.split())
-        return metin.strip()
+    Kayıtlar tek tek eklenir ve okunurken dosya satır satır akıtılır; böylece
+    on binlerce sonuç sabit bellekle dışa aktarılabilir.
+    """
     
-    def anahtar_kelime_cikar(self, metin: str, yontem: str = "yake") -> list:
-        """Anahtar kelime çıkarma"""
-        anahtar_kelimeler = []
-        
-        if yontem == "yake" and YAKE_VAR_MI:
-            try:
-                kelime_cikartici = yake.KeywordExtractor(
-                    lan="tr",  # Türkçe
-                    n=3,       # 3-gram'a kadar
-                    dedupLim=0.7,
-                    top=20
-                )
-                kelime_puanlari = kelime_cikartici.extract_keywords(metin)
-                anahtar_kelimeler = [kelime[1] for kelime in kelime_puanlari]
-            except Exception as hata:
-                logger.warning(f"YAKE anahtar kelime çıkarma hatası: {hata}")
+    def __init__(self, dosya_yolu: str = SONUC_DOSYASI):
+        self.dosya_yolu = dosya_yolu
+        self._kilit = threading.Lock()
+    
+    def ekle(self, kaynak: str, ozet: str, anahtar_kelimeler: list, istatistikler: Dict,
+             parti: str = None, **ek_alanlar) -> str:
+        """Yeni analiz sonucunu kaydet, kayıt kimliğini döndür"""
+        kayit = {
+            "id": uuid.uuid4().hex,
+            "zaman": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "kaynak": kaynak,
+            "parti": parti,
+            "ozet": ozet,
+            "anahtar_kelimeler": anahtar_kelimeler,
+            "istatistikler": istatistikler,
+        }
+        kayit.update(ek_alanlar)
+        satir = json.dumps(kayit, ensure_ascii=False) + "\n"
         
-        elif yontem == "rake" and RAKE_VAR_MI:
-            try:
-                rake = Rake()
-                rake.extract_keywords_from_text(metin)
-                anahtar_kelimeler = rake.get_ranked_phrases()[:20]
-            except Exception as hata:
-                logger.warning(f"RAKE anahtar kelime çıkarma hatası: {hata}")
+        with self._kilit:
+            os.makedirs(os.path.dirname(self.dosya_yolu) or ".", exist_ok=True)
+            # Tek write çağrısı - O_APPEND ile işçi süreçleri arasında satırlar karışmaz
+            with open(self.dosya_yolu, "a", encoding="utf-8") as dosya:
+                dosya.write(satir)
+        return kayit["id"]
+    
+    ARAMA_ALANLARI = ("ozet", "anahtar_kelimeler", "dosya_adi")
+    
+    @classmethod
+    def _aramaya_uyar(cls, kayit: Dict, arama: str) -> bool:
+        """Aranan metin özet, anahtar kelimeler ya da dosya adında geçiyor mu"""
+        for alan in cls.ARAMA_ALANLARI:
+            deger = kayit.get(alan)
+            degerler = deger if isinstance(deger, list) else [deger]
+            if any(isinstance(d, str) and arama in d.lower() for d in degerler):
+                return True
+        return False
+    
+    def kayitlari_oku(self, parti: str = None, kaynak: str = None, arama: str = None,
+                      limit: int = None):
+        """Filtreye uyan kayıtları tek tek üret (dosya belleğe alınmaz)"""
+        if not os.path.exists(self.dosya_yolu):
+            return
         
-        return anahtar_kelimeler
+        arama = arama.lower() if arama else None
+        # JSON'da kaçışlanan karakterler ham satırda aynen geçmez; o zaman ön eleme yapılmaz
+        on_eleme = bool(arama) and not any(h in arama for h in '"\\') and arama.isprintable()
+        sayac = 0
+        with open(self.dosya_yolu, encoding="utf-8") as dosya:
+            for satir in dosya:
+                if limit is not None and sayac >= limit:
+                    return
+                # Hızlı ön eleme: JSON çözmeden önce ham satırda ara; kesin eşleşme alanlarda
+                if on_eleme and arama not in satir.lower():
+                    continue
+                try:
+                    kayit = json.loads(satir)
+                except ValueError:
+                    continue  # yarım yazılmış satır
+                if parti and kayit.get("parti") != parti:
+                    continue
+                if kaynak and kayit.get("kaynak") != kaynak:
+                    continue
+                if arama and not self._aramaya_uyar(kayit, arama):
+                    continue
+                sayac += 1
+                yield kayit
+
+try:
+    import fcntl
+except ImportError:  # Windows - tek süreçli çalışmada iş parçacığı kilidi yeterli
+    fcntl = None
+
+@contextlib.contextmanager
+def _dosya_kilidi(yol: str):
+    """İşçi süreçleri arasında dosyaya özel erişim (fcntl yoksa kilitsiz)"""
+    if fcntl is None:
+        yield
+        return
+    with open(yol, "a") as kilit:
+        fcntl.flock(kilit, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(kilit, fcntl.LOCK_UN)
+
+def paylasimli_dizi(ad: str, uretici):
+    """Salt okunur NumPy dizisini işçiler arasında paylaşılan bellek eşlemli dosyadan aç
     
-    def basit_ozetle(self, metin: str, maksimum_cumle: int = 5) -> str:
-        """Gelişmiş basit özetleme algoritması"""
-        cumleler = metin.split('.')
-        cumleler = [cumle.strip() for cumle in cumleler if len(cumle.strip()) > 20]
+    İlk süreç diziyi `uretici()` ile üretip PAYLASIMLI_DIZIN'e .npy olarak yazar;
+    diğer süreçler aynı dosyayı mmap ile açar, sayfalar bellekte tek kopya kalır.
+    Paylaşım kapalıysa (TEZ_PAYLASIMLI=0) süreç kendi kopyasını üretir.
+    """
+    if not PAYLASIMLI_KAYNAKLAR:
+        return uretici()
+    np = _modul_yukle("numpy")
+    yol = os.path.join(PAYLASIMLI_DIZIN, ad + ".npy")
+    try:
+        if not os.path.exists(yol):
+            os.makedirs(PAYLASIMLI_DIZIN, exist_ok=True)
+            with _dosya_kilidi(yol + ".kilit"):
+                if not os.path.exists(yol):
+                    gecici = f"{yol}.{os.getpid()}.gecici"
+                    with open(gecici, "wb") as dosya:
+                        np.save(dosya, uretici())
+                    os.replace(gecici, yol)
+        return np.load(yol, mmap_mode="r")
+    except OSError as e:
+        logger.warning(f"Paylaşılan kaynak açılamadı ({ad}), süreç içi kopya kullanılıyor: {e}")
+        return uretici()
+
+class BenzerlikDizini:
+    """Tez özetleri için yerel vektör benzerlik dizini
+    
+    Her özet kelime hash'lenerek (hashing vectorizer) TF-IDF ağırlıklarıyla
+    vektörleştirilir, seyrek rastgele izdüşümle `boyut` boyuta indirilip L2
+    normalize edilir ve float32 olarak eklemeli bir dosyaya (vektorler.f32)
+    yazılır. Sorgular bu dosyanın bellek eşlemi üzerinde bloklar halinde nokta
+    çarpımıyla cevaplanır; matris belleğe kopyalanmaz. Kayıt bilgileri ve
+    hash'lenmiş terim sayımları kayitlar.ndjson'da tutulur: belge frekansları
+    buradan hesaplanır ve IDF kaydığında `yeniden_olustur` vektörleri günceller.
+    Birden çok işçi aynı dizine ekleyebilir; her süreç yeni satırları okuyarak
+    kendini günceller.
+    """
+    
+    BLOK = 65536     # sorguda tek seferde çarpılan satır
+    IZDUSUM_YOGUNLUGU = 4  # terim başına izdüşüm boyutu
+    TOHUM = 2024
+    
+    def __init__(self, dizin: str, ozellik_bitleri: int = 18, boyut: int = 256, etkin: bool = True):
+        self.dizin = dizin
+        self.ozellik_bitleri = ozellik_bitleri
+        self.boyut = boyut
+        self.etkin = etkin and NUMPY_VAR_MI
+        self._kilit = threading.Lock()
+        self._hazir = False
+    
+    @property
+    def _vektor_dosyasi(self) -> str:
+        return os.path.join(self.dizin, "vektorler.f32")
+    
+    @property
+    def _kayit_dosyasi(self) -> str:
+        return os.path.join(self.dizin, "kayitlar.ndjson")
+    
+    @property
+    def _kilit_dosyasi(self) -> str:
+        return os.path.join(self.dizin, ".kilit")
+    
+    def _hazirla(self):
+        """Ayarları, izdüşüm tablolarını ve okuma durumunu ilk kullanımda kur"""
+        if self._hazir:
+            return
+        np = _modul_yukle("numpy")
+        os.makedirs(self.dizin, exist_ok=True)
+        ayar_dosyasi = os.path.join(self.dizin, "ayarlar.json")
+        ayarlar = {"ozellik_bitleri": self.ozellik_bitleri, "boyut": self.boyut, "tohum": self.TOHUM}
+        with _dosya_kilidi(self._kilit_dosyasi):
+            if os.path.exists(ayar_dosyasi):
+                with open(ayar_dosyasi, encoding="utf-8") as dosya:
+                    kayitli = json.load(dosya)
+                if kayitli != ayarlar:
+                    logger.warning(f"Benzerlik dizini mevcut ayarlarla açılıyor: {kayitli}")
+                ayarlar = kayitli
+            else:
+                with open(ayar_dosyasi, "w", encoding="utf-8") as dosya:
+                    json.dump(ayarlar, dosya)
+        self.ozellik_bitleri = ayarlar["ozellik_bitleri"]
+        self.boyut = ayarlar["boyut"]
         
-        if len(cumleler) <= maksimum_cumle:
-            return '. '.join(cumleler) + '.'
+        ozellik = 1 << self.ozellik_bitleri
+        self._belge_frekansi = np.zeros(ozellik, dtype=np.int32)
+        self._kayitlar = []       # satır -> kayıt bilgisi
+        self._satirlar = {}       # kimlik -> satır
+        self._okunan_bayt = 0
+        self._matris = None
+        self._matris_kimligi = None
+        if self.boyut:
+            self._izdusum_boyutlari, self._izdusum_isaretleri = self._izdusum_tablolari(ayarlar["tohum"])
+        self._hazir = True
+    
+    def _izdusum_tablolari(self, tohum: int) -> tuple:
+        """Seyrek rastgele izdüşüm: her hash sütunu IZDUSUM_YOGUNLUGU boyuta ±1 ile eklenir
         
-        # Cümle skorlama
-        kelime_sikligi = {}
-        kelimeler = metin.lower().split()
+        Tablolar tohumdan belirlenimli üretilir ve tüm işçilerce paylaşılır (~5 MB).
+        """
+        np = _modul_yukle("numpy")
+        ozellik = 1 << self.ozellik_bitleri
         
-        # Kelime frekansı hesapla
-        for kelime in kelimeler:
-            if kelime.isalpha() and len(kelime) > 3:
-                kelime_sikligi[kelime] = kelime_sikligi.get(kelime, 0) + 1
+        def uret(parca: int):
+            uretec = np.random.default_rng(tohum)
+            boyutlar = uretec.integers(0, self.boyut, size=(ozellik, self.IZDUSUM_YOGUNLUGU), dtype=np.int32)
+            if parca == 0:
+                return boyutlar
+            return uretec.choice(np.array([-1, 1], dtype=np.int8), size=(ozellik, self.IZDUSUM_YOGUNLUGU))
         
-        # Cümle skorları
-        cumle_puanlari = {}
-        for indeks, cumle in enumerate(cumleler):
-            cumledeki_kelimeler = cumle.lower().split()
-            puan = 0
-            kelime_sayisi = 0
-            
-            for kelime in cumledeki_kelimeler:
-                if kelime in kelime_sikligi:
-                    puan += kelime_sikligi[kelime]
-                    kelime_sayisi += 1
-            
-            if kelime_sayisi > 0:
-                cumle_puanlari[indeks] = puan / kelime_sayisi
-                
-                # İlk ve son cümlelere bonus
-                if indeks < 3 or indeks >= len(cumleler) - 3:
-                    cumle_puanlari[indeks] *= 1.5
+        ad = f"izdusum_{self.ozellik_bitleri}_{self.boyut}_{self.IZDUSUM_YOGUNLUGU}_{tohum}"
+        return paylasimli_dizi(ad + "_boyutlar", lambda: uret(0)), paylasimli_dizi(ad + "_isaretler", lambda: uret(1))
+    
+    def isit(self):
+        """Dizin ayarlarını ve paylaşılan izdüşüm tablolarını önceden aç"""
+        if self.etkin:
+            with self._kilit:
+                self._hazirla()
+    
+    def _yenile(self):
+        """Başka süreçlerin eklediği kayıtları oku, vektör dosyası büyüdüyse yeniden eşle"""
+        np = _modul_yukle("numpy")
+        if os.path.exists(self._kayit_dosyasi):
+            with open(self._kayit_dosyasi, "rb") as dosya:
+                dosya.seek(self._okunan_bayt)
+                yeni = dosya.read()
+            son = yeni.rfind(b"\n") + 1  # yarım yazılmış son satır sonraya kalır
+            for satir in yeni[:son].splitlines():
+                kayit = json.loads(satir)
+                terimler = kayit.pop("terimler")
+                if terimler:
+                    self._belge_frekansi[np.fromiter((t[0] for t in terimler), dtype=np.int64)] += 1
+                self._satirlar[kayit["kimlik"]] = len(self._kayitlar)
+                self._kayitlar.append(kayit)
+            self._okunan_bayt += son
         
-        # En yüksek skorlu cümleleri seç
-        en_iyi_cumleler = sorted(cumle_puanlari.items(), 
-                             key=lambda x: x[1], reverse=True)[:maksimum_cumle]
+        if os.path.exists(self._vektor_dosyasi):
+            bilgi = os.stat(self._vektor_dosyasi)
+            kimlik = (bilgi.st_ino, bilgi.st_size)
+            satir_sayisi = bilgi.st_size // (4 * self._vektor_boyutu)
+            if kimlik != self._matris_kimligi and satir_sayisi:
+                self._matris = np.memmap(self._vektor_dosyasi, dtype=np.float32, mode="r",
+                                         shape=(satir_sayisi, self._vektor_boyutu))
+                self._matris_kimligi = kimlik
+    
+    @property
+    def _vektor_boyutu(self) -> int:
+        return self.boyut or (1 << self.ozellik_bitleri)
+    
+    def _terimler(self, metin: str) -> list:
+        """Kelimeleri hash sütunlarına say: [[sütun, sayı], ...]"""
+        maske = (1 << self.ozellik_bitleri) - 1
+        sayimlar = Counter()
+        for kelime in re.findall(r"\w{3,}", metin.lower()):
+            if not kelime.isdigit():
+                sayimlar[zlib.crc32(kelime.encode("utf-8")) & maske] += 1
+        return [[sutun, sayi] for sutun, sayi in sayimlar.items()]
+    
+    def _vektor(self, terimler: list):
+        """Terim sayımlarından normalize TF-IDF (ve izdüşüm) vektörü"""
+        np = _modul_yukle("numpy")
+        vektor = np.zeros(self._vektor_boyutu, dtype=np.float32)
+        if not terimler:
+            return vektor
+        sutunlar = np.array([t[0] for t in terimler], dtype=np.int64)
+        sayilar = np.array([t[1] for t in terimler], dtype=np.float32)
+        belge_sayisi = len(self._kayitlar)
+        idf = np.log((1 + belge_sayisi) / (1 + self._belge_frekansi[sutunlar])) + 1
+        agirliklar = ((1 + np.log(sayilar)) * idf).astype(np.float32)
+        if self.boyut:
+            np.add.at(vektor, self._izdusum_boyutlari[sutunlar].ravel(),
+                      (agirliklar[:, None] * self._izdusum_isaretleri[sutunlar]).ravel())
+        else:
+            vektor[sutunlar] = agirliklar
+        norm = np.linalg.norm(vektor)
+        return vektor / norm if norm else vektor
+    
+    def ekle(self, kimlik: str, metin: str, **bilgi) -> bool:
+        """Özeti dizine ekle (aynı kimlik daha önce eklendiyse atlanır)"""
+        if not self.etkin or not kimlik:
+            return False
+        terimler = self._terimler(metin)
+        if not terimler:
+            return False
+        with self._kilit:
+            self._hazirla()
+            with _dosya_kilidi(self._kilit_dosyasi):
+                self._yenile()
+                if kimlik in self._satirlar:
+                    return False
+                # Hiçbir şey yazılmadan önce kayıt ve vektör hazırlanır: serileştirme hatası iz bırakmaz
+                kayit_satiri = json.dumps({"kimlik": kimlik, **bilgi, "terimler": terimler},
+                                          ensure_ascii=False).encode("utf-8") + b"\n"
+                vektor = self._vektor(terimler).tobytes()
+                # Önceki yarım eklemelerin artıkları kesilir; vektör satırı ile kayıt satırı hizalı kalır
+                satir_bayti = 4 * self._vektor_boyutu
+                with open(self._vektor_dosyasi, "ab") as dosya:
+                    if dosya.tell() != len(self._kayitlar) * satir_bayti:
+                        dosya.truncate(len(self._kayitlar) * satir_bayti)
+                    dosya.write(vektor)
+                with open(self._kayit_dosyasi, "ab") as dosya:
+                    if dosya.tell() != self._okunan_bayt:
+                        dosya.truncate(self._okunan_bayt)
+                    dosya.write(kayit_satiri)
+                self._yenile()
+        return True
+    
+    def benzerleri_bul(self, metin: str = None, kimlik: str = None, k: int = 10) -> list:
+        """Metne ya da dizindeki bir kayda en benzer k tezi kosinüs benzerliğiyle bul"""
+        np = _modul_yukle("numpy")
+        with self._kilit:
+            self._hazirla()
+            self._yenile()
+            matris = self._matris
+            satir_sayisi = min(len(self._kayitlar), len(matris) if matris is not None else 0)
+            kayitlar = self._kayitlar
+            if kimlik is not None:
+                satir = self._satirlar.get(kimlik)
+                if satir is None or satir >= satir_sayisi:
+                    return None
+                sorgu = np.array(matris[satir])
+            else:
+                sorgu = self._vektor(self._terimler(metin or ""))
+        if not satir_sayisi or not sorgu.any():
+            return []
         
-        # Orijinal sırayla düzenle
-        en_iyi_cumleler.sort(key=lambda x: x[0])
+        # Blok blok çarp, her bloktan en iyi k+1 adayı tut (sorgunun kendisi elenebilsin)
+        adaylar_skor, adaylar_satir = [], []
+        secilecek = k + 1
+        for baslangic in range(0, satir_sayisi, self.BLOK):
+            skorlar = matris[baslangic:min(baslangic + self.BLOK, satir_sayisi)] @ sorgu
+            if len(skorlar) > secilecek:
+                en_iyiler = np.argpartition(-skorlar, secilecek)[:secilecek]
+            else:
+                en_iyiler = np.arange(len(skorlar))
+            adaylar_skor.append(skorlar[en_iyiler])
+            adaylar_satir.append(en_iyiler + baslangic)
+        skorlar = np.concatenate(adaylar_skor)
+        satirlar = np.concatenate(adaylar_satir)
         
-        ozet_cumleleri = [cumleler[i] for i, _ in en_iyi_cumleler]
-        return '. '.join(ozet_cumleleri) + '.'
+        sonuclar = []
+        for i in np.argsort(-skorlar):
+            kayit = kayitlar[int(satirlar[i])]
+            if kimlik is not None and kayit["kimlik"] == kimlik:
+                continue
+            sonuclar.append({**kayit, "benzerlik": round(float(skorlar[i]), 4)})
+            if len(sonuclar) >= k:
+                break
+        return sonuclar
     
-    def metin_ozetle(self, metin: str, maksimum_uzunluk: int = 500) -> str:
-        """Türkçe metin özetleme"""
-        if not metin or len(metin.strip()) < 100:
-            return "⚠️ Metin çok kısa, özetlenemeye uygun değil. En az 100 karakter gerekli."
+    def yeniden_olustur(self) -> int:
+        """Tüm vektörleri güncel belge frekanslarıyla yeniden hesapla"""
+        with self._kilit:
+            self._hazirla()
+            with _dosya_kilidi(self._kilit_dosyasi):
+                self._yenile()
+                gecici = self._vektor_dosyasi + ".yeni"
+                sayi = 0
+                with open(self._kayit_dosyasi, "rb") as kaynak, open(gecici, "wb") as hedef:
+                    for satir in kaynak:
+                        if not satir.endswith(b"\n"):
+                            break
+                        hedef.write(self._vektor(json.loads(satir)["terimler"]).tobytes())
+                        sayi += 1
+                os.replace(gecici, self._vektor_dosyasi)
+                self._yenile()
+        return sayi
+    
+    def durum(self) -> Dict:
+        if not self.etkin:
+            return {"etkin": False, "belge_sayisi": 0}
+        with self._kilit:
+            self._hazirla()
+            self._yenile()
+            boyut = os.path.getsize(self._vektor_dosyasi) if os.path.exists(self._vektor_dosyasi) else 0
+            return {
+                "etkin": True,
+                "belge_sayisi": len(self._kayitlar),
+                "boyut": self._vektor_boyutu,
+                "ozellik_bitleri": self.ozellik_bitleri,
+                "vektor_dosyasi_mb": round(boyut / 1024 / 1024, 2),
+            }
+
+def _kelime_normalize(kelime: str) -> str:
+    """Anahtar kelimeyi küçült, boşlukları sadeleştir
+    
+    Türkçe I/ı kuralı sadece ASCII dışı harf içeren sözcüklere uygulanır
+    ("IŞIK" → "ışık"); "INTERNET", "AI" gibi İngilizce/kısaltma sözcükler
+    düz küçültülür ve küçük harfli yazımlarıyla aynı sayılır.
+    """
+    return " ".join(
+        parca.lower() if parca.isascii() else parca.replace("İ", "i").replace("I", "ı").lower()
+        for parca in kelime.split()
+    )
+
+class KelimeToplamlari:
+    """Anahtar kelime × yıl × üniversite × tür sayımlarını artımlı tutan depo
+    
+    Her tez bir kez (kimliğiyle) NDJSON dosyasına eklenir; süreçler yeni
+    satırları okuyup bellekteki sayımlara katar, böylece yeniden tarama
+    gerekmez. Tek boyutlu filtreler için kenar toplamlar hazır tutulur;
+    çok boyutlu filtreler (yıl, üniversite, tür) hücrelerinden hesaplanır.
+    """
+    
+    BOYUTLAR = ("yil", "universite", "tur")
+    BILINMEYEN = "Belirtilmemiş"
+    
+    def __init__(self, dosya_yolu: str = TOPLAM_DOSYASI):
+        self.dosya_yolu = dosya_yolu
+        self._kilit = threading.Lock()
+        self._okunan_bayt = 0
+        self._kimlikler = set()
+        self.toplam = Counter()                                      # kelime -> tez sayısı
+        self.kenar = {b: {} for b in self.BOYUTLAR}                  # boyut -> değer -> Counter(kelime)
+        self.belge_sayilari = {b: Counter() for b in self.BOYUTLAR}  # boyut -> değer -> tez sayısı
+        self.hucreler = {}                                           # kelime -> Counter((yil, universite, tur))
+        self.hucre_kelimeleri = {}                                   # (yil, universite, tur) -> Counter(kelime)
+    
+    def _isle(self, kayit: Dict):
+        hucre = tuple(kayit.get(b) or self.BILINMEYEN for b in self.BOYUTLAR)
+        self._kimlikler.add(kayit["kimlik"])
+        for boyut, deger in zip(self.BOYUTLAR, hucre):
+            self.belge_sayilari[boyut][deger] += 1
+        for kelime in kayit["anahtar_kelimeler"]:
+            self.toplam[kelime] += 1
+            for boyut, deger in zip(self.BOYUTLAR, hucre):
+                self.kenar[boyut].setdefault(deger, Counter())[kelime] += 1
+            self.hucreler.setdefault(kelime, Counter())[hucre] += 1
+        self.hucre_kelimeleri.setdefault(hucre, Counter()).update(kayit["anahtar_kelimeler"])
+    
+    def _yenile(self):
+        """Dosyaya (başka süreçlerce de) eklenen yeni kayıtları sayımlara kat"""
+        if not os.path.exists(self.dosya_yolu):
+            return
+        with open(self.dosya_yolu, "rb") as dosya:
+            dosya.seek(self._okunan_bayt)
+            yeni = dosya.read()
+        son = yeni.rfind(b"\n") + 1
+        for satir in yeni[:son].splitlines():
+            kayit = json.loads(satir)
+            if kayit["kimlik"] not in self._kimlikler:
+                self._isle(kayit)
+        self._okunan_bayt += son
+    
+    def ekle(self, kimlik: str, anahtar_kelimeler: list, yil=None, universite: str = None,
+             tur: str = None, kaynak: str = None) -> bool:
+        """Tezin anahtar kelimelerini sayımlara ekle (aynı tez ikinci kez sayılmaz)"""
+        kelimeler = sorted({_kelime_normalize(k) for k in anahtar_kelimeler or [] if k and k.strip()})
+        if not kimlik or not kelimeler:
+            return False
+        kayit = {
+            "kimlik": kimlik,
+            "kaynak": kaynak,
+            "yil": str(yil) if yil else None,
+            "universite": " ".join(universite.split()) if universite else None,
+            "tur": tur,
+            "anahtar_kelimeler": kelimeler,
+        }
+        with self._kilit:
+            os.makedirs(os.path.dirname(self.dosya_yolu) or ".", exist_ok=True)
+            with _dosya_kilidi(self.dosya_yolu + ".kilit"):
+                self._yenile()
+                if kimlik in self._kimlikler:
+                    return False
+                with open(self.dosya_yolu, "a", encoding="utf-8") as dosya:
+                    dosya.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+                self._yenile()
+        return True
+    
+    def _kelime_sayilari(self, filtreler: Dict) -> Counter:
+        """Filtreye uyan tezlerde kelime başına tez sayısı"""
+        if not filtreler:
+            return self.toplam
+        if len(filtreler) == 1:
+            (boyut, deger), = filtreler.items()
+            return self.kenar[boyut].get(deger, Counter())
+        if len(filtreler) == len(self.BOYUTLAR):
+            return self.hucre_kelimeleri.get(tuple(filtreler[b] for b in self.BOYUTLAR), Counter())
+        # Çok boyutlu filtre: uyan (yıl, üniversite, tür) hücrelerinin kelime sayımları toplanır
+        konumlar = [(self.BOYUTLAR.index(b), d) for b, d in filtreler.items()]
+        sayilar = Counter()
+        for hucre, kelimeler in self.hucre_kelimeleri.items():
+            if all(hucre[i] == d for i, d in konumlar):
+                sayilar.update(kelimeler)
+        return sayilar
+    
+    def sorgula(self, n: int = 20, kelime: str = None, grup: str = None, **filtreler) -> Dict:
+        """En sık N anahtar kelime; `grup` verilirse o boyutun her değeri için ayrı ayrı
+        
+        `kelime` verilirse o kelimenin `grup` boyutundaki dağılımı (ör. yıllara göre eğilim) döner.
+        """
+        filtreler = {b: str(d) for b, d in filtreler.items() if b in self.BOYUTLAR and d}
+        with self._kilit:
+            self._yenile()
+            if kelime:
+                kelime = _kelime_normalize(kelime)
+                konumlar = [(self.BOYUTLAR.index(b), d) for b, d in filtreler.items()]
+                grup_konumu = self.BOYUTLAR.index(grup or "yil")
+                dagilim = Counter()
+                for hucre, adet in self.hucreler.get(kelime, Counter()).items():
+                    if all(hucre[i] == d for i, d in konumlar):
+                        dagilim[hucre[grup_konumu]] += adet
+                return {"kelime": kelime, "grup": grup or "yil",
+                        "dagilim": [{"deger": d, "sayi": s} for d, s in sorted(dagilim.items())]}
+            if grup:
+                degerler = [d for d, _ in self.belge_sayilari[grup].most_common(n)]
+                return {"grup": grup, "gruplar": {
+                    deger: [{"kelime": k, "sayi": s}
+                            for k, s in self._kelime_sayilari({**filtreler, grup: deger}).most_common(n)]
+                    for deger in degerler
+                }}
+            return {"sonuclar": [{"kelime": k, "sayi": s}
+                                 for k, s in self._kelime_sayilari(filtreler).most_common(n)]}
+    
+    def durum(self) -> Dict:
+        with self._kilit:
+            self._yenile()
+            return {
+                "tez_sayisi": len(self._kimlikler),
+                "farkli_kelime": len(self.toplam),
+                "hucre_sayisi": sum(len(h) for h in self.hucreler.values()),
+                **{f"farkli_{b}": len(self.belge_sayilari[b]) for b in self.BOYUTLAR},
+            }
+
+class _ZamanlanmisIs:
+    __slots__ = ("istemci", "sinif", "maliyet", "giris", "gelecek")
+    
+    def __init__(self, istemci: str, sinif: str, maliyet: float, gelecek):
+        self.istemci = istemci
+        self.sinif = sinif
+        self.maliyet = maliyet
+        self.giris = time.monotonic()
+        self.gelecek = gelecek
+
+class IsZamanlayici:
+    """CPU ağırlıklı işler için istemciler arası adil, öncelikli zamanlayıcı
+    
+    İşler öncelik sınıfına (etkilesimli > normal > toplu) ve istemciye (API
+    anahtarı ya da IP) göre kuyruğa alınır. Yer açıldığında en yüksek öncelikli
+    dolu sınıf seçilir; `yaslanma_sn`'den uzun bekleyen alt sınıf işi öne geçer.
+    Sınıf içinde o ana kadar en az tahmini maliyet (bin karakter) hizmeti almış
+    istemcinin sıradaki işi çalışır; büyük PDF'ler gönderen istemci diğerlerini
+    tıkayamaz. İstemcinin bekleyen+çalışan maliyeti ya da toplam kuyruk maliyeti
+    sınırı aşarsa iş 429 ile reddedilir. Tüm durum olay döngüsü iş parçacığında
+    değiştiği için kilit gerekmez; her işçi süreci kendi zamanlayıcısını tutar.
+    """
+    
+    SINIFLAR = ("etkilesimli", "normal", "toplu")
+    
+    def __init__(self, eszamanli: int = 2, istemci_siniri: float = 1000.0,
+                 kuyruk_siniri: float = 5000.0, yaslanma_sn: float = 30.0):
+        self.eszamanli = max(1, eszamanli)
+        self.istemci_siniri = istemci_siniri
+        self.kuyruk_siniri = kuyruk_siniri
+        self.yaslanma_sn = yaslanma_sn
+        self._kuyruklar = {s: OrderedDict() for s in self.SINIFLAR}  # sınıf -> istemci -> deque(iş)
+        self._hizmet = {s: {} for s in self.SINIFLAR}               # sınıf -> istemci -> verilen maliyet
+        self._son_hizmet = {s: 0.0 for s in self.SINIFLAR}
+        self._istemci_maliyeti = Counter()                           # bekleyen + çalışan
+        self._kuyruk_maliyeti = 0.0
+        self._calisan = 0
+        self._birim_suresi = None                                    # maliyet birimi başına sn (EMA)
+        self._beklemeler = {s: deque(maxlen=1000) for s in self.SINIFLAR}
+        self._sayaclar = {s: Counter() for s in self.SINIFLAR}
+    
+    def _kabul_et(self, istemci: str, sinif: str, maliyet: float):
+        """Maliyet sınırlarını kontrol et; ilk iş her zaman kabul edilir (tek büyük iş takılmasın)"""
+        sebep = None
+        mevcut = self._istemci_maliyeti[istemci]
+        if mevcut > 0 and mevcut + maliyet > self.istemci_siniri:
+            sebep = f"istemci başına bekleyen iş sınırı aşıldı ({mevcut:.0f}/{self.istemci_siniri:.0f})"
+        elif self._kuyruk_maliyeti > 0 and self._kuyruk_maliyeti + maliyet > self.kuyruk_siniri:
+            sebep = "sunucu kuyruğu dolu"
+        if sebep is None:
+            return
+        self._sayaclar[sinif]["reddedilen"] += 1
+        bekleme = 5
+        if self._birim_suresi:
+            bekleme = math.ceil((self._kuyruk_maliyeti + mevcut) * self._birim_suresi / self.eszamanli)
+        raise HTTPException(
+            status_code=429,
+            detail=f"❌ Çok fazla istek: {sebep}. Lütfen daha sonra tekrar deneyin.",
+            headers={"Retry-After": str(min(max(bekleme, 1), 300))}
+        )
+    
+    def _siradaki(self):
+        """Sıradaki işi seç: öncelik (yaşlanmayla), sonra en az hizmet almış istemci"""
+        simdi = time.monotonic()
+        secilen = None
+        for sinif in self.SINIFLAR:
+            kuyruk = self._kuyruklar[sinif]
+            if not kuyruk:
+                continue
+            if secilen is None:
+                secilen = sinif
+            elif simdi - min(isler[0].giris for isler in kuyruk.values()) > self.yaslanma_sn:
+                secilen = sinif
+                break
+        if secilen is None:
+            return None
         
-        # Metni temizle
-        temiz_metin = self.metni_temizle(metin)
+        kuyruk = self._kuyruklar[secilen]
+        hizmet = self._hizmet[secilen]
+        istemci = min(kuyruk, key=lambda i: hizmet[i])
+        isler = kuyruk[istemci]
+        is_ = isler.popleft()
+        if not isler:
+            del kuyruk[istemci]
+        self._son_hizmet[secilen] = hizmet[istemci]
+        hizmet[istemci] += is_.maliyet
+        return is_
+    
+    def _dagit(self):
+        while self._calisan < self.eszamanli:
+            is_ = self._siradaki()
+            if is_ is None:
+                return
+            self._calisan += 1
+            self._kuyruk_maliyeti -= is_.maliyet
+            is_.gelecek.set_result(None)
+    
+    def _kuyruga_al(self, is_: "_ZamanlanmisIs"):
+        kuyruk = self._kuyruklar[is_.sinif]
+        hizmet = self._hizmet[is_.sinif]
+        if is_.istemci not in kuyruk:
+            # Boşta kalan istemci kredi biriktirmesin: en az hizmet alan bekleyenin seviyesinden başlar
+            taban = min((hizmet[i] for i in kuyruk), default=self._son_hizmet[is_.sinif])
+            hizmet[is_.istemci] = max(hizmet.get(is_.istemci, 0.0), taban)
+            if len(hizmet) > 10000:
+                for eski in [i for i, h in hizmet.items() if h <= taban and i not in kuyruk]:
+                    del hizmet[eski]
+                hizmet[is_.istemci] = max(hizmet.get(is_.istemci, 0.0), taban)
+            kuyruk[is_.istemci] = deque()
+        kuyruk[is_.istemci].append(is_)
+        self._istemci_maliyeti[is_.istemci] += is_.maliyet
+        self._kuyruk_maliyeti += is_.maliyet
+    
+    def _maliyeti_dus(self, is_: "_ZamanlanmisIs"):
+        self._istemci_maliyeti[is_.istemci] -= is_.maliyet
+        if self._istemci_maliyeti[is_.istemci] <= 1e-9:
+            del self._istemci_maliyeti[is_.istemci]
+    
+    @contextlib.asynccontextmanager
+    async def sira(self, istemci: str, sinif: str, maliyet: float):
+        """Sıra gelene kadar bekle, blok boyunca bir çalışma yeri tut
         
-        if len(temiz_metin) < 50:
-            return "⚠️ Temizlenen metin çok kısa. Lütfen daha uzun bir metin sağlayın."
+        Dönen sözlükte kuyrukta bekleme süresi (bekleme_ms) bulunur.
+        """
+        import asyncio
         
-        # Basit özetleme algoritması kullan
-        ozet = self.basit_ozetle(temiz_metin)
+        self._kabul_et(istemci, sinif, maliyet)
+        is_ = _ZamanlanmisIs(istemci, sinif, maliyet, asyncio.get_running_loop().create_future())
+        self._kuyruga_al(is_)
+        self._dagit()
+        try:
+            await is_.gelecek
+        except asyncio.CancelledError:
+            # İstemci bağlantıyı kesti: yer verildiyse bırak, verilmediyse kuyruktan çıkar
+            self._sayaclar[sinif]["iptal"] += 1
+            if is_.gelecek.done() and not is_.gelecek.cancelled():
+                self._calisan -= 1
+            else:
+                isler = self._kuyruklar[sinif].get(istemci)
+                if isler is not None and is_ in isler:
+                    isler.remove(is_)
+                    if not isler:
+                        del self._kuyruklar[sinif][istemci]
+                self._kuyruk_maliyeti -= maliyet
+            self._maliyeti_dus(is_)
+            self._dagit()
+            raise
         
-        if not ozet or len(ozet.strip()) < 20:
-            return "⚠️ Özet oluşturulamadı. Metninizi kontrol edip tekrar deneyin."
-            
-        return ozet
+        bekleme_ms = (time.monotonic() - is_.giris) * 1000
+        self._beklemeler[sinif].append(bekleme_ms)
+        baslangic = time.monotonic()
+        try:
+            yield {"sinif": sinif, "maliyet": round(maliyet, 1), "bekleme_ms": round(bekleme_ms, 1)}
+        finally:
+            sure = time.monotonic() - baslangic
+            if maliyet > 0:
+                birim = sure / maliyet
+                self._birim_suresi = birim if self._birim_suresi is None else 0.9 * self._birim_suresi + 0.1 * birim
+            self._sayaclar[sinif]["tamamlanan"] += 1
+            self._calisan -= 1
+            self._maliyeti_dus(is_)
+            self._dagit()
+    
+    def istatistik(self) -> Dict:
+        siniflar = {}
+        for sinif in self.SINIFLAR:
+            beklemeler = sorted(self._beklemeler[sinif])
+            yuzdelik = lambda oran: round(beklemeler[min(len(beklemeler) - 1, int(oran * len(beklemeler)))], 1) if beklemeler else 0.0
+            siniflar[sinif] = {
+                "kuyrukta": sum(len(isler) for isler in self._kuyruklar[sinif].values()),
+                "bekleyen_istemci": len(self._kuyruklar[sinif]),
+                "tamamlanan": self._sayaclar[sinif]["tamamlanan"],
+                "reddedilen": self._sayaclar[sinif]["reddedilen"],
+                "iptal": self._sayaclar[sinif]["iptal"],
+                "bekleme_p50_ms": yuzdelik(0.50),
+                "bekleme_p95_ms": yuzdelik(0.95),
+                "bekleme_maks_ms": round(beklemeler[-1], 1) if beklemeler else 0.0,
+            }
+        return {
+            "eszamanli": self.eszamanli,
+            "calisan": self._calisan,
+            "kuyruk_maliyeti": round(self._kuyruk_maliyeti, 1),
+            "birim_suresi_ms": round(self._birim_suresi * 1000, 2) if self._birim_suresi else None,
+            "siniflar": siniflar,
+            "en_yuklu_istemciler": [
+                {"istemci": i, "maliyet": round(m, 1)} for i, m in self._istemci_maliyeti.most_common(5)
+            ],
+            "sinirlar": {"istemci": self.istemci_siniri, "kuyruk": self.kuyruk_siniri,
+                         "yaslanma_sn": self.yaslanma_sn},
+        }
+
+def _istemci_kimligi(istek: Request) -> str:
+    """Adil sıralama için istemci: API anahtarı (özeti) varsa o, yoksa IP"""
+    anahtar = istek.headers.get("x-api-key")
+    if anahtar:
+        return "anahtar:" + hashlib.sha256(anahtar.encode("utf-8")).hexdigest()[:12]
+    return "ip:" + (istek.client.host if istek.client else "bilinmiyor")
+
+async def _zamanla(istek: Request, sinif: str, maliyet: float, fonksiyon, *argumanlar):
+    """İşi zamanlayıcıdan yer alarak iş parçacığı havuzunda çalıştır → (sonuç, yer bilgisi)
+    
+    İş parçacığı durdurulamaz; istemci bağlantıyı keserse (iptal) yer, iş parçacığı
+    bitene kadar tutulur ki eşzamanlılık sınırı gerçekten çalışan işleri saysın.
+    """
+    import asyncio
+    import anyio
+    from starlette.concurrency import run_in_threadpool
+    
+    async with is_zamanlayici.sira(_istemci_kimligi(istek), sinif, maliyet) as yer:
+        gorev = asyncio.ensure_future(run_in_threadpool(fonksiyon, *argumanlar))
+        try:
+            return await asyncio.shield(gorev), yer
+        except asyncio.CancelledError:
+            while not gorev.done():
+                with anyio.CancelScope(shield=True), contextlib.suppress(asyncio.CancelledError):
+                    await asyncio.wait({gorev})
+            if not gorev.cancelled():
+                gorev.exception()  # sonuç kimseye gitmeyecek; "alınmamış hata" uyarısı olmasın
+            raise
 
 # Global özetleyici ve YÖK arayıcı örnekleri
+ozet_onbellegi = OzetOnbellegi(**OZET_ONBELLEGI)
+artimli_belgeler = LruOnbellek(ARTIMLI_BELGE_KARAKTER, agirlik=lambda belge: 2 * belge.temiz_uzunluk + 1)
 ozetleyici = MetinOzetleyici()
-yok_arayici = YokTezArayici()
+bolum_ayirici = TezBolumAyirici()
+benzerlik_dizini = BenzerlikDizini(**BENZERLIK_AYARLARI)
+kelime_toplamlari = KelimeToplamlari()
+yok_arayici = YokTezArayici(benzerlik_dizini, kelime_toplamlari)
+sonuc_deposu = SonucDeposu()
+is_zamanlayici = IsZamanlayici(**ZAMANLAYICI_AYARLARI)
+
+def sonucu_kaydet(kaynak: str, ozet: str, anahtar_kelimeler: list, istatistikler: Dict,
+                  parti: str = None, **ek_alanlar):
+    """Sonucu depoya yaz; depo hatası isteği bozmaz"""
+    if not SONUC_KAYDET:
+        return None
+    try:
+        return sonuc_deposu.ekle(kaynak, ozet, anahtar_kelimeler, istatistikler, parti, **ek_alanlar)
+    except OSError as e:
+        logger.warning(f"Sonuç kaydedilemedi: {e}")
+        return None
+
+# Isınma durumu - ağır bağımlılıklar yüklendi mi?
+isinma_durumu = {"tamamlandi": False, "sureler_ms": {}, "zaman": None}
+
+def isinma_yap() -> Dict:
+    """Tüm ağır bağımlılıkları yükle; tekrar çağrılırsa sadece durumu döndür"""
+    if not isinma_durumu["tamamlandi"]:
+        sureler = {}
+        sureler.update(ozetleyici.isit())
+        sureler.update(yok_arayici.isit())
+        baslangic = time.perf_counter()
+        benzerlik_dizini.isit()
+        sureler["benzerlik_tablolari"] = round((time.perf_counter() - baslangic) * 1000, 1)
+        isinma_durumu["sureler_ms"] = sureler
+        isinma_durumu["tamamlandi"] = True
+        isinma_durumu["zaman"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logger.info(f"Isınma tamamlandı: {sureler}")
+    return isinma_durumu
 
 @uygulama.get("/")
 async def ana_sayfa():
@@ -582,6 +2903,11 @@ async def ana_sayfa():
         "endpoint_ler": {
             "pdf_yukle": "/pdf-yukle/",
             "metin_ozetle": "/metin-ozetle/", 
+            "isinma": "/isinma/",
+            "zamanlayici": "/zamanlayici/",
+            "toplu_aktarma": ["/export-ndjson/", "/export-csv/", "/export-zip/"],
+            "benzer_tezler": "/benzer-tezler/",
+            "anahtar_kelime_egilimleri": "/anahtar-kelime-egilimleri/",
             "dokumantasyon": "/docs"
         },
         "ozellikler": {
@@ -592,9 +2918,36 @@ async def ana_sayfa():
         }
     }
 
+@uygulama.post("/isinma/")
+async def isinma():
+    """Ağır kütüphaneleri önceden yükle (açılıştan sonra tetiklenebilir)"""
+    from starlette.concurrency import run_in_threadpool
+    
+    durum = await run_in_threadpool(isinma_yap)
+    return HizliJSONResponse(content={
+        "durum": "✅ Hazır",
+        "isinma": durum,
+        "basarili": True,
+        "mesaj": "🔥 Bağımlılıklar yüklendi, API ısındı!"
+    })
+
 @uygulama.post("/pdf-yukle/")
-async def pdf_yukle(dosya: UploadFile = File(...)):
-    """PDF yükleyip Türkçe özetleme"""
+async def pdf_yukle(istek: Request, dosya: UploadFile = File(...), ozet_cumle_sayisi: int = Query(5, ge=1),
+                    maksimum_sayfa: int = Query(None, ge=1), maksimum_karakter: int = Query(None, ge=1),
+                    erken_durdur: bool = False, parti_id: str = None, bolumler: str = None,
+                    ozet_uzunluklari: str = None, karakter_butceleri: str = None,
+                    benzer_sayisi: int = Query(5, ge=0)):
+    """PDF yükleyip Türkçe özetleme
+    
+    `bolumler`: işlenecek tez bölümleri (virgülle, ör. "ozet,giris,sonuc"); "tum" tamamını işler.
+    `ozet_uzunluklari` / `karakter_butceleri`: ek özetler için cümle sayıları / karakter
+    bütçeleri (virgülle, ör. "3,5,10"); hepsi tek puanlamadan üretilir.
+    `benzer_sayisi`: tezin özetine en benzer kaç kayıtlı tezin döneceği (0: arama yok).
+    `erken_durdur`: özet cümlesi başına yeterli metin toplanınca okumayı bırak (hızlı ama
+    tezin sonraki bölümleri, ör. sonuç, okunmayabilir); varsayılan olarak sadece genel
+    sayfa/karakter limitleri uygulanır.
+    `parti_id` verilen yüklemeler toplu iş sayılır ve etkileşimli isteklerin arkasından işlenir.
+    """
     
     # Dosya kontrolü
     if not dosya.filename.endswith('.pdf'):
@@ -603,52 +2956,29 @@ async def pdf_yukle(dosya: UploadFile = File(...)):
             detail="❌ Hata: Sadece PDF dosyaları kabul edilir (.pdf uzantılı)"
         )
     
+    # Limitler - genel sınırlar; erken_durdur ile istenen özet için yeterli metinde durulur
+    karakter_limiti = min(
+        maksimum_karakter or PDF_LIMITLERI["maksimum_karakter"],
+        PDF_LIMITLERI["maksimum_karakter"]
+    )
+    if erken_durdur:
+        karakter_limiti = min(karakter_limiti, ozet_cumle_sayisi * PDF_LIMITLERI["cumle_basina_karakter"])
+    sayfa_limiti = min(
+        maksimum_sayfa or PDF_LIMITLERI["maksimum_sayfa"],
+        PDF_LIMITLERI["maksimum_sayfa"]
+    )
+    
+    # Tahmini maliyet (bin karakter): limitler ve dosya boyutuyla sınırlı okunacak metin
+    tahmini_karakter = min(karakter_limiti, sayfa_limiti * 2000)
+    if getattr(dosya, "size", None):
+        tahmini_karakter = min(tahmini_karakter, dosya.size * 4)
+    
     try:
-        # Dosyayı oku
-        icerik = await dosya.read()
-        pdf_dosyasi = io.BytesIO(icerik)
-        
-        # Metni çıkar
-        logger.info(f"PDF işleniyor: {dosya.filename}")
-        metin = ozetleyici.pdf_den_metin_cikar(pdf_dosyasi)
-        
-        if not metin:
-            raise HTTPException(
-                status_code=400, 
-                detail="❌ Hata: PDF'den metin çıkarılamadı. Dosya bozuk olabilir."
-            )
-        
-        # Özetle
-        ozet = ozetleyici.metin_ozetle(metin)
-        
-        # Anahtar kelimeleri çıkar
-        anahtar_kelimeler = ozetleyici.anahtar_kelime_cikar(metin)
-        
-        # İstatistikler
-        istatistikler = {
-            "orijinal_uzunluk": len(metin),
-            "ozet_uzunluk": len(ozet),
-            "sikistirma_orani": round(len(ozet) / len(metin) * 100, 2),
-            "kelime_sayisi": len(metin.split()),
-            "ozet_kelime_sayisi": len(ozet.split()),
-            "sayfa_tahmini": round(len(metin) / 2000)  # Sayfa başına ~2000 karakter
-        }
-        
-        sonuc = {
-            "durum": "✅ Başarılı",
-            "dosya_adi": dosya.filename,
-            "islem_zamani": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "orijinal_metin_onizleme": metin[:300] + "..." if len(metin) > 300 else metin,
-            "ozet": ozet,
-            "anahtar_kelimeler": anahtar_kelimeler[:10],  # İlk 10 anahtar kelime
-            "istatistikler": istatistikler,
-            "basarili": True,
-            "mesaj": f"📄 '{dosya.filename}' başarıyla özetlendi!"
-        }
-        
-        logger.info(f"PDF başarıyla işlendi: {dosya.filename}")
-        return JSONResponse(content=sonuc)
-        
+        sonuc, yer = await _zamanla(
+            istek, "toplu" if parti_id else "normal", tahmini_karakter / 1000, _pdf_isle,
+            dosya, ozet_cumle_sayisi, karakter_limiti, sayfa_limiti, parti_id, bolumler,
+            ozet_uzunluklari, karakter_butceleri, benzer_sayisi
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -657,10 +2987,201 @@ async def pdf_yukle(dosya: UploadFile = File(...)):
             status_code=500, 
             detail=f"❌ İşlem sırasında hata oluştu: {str(e)}"
         )
+    
+    sonuc["istatistikler"]["zamanlama"] = yer
+    logger.info(f"PDF başarıyla işlendi: {dosya.filename}")
+    return HizliJSONResponse(content=sonuc)
+
+def _pdf_isle(dosya: UploadFile, ozet_cumle_sayisi: int, karakter_limiti: int, sayfa_limiti: int,
+              parti_id: str, bolumler: str, ozet_uzunluklari: str, karakter_butceleri: str,
+              benzer_sayisi: int) -> Dict:
+    """PDF'den metin çıkarıp özetle (zamanlayıcının verdiği iş parçacığında çalışır)"""
+    with _tepe_bellek_olcumu():
+        return _pdf_ozetle(dosya, ozet_cumle_sayisi, karakter_limiti, sayfa_limiti, parti_id, bolumler,
+                           ozet_uzunluklari, karakter_butceleri, benzer_sayisi)
+
+def _pdf_ozetle(dosya: UploadFile, ozet_cumle_sayisi: int, karakter_limiti: int, sayfa_limiti: int,
+                parti_id: str, bolumler: str, ozet_uzunluklari: str, karakter_butceleri: str,
+                benzer_sayisi: int) -> Dict:
+    # Metni çıkar - yüklenen dosya belleğe kopyalanmadan okunur
+    # (büyük yüklemeler diskteki geçici dosyada kalır)
+    logger.info(f"PDF işleniyor: {dosya.filename}")
+    secilen_turler = _bolum_secimi(bolumler)
+    cikarim = ozetleyici.pdf_den_metin_akisi(
+        dosya.file, sayfa_limiti, karakter_limiti,
+        bolum_ayirici.durdurma_kontrolu(secilen_turler) if secilen_turler else None
+    )
+    # Tam metin sadece bu değişkende tutulur; bölüm seçiminden sonra bırakılır
+    metin = cikarim.pop("metin")
+    
+    if not metin:
+        raise HTTPException(
+            status_code=400, 
+            detail="❌ Hata: PDF'den metin çıkarılamadı. Dosya bozuk olabilir."
+        )
+    
+    # Sadece seçilen bölümler özetlenir
+    metin_uzunlugu = len(metin)
+    onizleme = metin[:300] + "..." if metin_uzunlugu > 300 else metin
+    bolum_secimi = _bolumleri_sec(metin, secilen_turler)
+    # Benzerlik için tezin özet/abstract bölümü (bulunamazsa işlenen metin)
+    tez_ozeti = None
+    if benzerlik_dizini.etkin:
+        tez_ozeti = bolum_ayirici.sec(metin, ["ozet", "abstract"])["metin"]
+        if tez_ozeti is metin:
+            tez_ozeti = None
+    metin = bolum_secimi.pop("metin")
+    
+    # Özetle
+    analiz = ozetleyici.belge_analizi(metin)
+    if benzerlik_dizini.etkin:
+        benzerlik_dizini.ekle(analiz.belge_hash, tez_ozeti or metin, kaynak="pdf", baslik=dosya.filename)
+        tez_ozeti = None
+    ozet = ozetleyici.metin_ozetle(metin, maksimum_cumle=ozet_cumle_sayisi, analiz=analiz)
+    ozetler = ozetleyici.coklu_ozet(
+        metin, analiz, _tamsayi_listesi(ozet_uzunluklari), _tamsayi_listesi(karakter_butceleri)
+    )
+    
+    # Anahtar kelimeleri çıkar
+    anahtar_kelimeler = ozetleyici.anahtar_kelime_cikar(metin)
+    
+    # İstatistikler - kelime sayısı okuma sırasında ham sayfa metninden (boşlukla ayrılmış) hesaplandı
+    islenen_uzunluk = len(metin)
+    del metin
+    
+    istatistikler = {
+        "orijinal_uzunluk": metin_uzunlugu,
+        "ozet_uzunluk": len(ozet),
+        "sikistirma_orani": round(len(ozet) / metin_uzunlugu * 100, 2),
+        "kelime_sayisi": cikarim["kelime_sayisi"],
+        "ozet_kelime_sayisi": len(ozet.split()),
+        "sayfa_tahmini": round(metin_uzunlugu / 2000),  # Sayfa başına ~2000 karakter
+        "toplam_sayfa": cikarim["toplam_sayfa"],
+        "islenen_sayfa": cikarim["islenen_sayfa"],
+        "kesildi": cikarim["kesildi"],
+        "pdf_arka_ucu": cikarim["arka_uc"],
+        "kalip_temizligi": cikarim["kalip_temizligi"],
+        "islenen_uzunluk": islenen_uzunluk,
+        "bolumler": bolum_secimi,
+        "tepe_bellek_mb": _tepe_bellek_mb()
+    }
+    
+    sonuc = {
+        "durum": "✅ Başarılı",
+        "dosya_adi": dosya.filename,
+        "islem_zamani": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "orijinal_metin_onizleme": onizleme,
+        "ozet": ozet,
+        "ozetler": ozetler,
+        "belge_hash": analiz.belge_hash,
+        "anahtar_kelimeler": anahtar_kelimeler[:10],  # İlk 10 anahtar kelime
+        "istatistikler": istatistikler,
+        "basarili": True,
+        "mesaj": f"📄 '{dosya.filename}' başarıyla özetlendi!"
+    }
+    if benzerlik_dizini.etkin and benzer_sayisi > 0:
+        sonuc["benzer_tezler"] = benzerlik_dizini.benzerleri_bul(
+            kimlik=analiz.belge_hash, k=benzer_sayisi
+        ) or []
+    sonuc["kayit_id"] = sonucu_kaydet(
+        "pdf", ozet, sonuc["anahtar_kelimeler"], istatistikler, parti_id,
+        dosya_adi=dosya.filename
+    )
+    return sonuc
+
+def _bolum_secimi(bolumler) -> list:
+    """İstekteki bölüm seçimini listeye çevir; "tum" ise boş liste (bölümleme yok)"""
+    if bolumler is None:
+        return list(VARSAYILAN_BOLUMLER)
+    if isinstance(bolumler, str):
+        bolumler = bolumler.split(",")
+    bolumler = [b.strip() for b in bolumler if b and b.strip()]
+    if not bolumler or "tum" in bolumler:
+        return []
+    return bolumler
+
+def _bolumleri_sec(metin: str, secilen_turler: list) -> Dict:
+    """Metinden seçilen bölümleri al (seçim yoksa metin aynen döner)"""
+    if not secilen_turler:
+        return {"metin": metin, "bolumler": [], "islenen_bolumler": ["tum"], "atlanan_karakter": 0}
+    return bolum_ayirici.sec(metin, secilen_turler)
+
+def _tamsayi_listesi(deger) -> list:
+    """"3,5,10" ya da [3, 5, 10] biçimindeki değeri pozitif tamsayı listesine çevir"""
+    if not deger:
+        return []
+    if isinstance(deger, (int, str)):
+        deger = str(deger).split(",")
+    try:
+        return [int(d) for d in deger if int(d) > 0]
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail=f"❌ Hata: Geçersiz uzunluk listesi: {deger}")
+
+def _pozitif_tamsayi(veri: dict, alan: str, varsayilan=None):
+    """JSON gövdesindeki alanı pozitif tamsayıya çevir; geçersizse 400 döndür"""
+    deger = veri.get(alan)
+    if deger is None:
+        return varsayilan
+    try:
+        if isinstance(deger, bool) or int(deger) != float(deger) or int(deger) < 1:
+            raise ValueError
+        return int(deger)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=400, detail=f"❌ Hata: '{alan}' pozitif bir tamsayı olmalı (gelen: {deger!r})"
+        )
+
+@uygulama.get("/ozet-uzunluk/")
+async def ozet_uzunluk(belge_hash: str, cumle_sayisi: int = Query(5, ge=1),
+                       karakter_butcesi: int = Query(None, ge=1)):
+    """Daha önce analiz edilen belgenin özetini, metni yeniden göndermeden başka uzunlukta al"""
+    if not OzetOnbellegi.HASH.fullmatch(belge_hash):
+        raise HTTPException(
+            status_code=400, detail="❌ Hata: 'belge_hash' 64 karakterlik küçük harfli sha256 olmalı"
+        )
+    analiz = ozet_onbellegi.al(belge_hash)
+    if analiz is None:
+        raise HTTPException(
+            status_code=404,
+            detail="❌ Belge önbellekte yok: önbellekten düşmüş ya da başka bir sunucuda analiz edilmiş "
+                   "olabilir (TEZ_OZET_ONBELLEK_DIZINI boşsa her işçi sadece kendi analiz ettiği "
+                   "belgeleri bilir). Metni /metin-ozetle/ ile tekrar gönderin."
+        )
+    ozet = analiz.ozet(cumle_sayisi, karakter_butcesi)
+    return HizliJSONResponse(content={
+        "durum": "✅ Başarılı",
+        "belge_hash": belge_hash,
+        "cumle_sayisi": cumle_sayisi,
+        "karakter_butcesi": karakter_butcesi,
+        "ozet": ozet,
+        "ozet_uzunluk": len(ozet),
+        "basarili": True
+    })
+
+@uygulama.get("/zamanlayici/")
+async def zamanlayici_durumu():
+    """İş zamanlayıcısı: sınıf başına kuyruk, bekleme süreleri (p50/p95) ve reddedilen işler"""
+    return HizliJSONResponse(content={
+        "durum": "✅ Aktif",
+        **is_zamanlayici.istatistik(),
+        "zaman": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    })
+
+@uygulama.get("/pdf-arka-uclar/")
+async def pdf_arka_uclar():
+    """Kurulu PDF çıkarma arka uçları ve deneme sırası"""
+    return {
+        "durum": "✅ Aktif",
+        "kurulu": [ad for ad, arka_uc in PDF_ARKA_UCLARI.items() if arka_uc.kurulu_mu()],
+        "sira": pdf_arka_uc_sirasi(),
+        "kalibrasyon_sirasi": list(_kalibrasyon_sirasi()),
+        "ortam_sirasi": PDF_ARKA_UC_SIRASI,
+        "mesaj": "📄 PDF arka uçları hazır"
+    }
 
 @uygulama.post("/metin-ozetle/")
-async def metin_ozetle_endpoint(veri: dict):
-    """Direkt metin özetleme endpoint'i"""
+async def metin_ozetle_endpoint(veri: dict, istek: Request):
+    """Direkt metin özetleme endpoint'i (etkileşimli öncelikle zamanlanır)"""
     metin = veri.get("metin", "")
     
     if not metin:
@@ -675,38 +3196,77 @@ async def metin_ozetle_endpoint(veri: dict):
             detail="❌ Hata: Metin çok kısa. En az 50 karakter olmalı."
         )
     
+    veri = {
+        **veri,
+        "cumle_sayisi": _pozitif_tamsayi(veri, "cumle_sayisi", 5),
+        "maksimum_uzunluk": _pozitif_tamsayi(veri, "maksimum_uzunluk"),
+    }
+    
     try:
-        ozet = ozetleyici.metin_ozetle(metin)
-        anahtar_kelimeler = ozetleyici.anahtar_kelime_cikar(metin)
-        
-        # İstatistikler
-        istatistikler = {
-            "orijinal_uzunluk": len(metin),
-            "ozet_uzunluk": len(ozet),
-            "sikistirma_orani": round(len(ozet) / len(metin) * 100, 2),
-            "kelime_sayisi": len(metin.split()),
-            "ozet_kelime_sayisi": len(ozet.split())
-        }
-        
-        sonuc = {
-            "durum": "✅ Başarılı",
-            "orijinal_metin": metin,
-            "ozet": ozet,
-            "anahtar_kelimeler": anahtar_kelimeler[:10],
-            "istatistikler": istatistikler,
-            "islem_zamani": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "basarili": True,
-            "mesaj": "📝 Metin başarıyla özetlendi!"
-        }
-        
-        return JSONResponse(content=sonuc)
-        
+        sonuc, yer = await _zamanla(istek, "etkilesimli", len(metin) / 1000, _metin_ozetle_isle, metin, veri)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Metin özetleme hatası: {e}")
         raise HTTPException(
             status_code=500, 
             detail=f"❌ Özetleme sırasında hata oluştu: {str(e)}"
         )
+    
+    sonuc["istatistikler"]["zamanlama"] = yer
+    return HizliJSONResponse(content=sonuc)
+
+def _metin_ozetle_isle(metin: str, veri: dict) -> Dict:
+    """Metni özetle (zamanlayıcının verdiği iş parçacığında çalışır)"""
+    # Tez yapısı bulunursa sadece seçilen bölümler işlenir
+    bolum_secimi = _bolumleri_sec(metin, _bolum_secimi(veri.get("bolumler")))
+    islenecek_metin = bolum_secimi.pop("metin")
+    
+    # belge_id verilirse önceki sürüme göre sadece değişen cümleler işlenir
+    artimli = None
+    if veri.get("belge_id"):
+        analiz, artimli = ozetleyici.artimli_belge_analizi(str(veri["belge_id"]), islenecek_metin)
+    else:
+        analiz = ozetleyici.belge_analizi(islenecek_metin)
+    ozet = ozetleyici.metin_ozetle(
+        islenecek_metin, veri.get("maksimum_uzunluk"), veri.get("cumle_sayisi", 5), analiz
+    )
+    ozetler = ozetleyici.coklu_ozet(
+        islenecek_metin, analiz,
+        _tamsayi_listesi(veri.get("ozet_uzunluklari")),
+        _tamsayi_listesi(veri.get("karakter_butceleri"))
+    )
+    anahtar_kelimeler = ozetleyici.anahtar_kelime_cikar(islenecek_metin)
+    
+    # İstatistikler
+    istatistikler = {
+        "orijinal_uzunluk": len(metin),
+        "ozet_uzunluk": len(ozet),
+        "sikistirma_orani": round(len(ozet) / len(metin) * 100, 2),
+        "kelime_sayisi": len(metin.split()),  # /pdf-yukle/ ile aynı: ham metnin boşlukla ayrılmış kelimeleri
+        "ozet_kelime_sayisi": len(ozet.split()),
+        "islenen_uzunluk": len(islenecek_metin),
+        "bolumler": bolum_secimi
+    }
+    if artimli is not None:
+        istatistikler["artimli"] = artimli
+    
+    sonuc = {
+        "durum": "✅ Başarılı",
+        "orijinal_metin": metin,
+        "ozet": ozet,
+        "ozetler": ozetler,
+        "belge_hash": analiz.belge_hash,
+        "anahtar_kelimeler": anahtar_kelimeler[:10],
+        "istatistikler": istatistikler,
+        "islem_zamani": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "basarili": True,
+        "mesaj": "📝 Metin başarıyla özetlendi!"
+    }
+    sonuc["kayit_id"] = sonucu_kaydet(
+        "metin", ozet, sonuc["anahtar_kelimeler"], istatistikler, veri.get("parti_id")
+    )
+    return sonuc
 
 @uygulama.post("/export-txt/")
 async def txt_disarı_aktar(disarı_aktarma_verisi: dict):
@@ -714,11 +3274,23 @@ async def txt_disarı_aktar(disarı_aktarma_verisi: dict):
     try:
         from fastapi.responses import PlainTextResponse
         
-        ozet = disarı_aktarma_verisi.get("ozet", "")
-        anahtar_kelimeler = disarı_aktarma_verisi.get("anahtar_kelimeler", [])
-        istatistikler = disarı_aktarma_verisi.get("istatistikler", {})
+        icerik = ozet_metni_olustur(disarı_aktarma_verisi)
+        
+        return PlainTextResponse(
+            content=icerik, 
+            headers={"Content-Disposition": "attachment; filename=tez-ozeti.txt"}
+        )
         
-        icerik = f"""TEZ ÖZETİ
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"TXT dışarı aktarma hatası: {str(e)}")
+
+def ozet_metni_olustur(disarı_aktarma_verisi: Dict) -> str:
+    """Özet sonucunu TXT rapor metnine çevir"""
+    ozet = disarı_aktarma_verisi.get("ozet", "")
+    anahtar_kelimeler = disarı_aktarma_verisi.get("anahtar_kelimeler", [])
+    istatistikler = disarı_aktarma_verisi.get("istatistikler", {})
+    
+    return f"""TEZ ÖZETİ
 {'='*50}
 
 📝 ÖZET:
@@ -736,26 +3308,16 @@ async def txt_disarı_aktar(disarı_aktarma_verisi: dict):
 📅 Oluşturulma Tarihi: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}
 🛠️  Oluşturan: Türkçe Tez Özetleyici API
 """
-        
-        return PlainTextResponse(
-            content=icerik, 
-            headers={"Content-Disposition": "attachment; filename=tez-ozeti.txt"}
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"TXT dışarı aktarma hatası: {str(e)}")
 
 @uygulama.post("/export-json/")
 async def json_disarı_aktar(disarı_aktarma_verisi: dict):
     """JSON formatında dışarı aktarma"""
     try:
-        from fastapi.responses import JSONResponse
-        
         disarı_aktarma_verisi["disarı_aktarma_tarihi"] = datetime.now().isoformat()
         disarı_aktarma_verisi["biçim"] = "JSON"
         disarı_aktarma_verisi["sürüm"] = "1.0"
         
-        return JSONResponse(
+        return HizliJSONResponse(
             content=disarı_aktarma_verisi,
             headers={"Content-Disposition": "attachment; filename=tez-ozeti.json"}
         )
@@ -763,6 +3325,121 @@ async def json_disarı_aktar(disarı_aktarma_verisi: dict):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"JSON dışarı aktarma hatası: {str(e)}")
 
+# TOPLU DIŞA AKTARMA - kayıtlar depodan satır satır akıtılır (chunked transfer)
+
+AKIS_PARCA_BOYUTU = 64 * 1024
+CSV_SUTUNLARI = ["id", "zaman", "kaynak", "parti", "dosya_adi", "ozet", "anahtar_kelimeler",
+                 "orijinal_uzunluk", "ozet_uzunluk", "kelime_sayisi"]
+
+def _parcalara_bol(metinler):
+    """Küçük metin parçalarını ~64KB'lık bayt bloklarına topla"""
+    tampon = []
+    boyut = 0
+    for metin in metinler:
+        tampon.append(metin)
+        boyut += len(metin)
+        if boyut >= AKIS_PARCA_BOYUTU:
+            yield "".join(tampon).encode("utf-8")
+            tampon = []
+            boyut = 0
+    if tampon:
+        yield "".join(tampon).encode("utf-8")
+
+def _ndjson_satirlari(kayitlar):
+    for kayit in kayitlar:
+        yield json.dumps(kayit, ensure_ascii=False) + "\n"
+
+def _csv_satirlari(kayitlar):
+    satir_tamponu = io.StringIO()
+    yazici = csv.writer(satir_tamponu)
+    yield "\ufeff"  # Excel'in Türkçe karakterleri doğru açması için BOM
+    yazici.writerow(CSV_SUTUNLARI)
+    for kayit in kayitlar:
+        istatistikler = kayit.get("istatistikler") or {}
+        yazici.writerow([
+            kayit.get("id"), kayit.get("zaman"), kayit.get("kaynak"), kayit.get("parti") or "",
+            kayit.get("dosya_adi") or "", kayit.get("ozet"),
+            "; ".join(kayit.get("anahtar_kelimeler") or []),
+            istatistikler.get("orijinal_uzunluk", ""), istatistikler.get("ozet_uzunluk", ""),
+            istatistikler.get("kelime_sayisi", "")
+        ])
+        yield satir_tamponu.getvalue()
+        satir_tamponu.seek(0)
+        satir_tamponu.truncate(0)
+
+class _AkisTamponu(io.RawIOBase):
+    """zipfile'ın yazdığı baytları toplayıp parça parça teslim eden geri sarılamaz akış"""
+    
+    def __init__(self):
+        self._parcalar = []
+        self._konum = 0
+        self.bekleyen = 0
+    
+    def writable(self):
+        return True
+    
+    def write(self, veri):
+        self._parcalar.append(bytes(veri))
+        self._konum += len(veri)
+        self.bekleyen += len(veri)
+        return len(veri)
+    
+    def tell(self):
+        return self._konum
+    
+    def bosalt(self) -> bytes:
+        veri = b"".join(self._parcalar)
+        self._parcalar = []
+        self.bekleyen = 0
+        return veri
+
+def _zip_parcalari(kayitlar):
+    """Her kayıt için JSON + TXT içeren ZIP arşivini akış halinde üret"""
+    tampon = _AkisTamponu()
+    with zipfile.ZipFile(tampon, "w", compression=zipfile.ZIP_DEFLATED) as arsiv:
+        for kayit in kayitlar:
+            with arsiv.open(f"{kayit['id']}.json", "w", force_zip64=True) as girdi:
+                girdi.write(json.dumps(kayit, ensure_ascii=False, indent=2).encode("utf-8"))
+            with arsiv.open(f"{kayit['id']}.txt", "w", force_zip64=True) as girdi:
+                girdi.write(ozet_metni_olustur(kayit).encode("utf-8"))
+            if tampon.bekleyen >= AKIS_PARCA_BOYUTU:
+                yield tampon.bosalt()
+    yield tampon.bosalt()  # merkezi dizin
+
+def _toplu_aktarma_yaniti(govde, medya_tipi: str, dosya_adi: str):
+    from fastapi.responses import StreamingResponse
+    
+    return StreamingResponse(
+        govde,
+        media_type=medya_tipi,
+        headers={"Content-Disposition": f"attachment; filename={dosya_adi}"}
+    )
+
+@uygulama.get("/export-ndjson/")
+async def ndjson_toplu_aktar(parti: str = None, kaynak: str = None, arama: str = None,
+                             limit: int = None):
+    """Kayıtlı analiz sonuçlarını NDJSON olarak akıt"""
+    kayitlar = sonuc_deposu.kayitlari_oku(parti, kaynak, arama, limit)
+    return _toplu_aktarma_yaniti(
+        _parcalara_bol(_ndjson_satirlari(kayitlar)), "application/x-ndjson", "tez-ozetleri.ndjson"
+    )
+
+@uygulama.get("/export-csv/")
+async def csv_toplu_aktar(parti: str = None, kaynak: str = None, arama: str = None,
+                          limit: int = None):
+    """Kayıtlı analiz sonuçlarını CSV olarak akıt"""
+    kayitlar = sonuc_deposu.kayitlari_oku(parti, kaynak, arama, limit)
+    return _toplu_aktarma_yaniti(
+        _parcalara_bol(_csv_satirlari(kayitlar)), "text/csv; charset=utf-8", "tez-ozetleri.csv"
+    )
+
+@uygulama.get("/export-zip/")
+async def zip_toplu_aktar(parti: str = None, kaynak: str = None, arama: str = None,
+                          limit: int = None):
+    """Kayıtlı analiz sonuçlarını ZIP arşivi olarak akıt (kayıt başına JSON + TXT)"""
+    kayitlar = sonuc_deposu.kayitlari_oku(parti, kaynak, arama, limit)
+    return _toplu_aktarma_yaniti(_zip_parcalari(kayitlar), "application/zip", "tez-ozetleri.zip")
+
 @uygulama.get("/batch-process/")
 async def toplu_işlem_bilgi():
     """Toplu işleme bilgileri"""
@@ -791,7 +3468,7 @@ async def metinleri_karşılaştır(karşılaştırma_verisi: dict):
         if not metin1 or not metin2:
             raise HTTPException(status_code=400, detail="İki metin de gereklidir")
         
-        # Temel karşılaştırma
+        # Temel karşılaştırma - boşlukla ayrılmış kelimeler (noktalama kelimeye dahil)
         kelime_sayisi_1 = len(metin1.split())
         kelime_sayisi_2 = len(metin2.split())
         
@@ -812,7 +3489,7 @@ async def metinleri_karşılaştır(karşılaştırma_verisi: dict):
             "analiz_tarihi": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         
-        return JSONResponse(content=sonuc)
+        return HizliJSONResponse(content=sonuc)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Karşılaştırma hatası: {str(e)}")
@@ -826,7 +3503,7 @@ async def yok_tez_ara_get(anahtar_kelime: str, sayfa: int = 1, tur: str = "tum")
         sonuc = yok_arayici.tez_ara(anahtar_kelime, sayfa, tur)
         
         if sonuc.get("durum") == "başarılı":
-            return JSONResponse(content={
+            return HizliJSONResponse(content={
                 "durum": "✅ Başarılı",
                 "arama_terimi": anahtar_kelime,
                 "bulunan_tez_sayisi": sonuc["bulunan_tez_sayisi"],
@@ -856,7 +3533,7 @@ async def yok_tez_ara_post(arama_verisi: dict):
         sonuc = yok_arayici.tez_ara(anahtar_kelime, sayfa, tur)
         
         if sonuc.get("durum") == "başarılı":
-            return JSONResponse(content={
+            return HizliJSONResponse(content={
                 "durum": "✅ Başarılı", 
                 "arama_parametreleri": arama_verisi,
                 "sonuclar": sonuc,
@@ -865,7 +3542,7 @@ async def yok_tez_ara_post(arama_verisi: dict):
                 "mesaj": f"🎯 YÖK Tez araması tamamlandı!"
             })
         else:
-            return JSONResponse(content={
+            return HizliJSONResponse(content={
                 "durum": "⚠️ Kısmi Başarı",
                 "hata": sonuc.get("hata"),
                 "mesaj": "YÖK Tez'e erişimde sorun yaşandı",
@@ -900,8 +3577,13 @@ async def yok_tez_ozet(ozet_verisi: dict):
         
         # Tez detayını özetle
         ozet_sonucu = yok_arayici.tez_ozetle_ve_analiz_et(secilen_tez, ozetleyici)
+        if ozet_sonucu.get("durum") == "özetlendi":
+            sonucu_kaydet(
+                "yok", ozet_sonucu["kisa_ozet"], ozet_sonucu["anahtar_kelimeler"], {},
+                ozet_verisi.get("parti_id"), arama_terimi=anahtar_kelime, tez_bilgisi=secilen_tez
+            )
         
-        return JSONResponse(content={
+        return HizliJSONResponse(content={
             "durum": "✅ Başarılı",
             "arama_terimi": anahtar_kelime,
             "secilen_tez_indeksi": tez_indeksi,
@@ -945,7 +3627,7 @@ async def yok_gelismis_arama(gelismis_arama_verisi: dict):
         )
         
         if sonuc.get("durum") == "başarılı":
-            return JSONResponse(content={
+            return HizliJSONResponse(content={
                 "durum": "✅ Başarılı",
                 "arama_kriterleri": gelismis_arama_verisi,
                 "bulunan_tezler": sonuc["bulunan_tezler"],
@@ -955,7 +3637,7 @@ async def yok_gelismis_arama(gelismis_arama_verisi: dict):
                 "zaman": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             })
         else:
-            return JSONResponse(content={
+            return HizliJSONResponse(content={
                 "durum": "❌ Başarısız",
                 "hata": sonuc.get("hata"),
                 "mesaj": "Gelişmiş arama yapılırken hata oluştu",
@@ -980,7 +3662,7 @@ async def yok_tez_detay(tez_linki: str):
         if detay.get("hata"):
             raise HTTPException(status_code=500, detail=f"❌ Tez detay hatası: {detay['hata']}")
         
-        return JSONResponse(content={
+        return HizliJSONResponse(content={
             "durum": "✅ Başarılı",
             "tez_linki": tez_linki,
             "detaylar": detay,
@@ -1017,6 +3699,7 @@ async def yok_tez_istatistik():
             "maksimum_sayfa": "10 sayfa",
             "timeout": "30 saniye"
         },
+        "onyukleme": yok_arayici.onyukleyici.istatistik(),
         "uyarilar": [
             "⚠️ YÖK Tez erişim politikalarına uygun kullanım",
             "⚠️ PDF indirme çoğu tez için kısıtlı",
@@ -1027,7 +3710,359 @@ async def yok_tez_istatistik():
         "zaman": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
 
+@uygulama.post("/benzer-tezler/")
+async def benzer_tezler(veri: dict):
+    """Metne ya da dizindeki bir teze (kimlik: YÖK linki / PDF belge_hash) benzer tezleri bul
+    
+    Arama yereldir; YÖK'e istek atılmaz. Dizin, /yok-tez-detay/ ve /yok-tez-ozet/ ile
+    alınan özetlerden ve /pdf-yukle/ ile yüklenen tezlerden oluşur.
+    """
+    if not benzerlik_dizini.etkin:
+        raise HTTPException(
+            status_code=503,
+            detail="❌ Benzerlik araması kapalı (numpy gerekli, TEZ_BENZERLIK=1 olmalı)"
+        )
+    metin = veri.get("metin", "")
+    kimlik = veri.get("kimlik")
+    if not metin and not kimlik:
+        raise HTTPException(status_code=400, detail="❌ Hata: 'metin' ya da 'kimlik' alanı gerekli")
+    if not isinstance(metin, str) or (kimlik is not None and not isinstance(kimlik, str)):
+        raise HTTPException(status_code=400, detail="❌ Hata: 'metin' ve 'kimlik' metin olmalı")
+    k = min(_pozitif_tamsayi(veri, "k", 10), 100)
+    
+    from starlette.concurrency import run_in_threadpool
+    
+    benzerler = await run_in_threadpool(benzerlik_dizini.benzerleri_bul, metin, kimlik, k)
+    if benzerler is None:
+        raise HTTPException(status_code=404, detail=f"❌ Dizinde bulunamadı: {kimlik}")
+    return HizliJSONResponse(content={
+        "durum": "✅ Başarılı",
+        "benzer_tezler": benzerler,
+        "dizin": benzerlik_dizini.durum(),
+        "basarili": True,
+        "mesaj": f"🔎 {len(benzerler)} benzer tez bulundu"
+    })
+
+@uygulama.get("/anahtar-kelime-egilimleri/")
+async def anahtar_kelime_egilimleri(n: int = 20, kelime: str = None, grup: str = None,
+                                    yil: str = None, universite: str = None, tur: str = None):
+    """Önceden hesaplanmış anahtar kelime sayımları
+    
+    Filtre (`yil`, `universite`, `tur`) altındaki en sık `n` kelime; `grup` ile her değer
+    için ayrı liste; `kelime` ile o kelimenin `grup` boyutunda (varsayılan yıl) dağılımı.
+    Sayımlar /yok-tez-ozet/ ile alınan tezlerden artımlı olarak güncellenir.
+    """
+    if grup and grup not in KelimeToplamlari.BOYUTLAR:
+        raise HTTPException(
+            status_code=400,
+            detail=f"❌ Hata: 'grup' şunlardan biri olmalı: {', '.join(KelimeToplamlari.BOYUTLAR)}"
+        )
+    baslangic = time.perf_counter()
+    sonuc = kelime_toplamlari.sorgula(max(1, min(n, 200)), kelime, grup,
+                                      yil=yil, universite=universite, tur=tur)
+    return HizliJSONResponse(content={
+        "durum": "✅ Başarılı",
+        "filtreler": {"yil": yil, "universite": universite, "tur": tur},
+        **sonuc,
+        "depo": kelime_toplamlari.durum(),
+        "sure_ms": round((time.perf_counter() - baslangic) * 1000, 2),
+        "basarili": True
+    })
+
+def ithalat_suresi_olc(tekrar: int = 3) -> float:
+    """app modülünün temiz bir süreçte içe aktarılma süresini ölç (ms, en iyi değer)"""
+    import subprocess
+    
+    betik = (
+        "import time; t = time.perf_counter(); import app; "
+        "print((time.perf_counter() - t) * 1000)"
+    )
+    sureler = []
+    for _ in range(tekrar):
+        cikti = subprocess.run(
+            [sys.executable, "-c", betik],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        )
+        sureler.append(float(cikti.stdout.strip().splitlines()[-1]))
+    return min(sureler)
+
+def uretim_sunucusu_baslat():
+    """Çok işçili üretim sunucusunu başlat
+    
+    gunicorn kuruluysa uygulama fork'tan önce yüklenir ve ısıtılır (preload),
+    böylece işçiler belleği paylaşır; değilse uvicorn'un çok işçili modu kullanılır.
+    """
+    ayarlar = URETIM_AYARLARI
+    logger.info(f"Üretim modu: {ayarlar}")
+    
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        import uvicorn
+        
+        logger.warning("gunicorn bulunamadı, uvicorn çok işçili mod kullanılıyor (preload yok)")
+        uvicorn.run(
+            "app:uygulama",
+            host=ayarlar["host"],
+            port=ayarlar["port"],
+            workers=ayarlar["isci_sayisi"],
+            limit_max_requests=ayarlar["maksimum_istek"],
+            timeout_graceful_shutdown=ayarlar["kapanis_suresi"],
+            log_level="info"
+        )
+        return
+    
+    class TezSunucusu(BaseApplication):
+        """Uygulamayı önceden yükleyen gunicorn sarmalayıcısı"""
+        
+        def load_config(self):
+            self.cfg.set("bind", f"{ayarlar['host']}:{ayarlar['port']}")
+            self.cfg.set("workers", ayarlar["isci_sayisi"])
+            self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+            self.cfg.set("preload_app", True)
+            self.cfg.set("max_requests", ayarlar["maksimum_istek"])
+            self.cfg.set("max_requests_jitter", ayarlar["maksimum_istek_sapmasi"])
+            self.cfg.set("graceful_timeout", ayarlar["kapanis_suresi"])
+            self.cfg.set("timeout", ayarlar["isci_zaman_asimi"])
+        
+        def load(self):
+            # Fork'tan önce ağır kütüphaneleri yükle - işçiler copy-on-write paylaşır
+            isinma_yap()
+            # Isınmada oluşan nesneler GC'nin dışında kalsın: işçilerdeki GC taramaları
+            # nesne başlıklarına yazıp paylaşılan sayfaları kopyalatmasın
+            import gc
+            gc.freeze()
+            return uygulama
+    
+    TezSunucusu().run()
+
+def yanit_kiyasla(metin_boyutu_mb: float = 2.0, tekrar: int = 10) -> Dict:
+    """Standart JSONResponse ile HizliJSONResponse'u (alan seçimi ve sıkıştırmayla) karşılaştır"""
+    import random
+    
+    # Tekrarsız, gerçekçi sıkışabilirlikte sentetik metin
+    rastgele = random.Random(0)
+    kelimeler = ("tez çalışma yöntem analiz veri model sonuç bulgu öğrenme dil metin özet "
+                 "araştırma deney performans sistem türkçe doğal işleme değerlendirme").split()
+    parcalar = []
+    boyut = 0
+    while boyut < metin_boyutu_mb * 1024 * 1024:
+        cumle = " ".join(rastgele.choice(kelimeler) for _ in range(rastgele.randint(6, 18))).capitalize() + ". "
+        parcalar.append(cumle)
+        boyut += len(cumle.encode("utf-8"))
+    metin = "".join(parcalar)
+    analiz = ozetleyici.belge_analizi(metin)
+    ozet = analiz.ozet(5)
+    icerik = {
+        "durum": "✅ Başarılı",
+        "orijinal_metin": metin,
+        "ozet": ozet,
+        "ozetler": [{"cumle_sayisi": k, "ozet": analiz.ozet(k)} for k in (3, 10)],
+        "anahtar_kelimeler": ["özetleme", "türkçe", "tez"],
+        "istatistikler": {"orijinal_uzunluk": len(metin), "kelime_sayisi": analiz.kelime_sayisi},
+        "basarili": True,
+    }
+    
+    senaryolar = [
+        ("standart_json", JSONResponse, None, ""),
+        ("hizli_json", HizliJSONResponse, None, ""),
+        ("hizli_json_gzip", HizliJSONResponse, None, "gzip"),
+        ("hizli_json_br", HizliJSONResponse, None, "br, gzip"),
+        ("alan_secimi", HizliJSONResponse, "-orijinal_metin", ""),
+        ("alan_secimi_gzip", HizliJSONResponse, "-orijinal_metin", "gzip"),
+    ]
+    rapor = {"metin_mb": round(len(metin.encode("utf-8")) / 1048576, 2), "orjson": ORJSON_VAR_MI,
+             "brotli": BROTLI_VAR_MI, "senaryolar": {}}
+    for ad, sinif, alanlar, kodlama in senaryolar:
+        alan_jetonu = istek_alanlari.set(alanlar)
+        kodlama_jetonu = istek_kodlamalari.set(kodlama)
+        try:
+            baslangic = time.perf_counter()
+            for _ in range(tekrar):
+                yanit = sinif(content=icerik)
+                if isinstance(yanit, HizliJSONResponse):
+                    yanit.sikistirmayi_tamamla()
+            sure = (time.perf_counter() - baslangic) * 1000 / tekrar
+        finally:
+            istek_alanlari.reset(alan_jetonu)
+            istek_kodlamalari.reset(kodlama_jetonu)
+        rapor["senaryolar"][ad] = {
+            "bayt": len(yanit.body),
+            "sure_ms": round(sure, 2),
+            "kodlama": yanit.headers.get("content-encoding", "yok"),
+        }
+    
+    temel = rapor["senaryolar"]["standart_json"]
+    for olcum in rapor["senaryolar"].values():
+        olcum["bayt_tasarrufu_yuzde"] = round(100 - olcum["bayt"] / temel["bayt"] * 100, 1)
+        olcum["hizlanma"] = round(temel["sure_ms"] / olcum["sure_ms"], 2) if olcum["sure_ms"] else None
+    return rapor
+
+def _bellek_ozeti() -> Dict:
+    """Sürecin RSS, PSS (paylaşılan sayfalar paylaşan sayısına bölünür) ve USS değerleri (MB)"""
+    degerler = {}
+    with open("/proc/self/smaps_rollup") as dosya:
+        for satir in dosya:
+            parcalar = satir.split()
+            if len(parcalar) == 3 and parcalar[2] == "kB":
+                degerler[parcalar[0].rstrip(":")] = int(parcalar[1])
+    uss = degerler.get("Private_Clean", 0) + degerler.get("Private_Dirty", 0)
+    return {
+        "rss_mb": round(degerler.get("Rss", 0) / 1024, 1),
+        "pss_mb": round(degerler.get("Pss", 0) / 1024, 1),
+        "uss_mb": round(uss / 1024, 1),
+    }
+
+def _bellek_isci_olc(isci_sayisi: int) -> Dict:
+    """Bu süreçten `isci_sayisi` işçi çatalla, her birinde iş yükünü çalıştırıp belleği ölç
+    
+    TEZ_PAYLASIMLI=1 ise ısınma ve gc.freeze() çatallamadan önce yapılır (gunicorn
+    --preload gibi), değilse her işçi kaynaklarını kendisi yükler. Ölçüm tüm işçiler
+    hayattayken alınır; PSS ancak o zaman paylaşımı doğru yansıtır.
+    """
+    import gc
+    import random
+    
+    rastgele = random.Random(0)
+    kelimeler = ("tez çalışma yöntem analiz veri model sonuç bulgu öğrenme dil metin özet "
+                 "araştırma deney performans sistem türkçe doğal işleme değerlendirme").split()
+    metin = " ".join(
+        " ".join(rastgele.choice(kelimeler) for _ in range(rastgele.randint(6, 18))).capitalize() + "."
+        for _ in range(400)
+    )
+    
+    if PAYLASIMLI_KAYNAKLAR:
+        isinma_yap()
+        gc.freeze()
+    ebeveyn = _bellek_ozeti()
+    
+    hazir_okuma, hazir_yazma = os.pipe()
+    devam_okuma, devam_yazma = os.pipe()
+    sonuc_okuma, sonuc_yazma = os.pipe()
+    cocuklar = []
+    for _ in range(isci_sayisi):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(hazir_okuma)
+                os.close(devam_yazma)
+                os.close(sonuc_okuma)
+                if not PAYLASIMLI_KAYNAKLAR:
+                    isinma_yap()
+                for _ in range(3):
+                    ozetleyici.anahtar_kelime_cikar(metin, "yake")
+                    ozetleyici.anahtar_kelime_cikar(metin, "rake")
+                    if benzerlik_dizini.etkin:
+                        benzerlik_dizini._vektor(benzerlik_dizini._terimler(metin))
+                os.write(hazir_yazma, b".")
+                os.read(devam_okuma, 1)  # ebeveyn tüm işçiler hazır olunca boru hattını kapatır
+                os.write(sonuc_yazma, (json.dumps(_bellek_ozeti()) + "\n").encode())
+            finally:
+                os._exit(0)
+        cocuklar.append(pid)
+    
+    os.close(hazir_yazma)
+    os.close(devam_okuma)
+    os.close(sonuc_yazma)
+    for _ in range(isci_sayisi):
+        os.read(hazir_okuma, 1)
+    os.close(devam_yazma)
+    with os.fdopen(sonuc_okuma) as dosya:
+        isciler = [json.loads(satir) for satir in dosya]
+    for pid in cocuklar:
+        os.waitpid(pid, 0)
+    os.close(hazir_okuma)
+    
+    return {
+        "ebeveyn": ebeveyn,
+        "isciler": isciler,
+        "isci_toplam_rss_mb": round(sum(i["rss_mb"] for i in isciler), 1),
+        "isci_toplam_pss_mb": round(sum(i["pss_mb"] for i in isciler), 1),
+        "isci_ortalama_uss_mb": round(sum(i["uss_mb"] for i in isciler) / max(1, len(isciler)), 1),
+    }
+
+def bellek_kiyasla(isci_sayisi: int = 4) -> Dict:
+    """İşçi başına ayrı kaynak yükleme ile paylaşılan (önyüklemeli) kaynakları karşılaştır
+    
+    Her kip temiz bir alt süreçte ölçülür; geçici dizinler kullanıldığından
+    sonuclar/ altındaki benzerlik dizinine dokunulmaz.
+    """
+    import shutil
+    import subprocess
+    import tempfile
+    
+    rapor = {"isci_sayisi": isci_sayisi, "kipler": {}}
+    for kip, paylasimli in (("ayri", "0"), ("paylasimli", "1")):
+        gecici = tempfile.mkdtemp(prefix="tez-bellek-")
+        try:
+            ortam = dict(
+                os.environ, TEZ_PAYLASIMLI=paylasimli, TEZ_ISINMA="0",
+                TEZ_PAYLASIMLI_DIZIN=os.path.join(gecici, "paylasimli"),
+                TEZ_BENZERLIK_DIZINI=os.path.join(gecici, "benzerlik"),
+            )
+            cikti = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--bellek-olc", str(isci_sayisi)],
+                env=ortam, capture_output=True, text=True, check=True
+            ).stdout
+            rapor["kipler"][kip] = json.loads(cikti.strip().splitlines()[-1])
+        finally:
+            shutil.rmtree(gecici, ignore_errors=True)
+    
+    ayri = rapor["kipler"]["ayri"]
+    paylasimli = rapor["kipler"]["paylasimli"]
+    rapor["pss_tasarrufu_mb"] = round(ayri["isci_toplam_pss_mb"] - paylasimli["isci_toplam_pss_mb"], 1)
+    rapor["uss_tasarrufu_isci_basina_mb"] = round(ayri["isci_ortalama_uss_mb"] - paylasimli["isci_ortalama_uss_mb"], 1)
+    return rapor
+
+if __name__ == "__main__" and "--bellek-olc" in sys.argv:
+    # bellek_kiyasla'nın alt süreci: ölçümü tek satır JSON olarak yazar
+    print(json.dumps(_bellek_isci_olc(int(sys.argv[sys.argv.index("--bellek-olc") + 1]))))
+    sys.exit(0)
+
+if __name__ == "__main__" and "--bellek-kiyasla" in sys.argv:
+    # İşçi belleği kıyası: python app.py --bellek-kiyasla [isci_sayisi]
+    argumanlar = sys.argv[sys.argv.index("--bellek-kiyasla") + 1:]
+    print(json.dumps(bellek_kiyasla(int(argumanlar[0]) if argumanlar else 4), ensure_ascii=False, indent=2))
+    sys.exit(0)
+
+if __name__ == "__main__" and "--yanit-kiyasla" in sys.argv:
+    # Yanıt kodlama kıyası: python app.py --yanit-kiyasla [metin_mb]
+    argumanlar = sys.argv[sys.argv.index("--yanit-kiyasla") + 1:]
+    print(json.dumps(yanit_kiyasla(float(argumanlar[0]) if argumanlar else 2.0), ensure_ascii=False, indent=2))
+    sys.exit(0)
+
+if __name__ == "__main__" and "--uretim" in sys.argv:
+    uretim_sunucusu_baslat()
+    sys.exit(0)
+
+if __name__ == "__main__" and "--pdf-kalibre" in sys.argv:
+    # Örnek tezlerle arka uç kalibrasyonu: python app.py --pdf-kalibre a.pdf b.pdf [--esik 0.6]
+    argumanlar = sys.argv[sys.argv.index("--pdf-kalibre") + 1:]
+    esik = 0.6
+    if "--esik" in argumanlar:
+        esik = float(argumanlar[argumanlar.index("--esik") + 1])
+        argumanlar = argumanlar[:argumanlar.index("--esik")]
+    if not argumanlar:
+        sys.exit("Kullanım: python app.py --pdf-kalibre ornek1.pdf [ornek2.pdf ...] [--esik 0.6]")
+    print(json.dumps(pdf_arka_uclarini_kalibre_et(argumanlar, esik), ensure_ascii=False, indent=2))
+    sys.exit(0)
+
+if __name__ == "__main__" and "--benzerlik-yeniden-olustur" in sys.argv:
+    # IDF kaydıktan sonra (dizin büyüdükçe) tüm vektörleri güncel ağırlıklarla yeniden yaz
+    print(f"🔁 {benzerlik_dizini.yeniden_olustur()} vektör yeniden hesaplandı")
+    print(json.dumps(benzerlik_dizini.durum(), ensure_ascii=False, indent=2))
+    sys.exit(0)
+
+if __name__ == "__main__" and "--ithalat-kontrol" in sys.argv:
+    # İçe aktarma süresi bütçe kontrolü (CI'da kullanılır); bütçe aşılırsa 1 ile çık
+    sure = ithalat_suresi_olc()
+    print(f"⏱️  İçe aktarma süresi: {sure:.0f} ms (bütçe: {ITHALAT_BUTCESI_MS} ms)")
+    sys.exit(0 if sure <= ITHALAT_BUTCESI_MS else 1)
+
 if __name__ == "__main__":
+    import uvicorn
+    
     print("🎓 Türkçe Tez Özetleyici API Başlatılıyor...")
     print("📖 Özellikler:")
     print(f"   - AI Modeller: {'❌ (hafif mod)' if not TRANSFORMERS_VAR_MI else '✅'}")
@@ -1039,6 +4074,8 @@ if __name__ == "__main__":
     print("   - GET  /              : Ana sayfa")
     print("   - POST /pdf-yukle/    : PDF yükle ve Türkçe özetle")
     print("   - POST /metin-ozetle/ : Direkt metin Türkçe özetleme")
+    print("   - POST /isinma/       : Ağır bağımlılıkları önceden yükle")
+    print("   - POST /benzer-tezler/: Kayıtlı tezler arasında benzerlik araması")
     print("   - GET  /docs          : API dokümantasyonu")
     print("\n🔍 YÖK Tez Endpoint'leri:")
     print("   - GET  /yok-tez-ara/      : YÖK Tez'de basit arama")
@@ -1052,10 +4089,13 @@ if __name__ == "__main__":
     print("   📝 Metin Özetleme: POST /metin-ozetle/ {'metin': 'Uzun metniniz...'}")
     print("\n🚀 Server başlatılıyor...")
     
+    print("   (Üretim için: python app.py --uretim)")
+    
+    # Geliştirme modu - kod değişikliğinde yeniden yükler
     uvicorn.run(
-        "untitled_script:uygulama", 
-        host="0.0.0.0", 
-        port=8000, 
+        "app:uygulama", 
+        host=URETIM_AYARLARI["host"], 
+        port=URETIM_AYARLARI["port"], 
         reload=True,
         log_level="info"
     )
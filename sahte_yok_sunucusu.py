@@ -0,0 +1,227 @@
+"""
+Sahte YÖK Tez Merkezi sunucusu (çevrimdışı yük testi için)
+
+Kayıtlı arama/detay fixture sayfalarını (yok_fixtures/) gerçek sitenin URL
+yapısıyla sunar; gecikme, hata oranı ve hız sınırı (429) ayarlanabilir.
+API'yi bu sunucuya yönlendirmek için:
+
+    python sahte_yok_sunucusu.py --port 8765 --gecikme-ms 150 --hata-orani 0.02
+    TEZ_YOK_TEMEL_URL=http://127.0.0.1:8765/UlusalTezMerkezi/ python app.py --uretim
+    python yuk_testi.py --api http://127.0.0.1:8000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlparse
+
+FIXTURE_DIZINI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "yok_fixtures")
+
+KONULAR = [
+    "yapay zeka", "makine öğrenmesi", "doğal dil işleme", "görüntü işleme", "veri madenciliği",
+    "yenilenebilir enerji", "deprem mühendisliği", "eğitim teknolojileri", "halk sağlığı",
+    "Osmanlı tarihi", "kentsel dönüşüm", "tarım ekonomisi", "siber güvenlik", "biyomalzemeler"
+]
+UNIVERSITELER = [
+    "Orta Doğu Teknik Üniversitesi", "İstanbul Teknik Üniversitesi", "Hacettepe Üniversitesi",
+    "Boğaziçi Üniversitesi", "Ankara Üniversitesi", "Ege Üniversitesi", "Atatürk Üniversitesi",
+    "Dokuz Eylül Üniversitesi", "Gazi Üniversitesi", "Selçuk Üniversitesi"
+]
+ADLAR = ["Ayşe", "Mehmet", "Zeynep", "Ahmet", "Elif", "Mustafa", "Fatma", "Emre", "Selin", "Burak"]
+SOYADLAR = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Öztürk", "Aydın", "Arslan", "Doğan", "Koç"]
+CUMLE_KALIPLARI = [
+    "Bu çalışmada {konu} alanındaki güncel yaklaşımlar kapsamlı biçimde incelenmiştir.",
+    "Araştırmanın temel amacı {konu} problemine yönelik yeni bir yöntem önermektir.",
+    "Önerilen yöntem {universite} bünyesinde toplanan veri seti üzerinde değerlendirilmiştir.",
+    "Deneysel sonuçlar önerilen yaklaşımın mevcut yöntemlere göre daha başarılı olduğunu göstermektedir.",
+    "Çalışmada nitel ve nicel veri toplama teknikleri birlikte kullanılmıştır.",
+    "Elde edilen bulgular {konu} uygulamalarında karar vericilere yol gösterecek niteliktedir.",
+    "Literatür taraması sonucunda {konu} konusunda Türkçe kaynakların sınırlı olduğu görülmüştür.",
+    "Tezin son bölümünde sonuçlar tartışılmış ve gelecek çalışmalar için öneriler sunulmuştur.",
+    "İstatistiksel analizler anlamlı farklılıkların bulunduğunu ortaya koymuştur.",
+    "Geliştirilen modelin doğruluğu çapraz doğrulama ile test edilmiştir."
+]
+
+
+class SahteYokAyarlari:
+    """Sunucu davranışını belirleyen ayarlar (çalışırken değiştirilebilir)"""
+
+    def __init__(self, gecikme_ms: float = 150.0, sapma_ms: float = 50.0, hata_orani: float = 0.0,
+                 limit_orani: float = 0.0, saniyede_istek: float = 0.0, sonuc_sayisi: int = 20,
+                 fixture_dizini: str = FIXTURE_DIZINI):
+        self.gecikme_ms = gecikme_ms
+        self.sapma_ms = sapma_ms
+        self.hata_orani = hata_orani
+        self.limit_orani = limit_orani
+        self.saniyede_istek = saniyede_istek  # 0: kova sınırı yok
+        self.sonuc_sayisi = sonuc_sayisi
+        self.fixture_dizini = fixture_dizini
+
+
+class SahteYokSunucusu(ThreadingHTTPServer):
+    """Fixture şablonlarını, sayaçları ve hız sınırı kovasını tutan sunucu"""
+
+    daemon_threads = True
+
+    def __init__(self, adres, ayarlar: SahteYokAyarlari):
+        super().__init__(adres, SahteYokIstekIsleyici)
+        self.ayarlar = ayarlar
+        self.sablonlar = {
+            ad: Template(open(os.path.join(ayarlar.fixture_dizini, f"{ad}.html"), encoding="utf-8").read())
+            for ad in ("arama", "arama_satiri", "detay")
+        }
+        self.sayaclar = {"arama": 0, "detay": 0, "hata": 0, "hiz_siniri": 0, "bulunamadi": 0}
+        self._kilit = threading.Lock()
+        self._kova = ayarlar.saniyede_istek
+        self._kova_zamani = time.monotonic()
+
+    def say(self, anahtar: str):
+        with self._kilit:
+            self.sayaclar[anahtar] += 1
+
+    def kovadan_al(self) -> bool:
+        """Token kovası: saniyede_istek aşılırsa False (429) döner"""
+        oran = self.ayarlar.saniyede_istek
+        if oran <= 0:
+            return True
+        with self._kilit:
+            simdi = time.monotonic()
+            self._kova = min(oran, self._kova + (simdi - self._kova_zamani) * oran)
+            self._kova_zamani = simdi
+            if self._kova < 1:
+                return False
+            self._kova -= 1
+            return True
+
+
+def _tohum(*parcalar) -> random.Random:
+    """Aynı istek için her seferinde aynı içeriği üretmek üzere deterministik üreteç"""
+    ozet = hashlib.sha256("|".join(str(p) for p in parcalar).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(ozet[:8], "big"))
+
+
+def tez_kaydi(kimlik: int) -> dict:
+    """Kimliğe göre tutarlı bir tez kaydı üret (arama ve detay sayfası aynı kaydı görür)"""
+    uretec = _tohum("tez", kimlik)
+    konu = uretec.choice(KONULAR)
+    universite = uretec.choice(UNIVERSITELER)
+    cumleler = [uretec.choice(CUMLE_KALIPLARI).format(konu=konu, universite=universite)
+                for _ in range(uretec.randint(8, 16))]
+    return {
+        "kimlik": kimlik,
+        "baslik": f"{konu.capitalize()} üzerine bir inceleme: {uretec.choice(KONULAR)} örneği",
+        "yazar": f"{uretec.choice(ADLAR)} {uretec.choice(SOYADLAR)}",
+        "danisman": f"Prof. Dr. {uretec.choice(ADLAR)} {uretec.choice(SOYADLAR)}",
+        "universite": universite,
+        "yil": uretec.randint(1995, 2024),
+        "tur": uretec.choice(["Doktora", "Yüksek Lisans"]),
+        "sayfa_sayisi": uretec.randint(60, 320),
+        "ozet": " ".join(cumleler),
+        "anahtar_kelimeler": ", ".join(uretec.sample(KONULAR, 4))
+    }
+
+
+class SahteYokIstekIsleyici(BaseHTTPRequestHandler):
+    """tezSorguSonucYeni.jsp ve tezDetay.jsp isteklerini fixture'larla yanıtla"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # Yük altında konsolu doldurmasın
+        pass
+
+    def _gonder(self, durum: int, govde: str, icerik_turu: str = "text/html; charset=utf-8", basliklar=None):
+        veri = govde.encode("utf-8")
+        self.send_response(durum)
+        self.send_header("Content-Type", icerik_turu)
+        self.send_header("Content-Length", str(len(veri)))
+        for ad, deger in (basliklar or {}).items():
+            self.send_header(ad, deger)
+        self.end_headers()
+        self.wfile.write(veri)
+
+    def do_GET(self):
+        adres = urlparse(self.path)
+        parametreler = {k: v[0] for k, v in parse_qs(adres.query).items()}
+
+        if adres.path.endswith("/__istatistik"):
+            with self.server._kilit:
+                sayaclar = dict(self.server.sayaclar)
+            return self._gonder(200, json.dumps(sayaclar, ensure_ascii=False), "application/json")
+
+        ayarlar = self.server.ayarlar
+        gecikme = max(0.0, random.gauss(ayarlar.gecikme_ms, ayarlar.sapma_ms)) if ayarlar.sapma_ms else ayarlar.gecikme_ms
+        time.sleep(gecikme / 1000)
+
+        if not self.server.kovadan_al() or random.random() < ayarlar.limit_orani:
+            self.server.say("hiz_siniri")
+            return self._gonder(429, "<html><body>Çok fazla istek</body></html>", basliklar={"Retry-After": "1"})
+        if random.random() < ayarlar.hata_orani:
+            self.server.say("hata")
+            return self._gonder(503, "<html><body>Servis geçici olarak kullanılamıyor</body></html>")
+
+        if adres.path.endswith("/tezSorguSonucYeni.jsp"):
+            self.server.say("arama")
+            return self._gonder(200, self._arama_sayfasi(parametreler))
+        if adres.path.endswith("/tezDetay.jsp") and parametreler.get("id", "").isdigit():
+            self.server.say("detay")
+            kayit = tez_kaydi(int(parametreler["id"]))
+            return self._gonder(200, self.server.sablonlar["detay"].safe_substitute(kayit))
+
+        self.server.say("bulunamadi")
+        self._gonder(404, "<html><body>Sayfa bulunamadı</body></html>")
+
+    def _arama_sayfasi(self, parametreler: dict) -> str:
+        """Arama terimine ve sayfaya göre deterministik sonuç listesi üret"""
+        arama = " ".join(parametreler.get(k, "") for k in ("arama", "baslik", "yazar", "universite")).strip()
+        try:
+            sayfa = max(1, int(parametreler.get("sayfa", 1)))
+        except ValueError:
+            sayfa = 1
+        adet = self.server.ayarlar.sonuc_sayisi
+        ilk = _tohum("arama", arama).randint(1, 10 ** 6) + (sayfa - 1) * adet
+        satir_sablonu = self.server.sablonlar["arama_satiri"]
+        satirlar = [satir_sablonu.safe_substitute(tez_kaydi(ilk + i)) for i in range(adet)]
+        return self.server.sablonlar["arama"].safe_substitute(
+            arama=arama, toplam=adet * 25, sayfa=sayfa, sonuclar="\n".join(satirlar)
+        )
+
+
+def sunucu_olustur(host: str = "127.0.0.1", port: int = 8765, **ayarlar) -> SahteYokSunucusu:
+    """Sunucuyu oluştur (yuk_testi.py aynı süreçte arka planda çalıştırabilir)"""
+    return SahteYokSunucusu((host, port), SahteYokAyarlari(**ayarlar))
+
+
+if __name__ == "__main__":
+    ayristirici = argparse.ArgumentParser(description="Çevrimdışı sahte YÖK Tez Merkezi sunucusu")
+    ayristirici.add_argument("--host", default="127.0.0.1")
+    ayristirici.add_argument("--port", type=int, default=8765)
+    ayristirici.add_argument("--gecikme-ms", type=float, default=150.0, help="ortalama yanıt gecikmesi")
+    ayristirici.add_argument("--sapma-ms", type=float, default=50.0, help="gecikmenin standart sapması")
+    ayristirici.add_argument("--hata-orani", type=float, default=0.0, help="503 dönen isteklerin oranı (0-1)")
+    ayristirici.add_argument("--limit-orani", type=float, default=0.0, help="rastgele 429 dönen isteklerin oranı (0-1)")
+    ayristirici.add_argument("--saniyede-istek", type=float, default=0.0, help="token kovası hız sınırı (0: kapalı)")
+    ayristirici.add_argument("--sonuc-sayisi", type=int, default=20, help="arama sayfası başına sonuç")
+    ayristirici.add_argument("--fixture-dizini", default=FIXTURE_DIZINI)
+    argumanlar = ayristirici.parse_args()
+
+    sunucu = sunucu_olustur(
+        argumanlar.host, argumanlar.port,
+        gecikme_ms=argumanlar.gecikme_ms, sapma_ms=argumanlar.sapma_ms,
+        hata_orani=argumanlar.hata_orani, limit_orani=argumanlar.limit_orani,
+        saniyede_istek=argumanlar.saniyede_istek, sonuc_sayisi=argumanlar.sonuc_sayisi,
+        fixture_dizini=argumanlar.fixture_dizini
+    )
+    print(f"🧪 Sahte YÖK sunucusu: http://{argumanlar.host}:{argumanlar.port}/UlusalTezMerkezi/")
+    print(f"   TEZ_YOK_TEMEL_URL=http://{argumanlar.host}:{argumanlar.port}/UlusalTezMerkezi/")
+    try:
+        sunucu.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sunucu.server_close()
@@ -0,0 +1,106 @@
+"""Artımlı puanlama, her sürümde tam yeniden hesaplamayla aynı sıralamayı vermeli"""
+
+import random
+import threading
+
+import pytest
+
+from app import ArtimliBelge, LruOnbellek, MetinOzetleyici
+
+KELIMELER = ("tez çalışma yöntem analiz veri model sonuç bulgu öğrenme dil metin özet "
+             "araştırma deney performans sistem türkçe doğal işleme değerlendirme").split()
+
+
+@pytest.fixture(scope="module")
+def ozetleyici():
+    return MetinOzetleyici()
+
+
+def _cumle(uretec: random.Random) -> str:
+    return " ".join(uretec.choice(KELIMELER) for _ in range(uretec.randint(3, 14))).capitalize()
+
+
+def _duzenle(uretec: random.Random, cumleler: list) -> list:
+    cumleler = list(cumleler)
+    islem = uretec.choice(["ekle", "sil", "tasi", "degistir", "coklu"])
+    if islem in ("ekle", "coklu") or len(cumleler) < 3:
+        for _ in range(uretec.randint(1, 4)):
+            cumleler.insert(uretec.randint(0, len(cumleler)), _cumle(uretec))
+    if islem in ("sil", "coklu") and len(cumleler) > 3:
+        for _ in range(uretec.randint(1, 3)):
+            cumleler.pop(uretec.randrange(len(cumleler)))
+    if islem in ("tasi", "coklu"):
+        cumle = cumleler.pop(uretec.randrange(len(cumleler)))
+        cumleler.insert(uretec.randint(0, len(cumleler)), cumle)
+    if islem == "degistir":
+        cumleler[uretec.randrange(len(cumleler))] = _cumle(uretec)
+    return cumleler
+
+
+def _ayni_siralama(ozetleyici, belge: ArtimliBelge, metin: str):
+    artimli = belge.siralama()
+    tam = ozetleyici.siralama_hesapla(ozetleyici.tokenlestir(metin))
+    assert artimli.cumleler == tam.cumleler
+    assert list(artimli.sira) == list(tam.sira)
+    assert artimli.kelime_sayisi == tam.kelime_sayisi
+    assert artimli.temiz_uzunluk == tam.temiz_uzunluk
+    for k in (1, 3, 10):
+        assert artimli.ozet(k) == tam.ozet(k)
+    assert artimli.ozet(2, 120) == tam.ozet(2, 120)
+
+
+@pytest.mark.parametrize("tohum", range(5))
+def test_artimli_tam_hesaplamayla_ayni(ozetleyici, tohum):
+    uretec = random.Random(tohum)
+    cumleler = [_cumle(uretec) for _ in range(30)]
+    belge = ArtimliBelge(ozetleyici.metni_temizle)
+    for _ in range(40):
+        metin = ". ".join(cumleler) + "."
+        belge.guncelle(metin)
+        _ayni_siralama(ozetleyici, belge, metin)
+        cumleler = _duzenle(uretec, cumleler)
+
+
+def test_tekrarlanan_cumleler_ve_bos_surum(ozetleyici):
+    belge = ArtimliBelge(ozetleyici.metni_temizle)
+    ayni = "Türkçe doğal dil işleme yöntemleri incelenmiştir"
+    for metin in (f"{ayni}. {ayni}. Veri analizi yapılmıştır.",
+                  f"{ayni}. Veri analizi yapılmıştır. {ayni}.",
+                  "", f"{ayni}."):
+        belge.guncelle(metin)
+        _ayni_siralama(ozetleyici, belge, metin)
+
+
+def test_eszamanli_ilk_istekler_tek_durum_paylasir():
+    onbellek = LruOnbellek(8)
+    engel = threading.Barrier(8)
+    sonuclar = []
+    
+    def uret():
+        return object()
+    
+    def istek():
+        engel.wait()
+        sonuclar.append(onbellek.al_veya_olustur("belge", uret))
+    
+    is_parcaciklari = [threading.Thread(target=istek) for _ in range(8)]
+    for t in is_parcaciklari:
+        t.start()
+    for t in is_parcaciklari:
+        t.join()
+    assert len({id(deger) for deger, _ in sonuclar}) == 1
+    assert sum(yeni for _, yeni in sonuclar) == 1
+
+
+def test_durumlar_toplam_karakterle_sinirli(ozetleyici):
+    onbellek = LruOnbellek(1000, agirlik=lambda belge: 2 * belge.temiz_uzunluk + 1)
+    for kimlik in ("a", "b"):
+        belge, _ = onbellek.al_veya_olustur(kimlik, lambda: ArtimliBelge(ozetleyici.metni_temizle))
+        belge.guncelle(". ".join(_cumle(random.Random(kimlik)) for _ in range(5)) + ".")
+        onbellek.agirligi_yenile(kimlik)
+    assert onbellek.toplam_agirlik <= 1000
+    buyuk, _ = onbellek.al_veya_olustur("buyuk", lambda: ArtimliBelge(ozetleyici.metni_temizle))
+    buyuk.guncelle("Uzun bir cümle burada yer alıyor. " * 40)
+    onbellek.agirligi_yenile("buyuk")
+    assert onbellek.toplam_agirlik <= 1000
+    assert onbellek.al("a") is None
@@ -0,0 +1,60 @@
+"""BenzerlikDizini: ekleme, sorgu ve yarım kalan eklemelerden sonra hizalama"""
+
+import os
+
+import pytest
+
+from app import BenzerlikDizini, NUMPY_VAR_MI
+
+pytestmark = pytest.mark.skipif(not NUMPY_VAR_MI, reason="numpy gerekli")
+
+OZETLER = {
+    "deprem": "Deprem yükü altında betonarme yapıların sismik davranışı ve güçlendirme yöntemleri incelenmiştir.",
+    "yapay": "Derin öğrenme ve yapay sinir ağları ile Türkçe metin sınıflandırma başarımı artırılmıştır.",
+    "enerji": "Güneş enerjisi santrallerinde fotovoltaik panel verimi ve enerji depolama incelenmiştir.",
+}
+
+
+@pytest.fixture
+def dizin(tmp_path):
+    return BenzerlikDizini(str(tmp_path / "benzerlik"), ozellik_bitleri=12, boyut=64)
+
+
+def _ekle_hepsi(dizin):
+    for kimlik, metin in OZETLER.items():
+        assert dizin.ekle(kimlik, metin, baslik=kimlik)
+
+
+def test_en_benzer_kayit_kendisi(dizin):
+    _ekle_hepsi(dizin)
+    assert not dizin.ekle("deprem", OZETLER["deprem"])
+    for kimlik, metin in OZETLER.items():
+        assert dizin.benzerleri_bul(metin, k=1)[0]["kimlik"] == kimlik
+    assert all(s["kimlik"] != "yapay" for s in dizin.benzerleri_bul(kimlik="yapay", k=5))
+
+
+def test_serilestirilemeyen_bilgi_iz_birakmaz(dizin):
+    dizin.ekle("deprem", OZETLER["deprem"])
+    with pytest.raises(TypeError):
+        dizin.ekle("yapay", OZETLER["yapay"], ek=object())
+    dizin.ekle("yapay", OZETLER["yapay"])
+    dizin.ekle("enerji", OZETLER["enerji"])
+    for kimlik, metin in OZETLER.items():
+        assert dizin.benzerleri_bul(metin, k=1)[0]["kimlik"] == kimlik
+
+
+def test_yetim_vektor_ve_yarim_kayit_kesilir(dizin):
+    dizin.ekle("deprem", OZETLER["deprem"])
+    # Kayıt satırı yazılamadan çökmüş bir ekleme: fazladan vektör satırı ve sonu yarım kayıt
+    with open(dizin._vektor_dosyasi, "ab") as dosya:
+        dosya.write(b"\0" * 4 * dizin._vektor_boyutu)
+    with open(dizin._kayit_dosyasi, "ab") as dosya:
+        dosya.write(b'{"kimlik": "yar')
+    dizin.ekle("yapay", OZETLER["yapay"])
+    dizin.ekle("enerji", OZETLER["enerji"])
+    
+    yeni = BenzerlikDizini(dizin.dizin, ozellik_bitleri=12, boyut=64)
+    for kimlik, metin in OZETLER.items():
+        assert yeni.benzerleri_bul(metin, k=1)[0]["kimlik"] == kimlik
+    assert yeni.durum()["belge_sayisi"] == 3
+    assert os.path.getsize(yeni._vektor_dosyasi) == 3 * 4 * yeni._vektor_boyutu
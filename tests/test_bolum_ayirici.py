@@ -0,0 +1,85 @@
+"""TezBolumAyirici başlık tanıma ve erken durma kontrolü"""
+
+import pytest
+
+from app import TezBolumAyirici
+
+KAPAK = """T.C.
+İSTANBUL TEKNİK ÜNİVERSİTESİ
+FEN BİLİMLERİ ENSTİTÜSÜ
+VERİ ANALİZİ
+XML TABANLI SİSTEMLER İÇİN SORGU OPTİMİZASYONU
+YÜKSEK LİSANS TEZİ
+Ayşe YILMAZ
+HAZİRAN 2023"""
+
+ICINDEKILER = """İÇİNDEKİLER
+ÖZET ................................................. iv
+1. GİRİŞ .............................................. 1
+2. YÖNTEM ............................................. 7
+3. SONUÇ .............................................. 41
+KAYNAKLAR ............................................ 45"""
+
+# Sayfa numaraları ayrı satıra düşmüş içindekiler (bazı PDF'lerde nokta dizisi yok)
+ICINDEKILER_SADE = """İÇİNDEKİLER
+1. GİRİŞ
+2. YÖNTEM
+3. SONUÇ
+KAYNAKLAR
+EKLER"""
+
+OZET = """ÖZET
+Bu çalışmada XML tabanlı sistemlerde sorgu optimizasyonu incelenmiştir.
+KAYNAKLAR"""
+
+GIRIS = """1. GİRİŞ
+XML belgeleri üzerinde sorgu işleme uzun yıllardır çalışılan bir konudur."""
+
+KAYNAKCA = """KAYNAKLAR
+Abiteboul, S. (1997). Querying semi-structured data."""
+
+
+@pytest.fixture
+def ayirici():
+    return TezBolumAyirici()
+
+
+@pytest.mark.parametrize("satir", [
+    "İSTANBUL TEKNİK ÜNİVERSİTESİ",
+    "VERİ ANALİZİ",
+    "XML TABANLI SİSTEMLER",
+    "IVIR ZIVIR",
+])
+def test_romen_harfiyle_baslayan_satir_baslik_degil(ayirici, satir):
+    assert ayirici.baslik_turu(satir) is None
+
+
+@pytest.mark.parametrize("satir, tur", [
+    ("I. GİRİŞ", "giris"),
+    ("IV BULGULAR", "govde"),
+    ("II) YÖNTEM", "govde"),
+    ("2.1 VERİ TOPLAMA", "govde"),
+    ("BÖLÜM 3", "govde"),
+    ("KAYNAKLAR", "kaynakca"),
+])
+def test_numarali_basliklar(ayirici, satir, tur):
+    assert ayirici.baslik_turu(satir) == tur
+
+
+def test_icindekiler_satiri_baslik_degil(ayirici):
+    assert ayirici.baslik_turu("BÖLÜM 1 ......................... 5") is None
+    assert ayirici.baslik_turu("1. GİRİŞ ......................... 1") is None
+
+
+@pytest.mark.parametrize("icindekiler", [ICINDEKILER, ICINDEKILER_SADE])
+def test_kapak_ve_icindekiler_okumayi_durdurmaz(ayirici, icindekiler):
+    kontrol = ayirici.durdurma_kontrolu(["ozet", "giris", "govde", "sonuc"])
+    assert not kontrol(KAPAK)
+    assert not kontrol(icindekiler)
+    assert not kontrol(OZET)
+    assert not kontrol(GIRIS)
+    assert kontrol(KAYNAKCA)
+
+
+def test_kaynakca_secildiyse_durdurma_yok(ayirici):
+    assert ayirici.durdurma_kontrolu(["govde", "kaynakca"]) is None
@@ -0,0 +1,121 @@
+"""IsZamanlayici: istemciler arası adalet, öncelik, 429 ve iptal"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+import app
+from app import IsZamanlayici
+
+
+async def _is(zamanlayici, sira, ad, istemci, sinif="normal", maliyet=1.0, engel=None):
+    async with zamanlayici.sira(istemci, sinif, maliyet):
+        sira.append(ad)
+        if engel is not None:
+            await engel.wait()
+        await asyncio.sleep(0)
+
+
+async def _calistir(zamanlayici, isler):
+    """İlk iş yeri tutarken diğerlerini kuyruğa al, sonra hepsini bitir → çalışma sırası"""
+    sira = []
+    engel = asyncio.Event()
+    gorevler = [asyncio.create_task(_is(zamanlayici, sira, "tutucu", "tutucu", engel=engel))]
+    await asyncio.sleep(0)
+    for ad, istemci, sinif in isler:
+        gorevler.append(asyncio.create_task(_is(zamanlayici, sira, ad, istemci, sinif)))
+        await asyncio.sleep(0)
+    engel.set()
+    await asyncio.gather(*gorevler)
+    return sira[1:]
+
+
+def test_buyuk_istemci_digerlerini_tikamaz():
+    zamanlayici = IsZamanlayici(eszamanli=1)
+    isler = [(f"a{i}", "a", "normal") for i in range(4)] + [("b0", "b", "normal"), ("c0", "c", "normal")]
+    sira = asyncio.run(_calistir(zamanlayici, isler))
+    assert sira.index("b0") <= 2 and sira.index("c0") <= 2
+    assert [ad for ad in sira if ad.startswith("a")] == ["a0", "a1", "a2", "a3"]
+
+
+def test_etkilesimli_toplu_isten_once():
+    zamanlayici = IsZamanlayici(eszamanli=1)
+    isler = [("t0", "a", "toplu"), ("t1", "b", "toplu"), ("e0", "c", "etkilesimli"), ("n0", "d", "normal")]
+    assert asyncio.run(_calistir(zamanlayici, isler)) == ["e0", "n0", "t0", "t1"]
+
+
+def test_istemci_siniri_429_ve_retry_after():
+    async def senaryo():
+        zamanlayici = IsZamanlayici(eszamanli=1, istemci_siniri=10)
+        engel = asyncio.Event()
+        ilk = asyncio.create_task(_is(zamanlayici, [], "ilk", "a", maliyet=8, engel=engel))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as hata:
+            async with zamanlayici.sira("a", "normal", 5):
+                pass
+        # Başka istemci etkilenmez
+        diger = asyncio.create_task(_is(zamanlayici, [], "diger", "b", maliyet=5))
+        engel.set()
+        await asyncio.gather(ilk, diger)
+        return hata.value, zamanlayici.istatistik()
+    
+    hata, istatistik = asyncio.run(senaryo())
+    assert hata.status_code == 429
+    assert 1 <= int(hata.headers["Retry-After"]) <= 300
+    assert istatistik["siniflar"]["normal"]["reddedilen"] == 1
+    assert istatistik["siniflar"]["normal"]["tamamlanan"] == 2
+
+
+def test_iptal_edilen_bekleyen_is_kuyruktan_cikar():
+    async def senaryo():
+        zamanlayici = IsZamanlayici(eszamanli=1)
+        sira = []
+        engel = asyncio.Event()
+        tutucu = asyncio.create_task(_is(zamanlayici, sira, "tutucu", "a", engel=engel))
+        await asyncio.sleep(0)
+        bekleyen = asyncio.create_task(_is(zamanlayici, sira, "iptal", "b"))
+        sonraki = asyncio.create_task(_is(zamanlayici, sira, "sonraki", "c"))
+        await asyncio.sleep(0)
+        bekleyen.cancel()
+        await asyncio.sleep(0)
+        engel.set()
+        await asyncio.gather(tutucu, sonraki)
+        return sira, zamanlayici.istatistik()
+    
+    sira, istatistik = asyncio.run(senaryo())
+    assert sira == ["tutucu", "sonraki"]
+    assert istatistik["calisan"] == 0
+    assert istatistik["kuyruk_maliyeti"] == 0
+    assert istatistik["siniflar"]["normal"]["iptal"] == 1
+    assert istatistik["en_yuklu_istemciler"] == []
+
+
+def test_iptalde_yer_is_parcacigi_bitene_kadar_tutulur(monkeypatch):
+    zamanlayici = IsZamanlayici(eszamanli=1)
+    monkeypatch.setattr(app, "is_zamanlayici", zamanlayici)
+    baslasin, bitsin = threading.Event(), threading.Event()
+
+    def agir_is():
+        baslasin.set()
+        bitsin.wait(5)
+        return "bitti"
+
+    class _Istek:
+        headers = {}
+        client = None
+
+    async def senaryo():
+        gorev = asyncio.create_task(app._zamanla(_Istek(), "normal", 1.0, agir_is))
+        while not baslasin.is_set():
+            await asyncio.sleep(0.01)
+        gorev.cancel()
+        await asyncio.sleep(0.05)
+        calisan_iptalden_sonra = zamanlayici.istatistik()["calisan"]
+        bitsin.set()
+        with pytest.raises(asyncio.CancelledError):
+            await gorev
+        return calisan_iptalden_sonra, zamanlayici.istatistik()["calisan"]
+
+    assert asyncio.run(senaryo()) == (1, 0)
@@ -0,0 +1,11 @@
+"""İçe aktarma süresi bütçesi: ağır bağımlılıklar modül yüklenirken içe aktarılmamalı"""
+
+import app
+
+
+def test_ithalat_suresi_butce_icinde():
+    sure = app.ithalat_suresi_olc()
+    assert sure <= app.ITHALAT_BUTCESI_MS, (
+        f"app içe aktarması {sure:.0f} ms sürdü (bütçe {app.ITHALAT_BUTCESI_MS} ms); "
+        "yeni bir ağır içe aktarma _modul_yukle ile tembel yapılmalı"
+    )
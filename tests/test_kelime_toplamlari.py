@@ -0,0 +1,28 @@
+"""Anahtar kelime toplamları: normalleştirme ve artımlı sayım"""
+
+import pytest
+
+from app import KelimeToplamlari, _kelime_normalize
+
+
+@pytest.mark.parametrize("kelime, beklenen", [
+    ("INTERNET", "internet"),
+    ("Internet of Things", "internet of things"),
+    ("AI", "ai"),
+    ("XML", "xml"),
+    ("IŞIK", "ışık"),
+    ("Işık  Kirliliği", "ışık kirliliği"),
+    ("İSTANBUL", "istanbul"),
+    ("İklim değişikliği", "iklim değişikliği"),
+])
+def test_kelime_normalize(kelime, beklenen):
+    assert _kelime_normalize(kelime) == beklenen
+
+
+def test_buyuk_kucuk_yazimlar_ayni_kelimede_toplanir(tmp_path):
+    toplamlar = KelimeToplamlari(str(tmp_path / "toplamlar.ndjson"))
+    toplamlar.ekle("t1", ["AI", "Internet"], yil=2020, tur="YL")
+    toplamlar.ekle("t2", ["ai", "internet"], yil=2021, tur="DR")
+    toplamlar.ekle("t2", ["ai"], yil=2021, tur="DR")  # aynı tez ikinci kez sayılmaz
+    sonuc = {k["kelime"]: k["sayi"] for k in toplamlar.sorgula(10)["sonuclar"]}
+    assert sonuc == {"ai": 2, "internet": 2}
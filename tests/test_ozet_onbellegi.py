@@ -0,0 +1,46 @@
+"""OzetOnbellegi: işçiler arası disk katmanı ve belge_hash doğrulaması"""
+
+import gzip
+import hashlib
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app
+from app import OzetOnbellegi
+
+METIN = ("Bu tez çalışmasında derin öğrenme yöntemleri kullanılmıştır. Türkçe metinler "
+         "sınıflandırılmıştır. Sonuçlar umut vericidir. Model başarımı yüzde doksan olmuştur.")
+
+
+@pytest.fixture
+def analiz():
+    belge_hash = hashlib.sha256(METIN.encode()).hexdigest()
+    return app.ozetleyici.siralama_hesapla(app.ozetleyici.tokenlestir(METIN), belge_hash)
+
+
+def test_disk_katmani_islerce_paylasilir(tmp_path, analiz):
+    yazan = OzetOnbellegi(10_000, str(tmp_path))
+    okuyan = OzetOnbellegi(10_000, str(tmp_path))
+    yazan.koy(analiz.belge_hash, analiz)
+    assert okuyan.al(analiz.belge_hash).ozet(2) == analiz.ozet(2)
+
+
+def test_gecersiz_hash_dizin_disina_cikamaz(tmp_path, analiz):
+    dizin = tmp_path / "onbellek"
+    yabanci = tmp_path / "yabanci.json.gz"
+    with gzip.open(yabanci, "wt", encoding="utf-8") as dosya:
+        json.dump(analiz.sozluk(), dosya)
+    zaman = os.stat(yabanci).st_mtime_ns
+    onbellek = OzetOnbellegi(10_000, str(dizin))
+    for belge_hash in ("../yabanci", str(tmp_path / "yabanci"), analiz.belge_hash.upper()):
+        assert onbellek.al(belge_hash) is None
+    assert os.stat(yabanci).st_mtime_ns == zaman
+
+
+@pytest.mark.parametrize("belge_hash", ["../x", "/etc/passwd", "abc", "G" * 64])
+def test_ozet_uzunluk_gecersiz_hash_400(belge_hash):
+    yanit = TestClient(app.uygulama).get("/ozet-uzunluk/", params={"belge_hash": belge_hash})
+    assert yanit.status_code == 400
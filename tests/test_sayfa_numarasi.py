@@ -0,0 +1,31 @@
+"""Sayfa kenarı temizliğinde sayfa numarası tanıma"""
+
+import pytest
+
+import app
+from app import _sayfa_numarasi_mi
+
+
+@pytest.mark.parametrize("satir", [
+    "12", "- 12 -", "3/40", "sayfa 2021", "1850", "sayfa 12", "Page 7", "iv", "xii", "(vii)", "Sayfa IV", "page xlii", "s. ix",
+])
+def test_sayfa_numarasi(satir):
+    assert _sayfa_numarasi_mi(satir)
+
+
+@pytest.mark.parametrize("satir", [
+    "dil", "mild", "civil", "mil", "lid", "CIVIL", "IV", "iiii", "xx ve",
+])
+def test_romen_harfli_kelime_sayfa_numarasi_degil(satir):
+    assert not _sayfa_numarasi_mi(satir)
+
+
+@pytest.mark.parametrize("satir", ["2021", "1998", "- 2021 -", "(2005)"])
+def test_yil_sayfa_numarasi_degil(satir):
+    assert not _sayfa_numarasi_mi(satir)
+
+
+def test_durma_kelimelerinden_bagimsiz(monkeypatch):
+    monkeypatch.setattr(app, "turkce_durma_kelimeleri", lambda: frozenset({"iv", "xii"}))
+    assert _sayfa_numarasi_mi("iv") and _sayfa_numarasi_mi("xii")
+    assert not _sayfa_numarasi_mi("li")
@@ -0,0 +1,59 @@
+"""HizliJSONResponse: Accept-Encoding q değerleri ve büyük gövdelerin ertelenmiş sıkıştırılması"""
+
+import asyncio
+import gzip
+
+import pytest
+
+import app
+from app import HizliJSONResponse, _kodlama_sec
+
+
+@pytest.mark.parametrize("kabul, beklenen", [
+    ("gzip", "gzip"),
+    ("gzip;q=0", None),
+    ("gzip; q=0.0, deflate", None),
+    ("identity", None),
+    ("*", "gzip"),
+    ("*, gzip;q=0", None),
+    ("", None),
+])
+def test_q_degerleri_dikkate_alinir(kabul, beklenen):
+    if app.BROTLI_VAR_MI and beklenen == "gzip" and "*" in kabul:
+        beklenen = "br"
+    assert _kodlama_sec(kabul) == beklenen
+
+
+def test_reddedilen_br_secilmez():
+    assert _kodlama_sec("br;q=0, gzip") == "gzip"
+
+
+def _yanit(icerik, kabul):
+    jeton = app.istek_kodlamalari.set(kabul)
+    try:
+        return HizliJSONResponse(content=icerik)
+    finally:
+        app.istek_kodlamalari.reset(jeton)
+
+
+def test_kucuk_govde_render_sirasinda_sikistirilir():
+    yanit = _yanit({"metin": "a" * 4096}, "gzip")
+    assert yanit.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(yanit.body).startswith(b'{"metin"')
+
+
+def test_buyuk_govde_gonderimde_sikistirilir(monkeypatch):
+    monkeypatch.setattr(app, "SIKISTIRMA_HAVUZ_ESIGI", 8192)
+    yanit = _yanit({"metin": "a" * 16384}, "gzip")
+    assert "content-encoding" not in yanit.headers  # render olay döngüsünde sıkıştırmadı
+    mesajlar = []
+
+    async def gonder(mesaj):
+        mesajlar.append(mesaj)
+
+    asyncio.run(yanit({"type": "http"}, None, gonder))
+    basliklar = dict(mesajlar[0]["headers"])
+    govde = mesajlar[1]["body"]
+    assert basliklar[b"content-encoding"] == b"gzip"
+    assert int(basliklar[b"content-length"]) == len(govde)
+    assert gzip.decompress(govde).startswith(b'{"metin"')
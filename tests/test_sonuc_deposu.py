@@ -0,0 +1,38 @@
+"""SonucDeposu: filtreli akış ve arama"""
+
+import pytest
+
+from app import SonucDeposu
+
+
+@pytest.fixture
+def depo(tmp_path):
+    depo = SonucDeposu(str(tmp_path / "analizler.ndjson"))
+    depo.ekle("pdf", "Deprem yükü altında yapı davranışı.", ["deprem", "betonarme"], {},
+              parti="p1", dosya_adi="Tez_2021.pdf")
+    depo.ekle("metin", "Türkçe metin sınıflandırma.", ["Doğal Dil İşleme"], {}, parti="p2")
+    depo.ekle("metin", 'Alıntı: "yapay zeka" ve C:\\yol', ["yapay zeka"], {})
+    return depo
+
+
+def _idler(depo, **filtre):
+    return [k["ozet"][:6] for k in depo.kayitlari_oku(**filtre)]
+
+
+@pytest.mark.parametrize("arama", ["kaynak", "ozet", "id", "parti", "istatistikler", "pdf\""])
+def test_alan_adlari_eslesmez(depo, arama):
+    assert _idler(depo, arama=arama) == []
+
+
+def test_alan_degerlerinde_arar(depo):
+    assert _idler(depo, arama="DEPREM") == ["Deprem"]
+    assert _idler(depo, arama="tez_2021") == ["Deprem"]
+    assert _idler(depo, arama="doğal dil") == ["Türkçe"]
+    assert _idler(depo, arama='"yapay zeka"') == ["Alıntı"]
+    assert _idler(depo, arama="c:\\yol") == ["Alıntı"]
+
+
+def test_filtreler_ve_limit(depo):
+    assert _idler(depo, kaynak="metin") == ["Türkçe", "Alıntı"]
+    assert _idler(depo, parti="p1") == ["Deprem"]
+    assert _idler(depo, limit=1) == ["Deprem"]
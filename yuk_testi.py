@@ -0,0 +1,221 @@
+"""
+YÖK arama uç noktaları için yük testi
+
+/yok-tez-ara/, /yok-gelismis-arama/ ve /yok-tez-ozet/ uç noktalarına eşzamanlı
+istek gönderir; uç nokta başına verim (istek/sn), durum kodları ve
+p50/p95/p99 gecikmelerini raporlar. Gerçek YÖK sitesine yük bindirmemek için
+API sahte_yok_sunucusu.py'ye yönlendirilmelidir:
+
+    python yuk_testi.py --sahte-yok --api-baslat --sure 30 --eszamanli 16
+
+--sahte-yok sahte sunucuyu bu süreçte çalıştırır, --api-baslat API'yi
+TEZ_YOK_TEMEL_URL ile bu sunucuya bağlı olarak alt süreçte (--uretim) başlatır.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ARAMA_TERIMLERI = [
+    "yapay zeka", "makine öğrenmesi", "deprem", "enerji", "eğitim", "sağlık",
+    "tarih", "ekonomi", "güvenlik", "malzeme", "kentsel dönüşüm", "veri madenciliği"
+]
+
+# Senaryo adı -> (yöntem, yol, requests argümanları) üreten fonksiyon
+SENARYOLAR = {
+    "ara": lambda u: ("GET", "/yok-tez-ara/", {"params": {
+        "anahtar_kelime": u.choice(ARAMA_TERIMLERI), "sayfa": u.randint(1, 5)}}),
+    "gelismis": lambda u: ("POST", "/yok-gelismis-arama/", {"json": {
+        "baslik": u.choice(ARAMA_TERIMLERI), "yil_baslangic": 2010, "yil_bitis": 2024,
+        "tur": u.choice(["YL", "DR"])}}),
+    "ozet": lambda u: ("POST", "/yok-tez-ozet/", {"json": {
+        "anahtar_kelime": u.choice(ARAMA_TERIMLERI), "tez_indeksi": u.randint(0, 4)}}),
+}
+
+
+def yuzdelik(sirali: list, oran: float) -> float:
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik değer"""
+    if not sirali:
+        return 0.0
+    return sirali[min(len(sirali) - 1, max(0, int(round(oran * len(sirali) + 0.5)) - 1))]
+
+
+class YukTesti:
+    """Sabit eşzamanlılıkla (kapalı döngü) istek gönderip sonuçları toplar"""
+
+    def __init__(self, api: str, senaryolar: dict, eszamanli: int = 16, zaman_asimi: float = 60.0):
+        self.api = api.rstrip("/")
+        self.senaryolar = senaryolar  # ad -> ağırlık
+        self.eszamanli = eszamanli
+        self.zaman_asimi = zaman_asimi
+        self.olcumler = {ad: [] for ad in senaryolar}  # ad -> [(durum, süre_ms)]
+        self._kilit = threading.Lock()
+        self._yerel = threading.local()
+
+    def _oturum(self):
+        if not hasattr(self._yerel, "oturum"):
+            self._yerel.oturum = requests.Session()
+        return self._yerel.oturum
+
+    def _isci(self, tohum: int, bitis: float, kalan: list):
+        uretec = random.Random(tohum)
+        adlar = list(self.senaryolar)
+        agirliklar = [self.senaryolar[ad] for ad in adlar]
+        while time.monotonic() < bitis:
+            with self._kilit:
+                if kalan[0] is not None:
+                    if kalan[0] <= 0:
+                        return
+                    kalan[0] -= 1
+            ad = uretec.choices(adlar, agirliklar)[0]
+            yontem, yol, argumanlar = SENARYOLAR[ad](uretec)
+            baslangic = time.perf_counter()
+            try:
+                yanit = self._oturum().request(yontem, self.api + yol, timeout=self.zaman_asimi, **argumanlar)
+                durum = yanit.status_code
+            except requests.RequestException as e:
+                durum = type(e).__name__
+            sure = (time.perf_counter() - baslangic) * 1000
+            with self._kilit:
+                self.olcumler[ad].append((durum, sure))
+
+    def calistir(self, sure: float = 30.0, istek_sayisi: int = None) -> dict:
+        """Testi çalıştır; süre dolunca ya da istek_sayisi tükenince durur"""
+        kalan = [istek_sayisi]
+        baslangic = time.monotonic()
+        bitis = baslangic + (sure if sure else float("inf"))
+        with ThreadPoolExecutor(max_workers=self.eszamanli) as havuz:
+            for i in range(self.eszamanli):
+                havuz.submit(self._isci, i, bitis, kalan)
+        return self.rapor(time.monotonic() - baslangic)
+
+    def rapor(self, gecen_sure: float) -> dict:
+        """Uç nokta başına verim, durum dağılımı ve kuyruk gecikmeleri"""
+        uc_noktalar = {}
+        tum_sureler = []
+        for ad, olcumler in self.olcumler.items():
+            sureler = sorted(s for _, s in olcumler)
+            basarili = sorted(s for d, s in olcumler if d == 200)
+            tum_sureler.extend(sureler)
+            uc_noktalar[ad] = {
+                "istek": len(olcumler),
+                "basarili": len(basarili),
+                "durumlar": dict(Counter(str(d) for d, _ in olcumler)),
+                "verim_istek_sn": round(len(olcumler) / gecen_sure, 2) if gecen_sure else 0,
+                "p50_ms": round(yuzdelik(sureler, 0.50), 1),
+                "p95_ms": round(yuzdelik(sureler, 0.95), 1),
+                "p99_ms": round(yuzdelik(sureler, 0.99), 1),
+                "maks_ms": round(sureler[-1], 1) if sureler else 0.0,
+                "basarili_p99_ms": round(yuzdelik(basarili, 0.99), 1)
+            }
+        tum_sureler.sort()
+        return {
+            "sure_sn": round(gecen_sure, 2),
+            "eszamanli": self.eszamanli,
+            "toplam_istek": len(tum_sureler),
+            "verim_istek_sn": round(len(tum_sureler) / gecen_sure, 2) if gecen_sure else 0,
+            "p50_ms": round(yuzdelik(tum_sureler, 0.50), 1),
+            "p95_ms": round(yuzdelik(tum_sureler, 0.95), 1),
+            "p99_ms": round(yuzdelik(tum_sureler, 0.99), 1),
+            "uc_noktalar": uc_noktalar
+        }
+
+
+def api_bekle(api: str, zaman_asimi: float = 60.0):
+    """API ana sayfası yanıt verene kadar bekle"""
+    bitis = time.monotonic() + zaman_asimi
+    while time.monotonic() < bitis:
+        try:
+            if requests.get(api.rstrip("/") + "/", timeout=2).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+    raise SystemExit(f"❌ API {zaman_asimi:.0f} sn içinde ayağa kalkmadı: {api}")
+
+
+def _senaryo_ayristir(metin: str) -> dict:
+    """'ara=3,gelismis=1,ozet=1' biçimindeki ağırlıkları çöz"""
+    senaryolar = {}
+    for parca in metin.split(","):
+        ad, _, agirlik = parca.strip().partition("=")
+        if ad not in SENARYOLAR:
+            raise SystemExit(f"❌ Bilinmeyen senaryo: {ad} (geçerli: {', '.join(SENARYOLAR)})")
+        senaryolar[ad] = float(agirlik or 1)
+    return senaryolar
+
+
+if __name__ == "__main__":
+    ayristirici = argparse.ArgumentParser(description="YÖK arama uç noktaları için yük testi")
+    ayristirici.add_argument("--api", default="http://127.0.0.1:8000")
+    ayristirici.add_argument("--eszamanli", type=int, default=16)
+    ayristirici.add_argument("--sure", type=float, default=30.0, help="test süresi (sn)")
+    ayristirici.add_argument("--istek", type=int, default=None, help="toplam istek sınırı")
+    ayristirici.add_argument("--senaryo", default="ara=3,gelismis=1,ozet=1", help="ad=ağırlık listesi")
+    ayristirici.add_argument("--sahte-yok", action="store_true", help="sahte YÖK sunucusunu bu süreçte başlat")
+    ayristirici.add_argument("--sahte-port", type=int, default=8765)
+    ayristirici.add_argument("--gecikme-ms", type=float, default=150.0)
+    ayristirici.add_argument("--hata-orani", type=float, default=0.0)
+    ayristirici.add_argument("--limit-orani", type=float, default=0.0)
+    ayristirici.add_argument("--saniyede-istek", type=float, default=0.0)
+    ayristirici.add_argument("--api-baslat", action="store_true", help="API'yi sahte YÖK'e bağlı alt süreçte başlat")
+    ayristirici.add_argument("--json", action="store_true", help="raporu yalnızca JSON olarak yaz")
+    argumanlar = ayristirici.parse_args()
+
+    senaryolar = _senaryo_ayristir(argumanlar.senaryo)
+    sahte_sunucu = None
+    api_sureci = None
+    yok_adresi = f"http://127.0.0.1:{argumanlar.sahte_port}/UlusalTezMerkezi/"
+
+    try:
+        if argumanlar.sahte_yok:
+            from sahte_yok_sunucusu import sunucu_olustur
+
+            sahte_sunucu = sunucu_olustur(
+                "127.0.0.1", argumanlar.sahte_port,
+                gecikme_ms=argumanlar.gecikme_ms, hata_orani=argumanlar.hata_orani,
+                limit_orani=argumanlar.limit_orani, saniyede_istek=argumanlar.saniyede_istek
+            )
+            threading.Thread(target=sahte_sunucu.serve_forever, daemon=True).start()
+
+        if argumanlar.api_baslat:
+            ortam = dict(os.environ, TEZ_YOK_TEMEL_URL=yok_adresi, TEZ_SONUC_KAYDET="0",
+                         TEZ_PORT=argumanlar.api.rstrip("/").rsplit(":", 1)[-1])
+            api_sureci = subprocess.Popen(
+                [sys.executable, "app.py", "--uretim"], env=ortam,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
+        api_bekle(argumanlar.api)
+
+        test = YukTesti(argumanlar.api, senaryolar, argumanlar.eszamanli)
+        rapor = test.calistir(argumanlar.sure, argumanlar.istek)
+        if sahte_sunucu is not None:
+            rapor["sahte_yok"] = dict(sahte_sunucu.sayaclar)
+
+        if argumanlar.json:
+            print(json.dumps(rapor, ensure_ascii=False, indent=2))
+        else:
+            print(f"\n📊 {rapor['toplam_istek']} istek, {rapor['sure_sn']} sn, "
+                  f"{rapor['eszamanli']} eşzamanlı → {rapor['verim_istek_sn']} istek/sn")
+            print(f"{'uç nokta':<10} {'istek':>6} {'istek/sn':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'maks':>8}  durumlar")
+            for ad, olcum in rapor["uc_noktalar"].items():
+                print(f"{ad:<10} {olcum['istek']:>6} {olcum['verim_istek_sn']:>9} {olcum['p50_ms']:>8} "
+                      f"{olcum['p95_ms']:>8} {olcum['p99_ms']:>8} {olcum['maks_ms']:>8}  {olcum['durumlar']}")
+            if "sahte_yok" in rapor:
+                print(f"sahte YÖK sayaçları: {rapor['sahte_yok']}")
+    finally:
+        if api_sureci is not None:
+            api_sureci.terminate()
+            api_sureci.wait(timeout=30)
+        if sahte_sunucu is not None:
+            sahte_sunucu.shutdown()
+            sahte_sunucu.server_close()